@@ -0,0 +1,51 @@
+import timeit
+from typing import Callable
+
+from partial_injector.partial_container import Container, FromContainer
+
+type NumberReturner = Callable[[], int]
+type NumberAdder = Callable[[], int]
+
+
+def __return_number() -> int:
+    return 1
+return_number: NumberReturner = __return_number
+
+
+def __add_numbers(number_returners: list[NumberReturner]) -> int:
+    return sum(number_returner() for number_returner in number_returners)
+add_numbers: NumberAdder = __add_numbers
+
+
+def build_container(size: int) -> Container:
+    container = Container()
+    for index in range(size):
+        container.register_singleton(index, key=f"value_{index}")
+        container.register_singleton(str(index), key=type(f"Key{index}", (), {}))
+    container.register_singleton(return_number, key=NumberReturner)
+    container.register_singleton(return_number, key=NumberReturner)
+    container.register_singleton(add_numbers, key=NumberAdder)
+    container.register_transient(FromContainer("value_0", lambda value: value + 1), key="derived")
+    container.build()
+    return container
+
+
+def main(size: int = 100, number: int = 20_000) -> None:
+    container = build_container(size)
+    string_keys = [f"value_{index}" for index in range(size)]
+
+    scenarios = {
+        "str key": lambda: [container.resolve(key) for key in string_keys],
+        "type alias key": lambda: container.resolve(NumberAdder),
+        "list[alias] key": lambda: container.resolve(list[NumberReturner]),
+        "transient key": lambda: container.resolve("derived"),
+        "build": lambda: build_container(size),
+    }
+    for name, scenario in scenarios.items():
+        repeats = number // size if name in ("str key", "build") else number
+        seconds = min(timeit.repeat(scenario, number=repeats, repeat=5))
+        print(f"{name:<20} {seconds / repeats * 1e6:10.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import timeit
+
+from partial_injector.partial_container import Container
+
+
+def build_container(size: int) -> Container:
+    container = Container()
+    for index in range(size):
+        container.register_singleton(index, key=f"value_{index}")
+    container.build()
+    return container
+
+
+def main(size: int = 30, number: int = 50_000) -> None:
+    container = build_container(size)
+    keys = [f"value_{index}" for index in range(size)]
+    resolve_all = container.resolver(keys)
+
+    scenarios = {
+        "resolve loop": lambda: [container.resolve(key) for key in keys],
+        "resolve_many": lambda: container.resolve_many(keys),
+        "resolver": resolve_all,
+    }
+    for name, scenario in scenarios.items():
+        seconds = min(timeit.repeat(scenario, number=number, repeat=5))
+        print(f"{name:<20} {seconds / number * 1e6:10.2f} us/call ({size} keys)")
+
+
+if __name__ == "__main__":
+    main()
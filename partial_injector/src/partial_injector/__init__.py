@@ -1,5 +1,5 @@
 __author__ = "kostiantyn.chomakov@gmail.com"
 
-from . import partial_container, error_handling
+from . import partial_container, error_handling, module_scanning, build_graph
 
-__all__ = ['partial_container', 'error_handling']
\ No newline at end of file
+__all__ = ['partial_container', 'error_handling', 'module_scanning', 'build_graph']
\ No newline at end of file
@@ -0,0 +1,167 @@
+import json
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable
+
+
+@dataclass
+class BuildGraphNode:
+    key: str
+    duration: float = 0.0
+    dependencies: list[int] = field(default_factory=list)
+
+
+class BuildGraph:
+    """
+    Dependency graph of the container registrations.
+    Node durations are the seconds spent on building the node itself, without building its dependencies.
+    """
+    def __init__(self):
+        self.nodes = dict[int, BuildGraphNode]()
+
+    def add_node(self, node_id: int, key: Any) -> BuildGraphNode:
+        node = self.nodes.get(node_id)
+        if node is None:
+            node = self.nodes[node_id] = BuildGraphNode(str(key))
+        return node
+
+    def add_dependency(self, node_id: int, dependency_id: int) -> None:
+        dependencies = self.nodes[node_id].dependencies
+        if dependency_id != node_id and dependency_id not in dependencies:
+            dependencies.append(dependency_id)
+
+    def total_duration(self) -> float:
+        return sum(node.duration for node in self.nodes.values())
+
+    def critical_path(self) -> list[int]:
+        """
+        Returns ids of the nodes on the most expensive dependency chain, starting from the innermost dependency.
+        """
+        path_durations = dict[int, float]()
+        next_nodes = dict[int, int | None]()
+
+        for node_id in self.nodes:
+            self.__measure_path(node_id, path_durations, next_nodes)
+
+        node_id = max(path_durations, key=path_durations.__getitem__, default=None)
+        path = []
+        while node_id is not None:
+            path.append(node_id)
+            node_id = next_nodes[node_id]
+        path.reverse()
+        return path
+
+    def critical_path_duration(self) -> float:
+        return sum(self.nodes[node_id].duration for node_id in self.critical_path())
+
+    def parallel_speedup(self) -> float:
+        """
+        Returns the theoretical speedup of the build, if independent nodes were built in parallel.
+        """
+        critical_path_duration = self.critical_path_duration()
+        return self.total_duration() / critical_path_duration if critical_path_duration > 0 else 1.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "nodes": [{"id": node_id,
+                       "key": node.key,
+                       "duration": node.duration,
+                       "dependencies": list(node.dependencies)}
+                      for node_id, node in self.nodes.items()],
+            "critical_path": self.critical_path(),
+            "total_duration": self.total_duration(),
+            "critical_path_duration": self.critical_path_duration(),
+            "parallel_speedup": self.parallel_speedup()
+        }
+
+    def to_json(self, indent: int | None = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_dot(self) -> str:
+        critical_path = set(self.critical_path())
+        lines = ["digraph build {"]
+        for node_id, node in self.nodes.items():
+            label = f"{node.key}\\n{node.duration * 1000:.3f} ms".replace('"', '\\"')
+            style = ', color="red"' if node_id in critical_path else ""
+            lines.append(f'    n{node_id} [label="{label}"{style}];')
+        for node_id, node in self.nodes.items():
+            for dependency_id in node.dependencies:
+                lines.append(f"    n{node_id} -> n{dependency_id};")
+        lines.append("}")
+        return "\n".join(lines)
+
+    def __measure_path(self,
+                       node_id: int,
+                       path_durations: dict[int, float],
+                       next_nodes: dict[int, int | None]) -> float:
+        if node_id in path_durations:
+            return path_durations[node_id]
+
+        path_durations[node_id] = 0.0
+        next_node_id = None
+        longest_dependency_path = 0.0
+        for dependency_id in self.nodes[node_id].dependencies:
+            if dependency_id not in self.nodes:
+                continue
+            dependency_path = self.__measure_path(dependency_id, path_durations, next_nodes)
+            if next_node_id is None or dependency_path > longest_dependency_path:
+                next_node_id, longest_dependency_path = dependency_id, dependency_path
+
+        next_nodes[node_id] = next_node_id
+        path_durations[node_id] = self.nodes[node_id].duration + longest_dependency_path
+        return path_durations[node_id]
+
+
+@dataclass
+class BuildFrame:
+    node_id: int
+    started: float
+    dependencies_duration: float = 0.0
+
+
+class BuildGraphRecorder:
+    """
+    Records the build graph during a single build of the container.
+    Keys are looked up by key_of only when a node is added, so recording costs nothing for the nodes already in the graph.
+    """
+    def __init__(self, graph: BuildGraph, key_of: Callable[[int], Any]):
+        self.graph = graph
+        self.__key_of = key_of
+        self.__stack = list[BuildFrame]()
+
+    def add_dependency(self, dependency_id: int) -> None:
+        if self.__stack:
+            self.__add_node(dependency_id)
+            self.graph.add_dependency(self.__stack[-1].node_id, dependency_id)
+
+    def start(self, node_id: int) -> None:
+        self.__add_node(node_id)
+        self.__stack.append(BuildFrame(node_id, perf_counter()))
+
+    def stop(self) -> None:
+        frame = self.__stack.pop()
+        elapsed = perf_counter() - frame.started
+        self.graph.nodes[frame.node_id].duration += elapsed - frame.dependencies_duration
+        if self.__stack:
+            self.__stack[-1].dependencies_duration += elapsed
+
+    def __add_node(self, node_id: int) -> None:
+        if node_id not in self.graph.nodes:
+            self.graph.add_node(node_id, self.__key_of(node_id))
+
+
+class NullBuildGraphRecorder:
+    """
+    Recorder used outside of build, so resolution at runtime does not record anything.
+    """
+    def add_dependency(self, dependency_id: int) -> None:
+        pass
+
+    def start(self, node_id: int) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+NULL_BUILD_GRAPH_RECORDER = NullBuildGraphRecorder()
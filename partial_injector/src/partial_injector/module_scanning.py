@@ -0,0 +1,92 @@
+import ast
+import importlib
+import importlib.util
+import pkgutil
+from collections.abc import Iterator
+from types import ModuleType
+
+INJECTABLE_DECORATOR_NAME = "injectable"
+
+
+def iter_module_names(package: ModuleType | str) -> Iterator[str]:
+    package = importlib.import_module(package) if isinstance(package, str) else package
+    yield package.__name__
+    if hasattr(package, '__path__'):
+        for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+            yield module_info.name
+
+
+def find_injectable_key_names(module_name: str) -> list[str] | None:
+    """
+    Finds names of the keys registered with the injectable decorator in the module source code without importing the module.
+    Returns None, when the registrations of the module cannot be discovered statically and the module has to be imported.
+    """
+    spec = importlib.util.find_spec(module_name)
+    get_source = getattr(spec.loader, 'get_source', None) if spec is not None else None
+    source = get_source(module_name) if get_source is not None else None
+
+    if source is None:
+        return None
+    if INJECTABLE_DECORATOR_NAME not in source:
+        return []
+
+    tree = ast.parse(source)
+    decorator_names = __get_decorator_names(tree)
+
+    key_names = []
+    decorators = set()
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            for decorator in node.decorator_list:
+                if __is_injectable_call(decorator, decorator_names):
+                    key_name = __get_key_name(decorator, node.name)
+                    if key_name is None:
+                        return None
+                    key_names.append(key_name)
+                    decorators.add(decorator)
+
+    for node in ast.walk(tree):
+        if __is_injectable_call(node, decorator_names) and node not in decorators:
+            return None
+
+    return key_names
+
+
+def __get_decorator_names(tree: ast.Module) -> set[str]:
+    decorator_names = {INJECTABLE_DECORATOR_NAME}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            decorator_names.update(alias.asname for alias in node.names
+                                   if alias.name == INJECTABLE_DECORATOR_NAME and alias.asname is not None)
+    return decorator_names
+
+
+def __is_injectable_call(node: ast.AST, decorator_names: set[str]) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    match node.func:
+        case ast.Name(id=name):
+            return name in decorator_names
+        case ast.Attribute(attr=name):
+            return name == INJECTABLE_DECORATOR_NAME
+        case _:
+            return False
+
+
+def __get_key_name(decorator: ast.Call, decorated_name: str) -> str | None:
+    key = next((keyword.value for keyword in decorator.keywords if keyword.arg == "key"), None)
+    return decorated_name if key is None else __get_expression_name(key)
+
+
+def __get_expression_name(expression: ast.expr) -> str | None:
+    match expression:
+        case ast.Constant(value=str(value)):
+            return value
+        case ast.Name(id=name):
+            return name
+        case ast.Attribute(attr=name):
+            return name
+        case ast.Subscript(value=ast.Name(id="list"), slice=item):
+            return __get_expression_name(item)
+        case _:
+            return None
@@ -1,14 +1,20 @@
+import asyncio
 import copy
 import functools
+import importlib
 import inspect
+import sys
 from dataclasses import dataclass, replace
 from enum import Enum
 from functools import partial
 from inspect import isfunction
-from types import FunctionType
-from typing import Callable, Optional, Any, TypeVar, Generic, TypeAliasType
+from types import FunctionType, ModuleType
+from collections.abc import Iterable
+from typing import Callable, Optional, Any, TypeVar, Generic, TypeAliasType, Awaitable
 
+from .build_graph import BuildGraph, BuildGraphRecorder, NULL_BUILD_GRAPH_RECORDER
 from .error_handling import PartialContainerException
+from .module_scanning import iter_module_names, find_injectable_key_names
 
 type ContainerKey = str | type | TypeAliasType | Callable
 type ContainerObject = Any | FromContainer
@@ -32,10 +38,12 @@ class Container: # TODO: Add validation and proper error handling
         def __init__(self,
                      first_registration: 'Container.Registration',
                      value: Any,
-                     execute_with_injections: Callable[[Callable, Optional[list[ContainerObject]], Optional[dict[str, ContainerObject]]], Any]):
+                     execute_with_injections: Callable[[Callable, Optional[list[ContainerObject]], Optional[dict[str, ContainerObject]]], Any],
+                     aexecute_with_injections: Callable[[Callable, Optional[list[ContainerObject]], Optional[dict[str, ContainerObject]]], Awaitable[Any]]):
             self._value = value
             self._first_registration = first_registration
             self._execute_with_injections = execute_with_injections
+            self._aexecute_with_injections = aexecute_with_injections
 
         def __raise_no_objects_built_error(self, key: ContainerKey) -> None:
             raise PartialContainerException(
@@ -79,21 +87,122 @@ class Container: # TODO: Add validation and proper error handling
         def value(self, value: Any) -> None:
             self._value = value
 
+        async def avalue(self) -> Any:
+            match self._value:
+                case _ if isinstance(self._value, Container.TransientContainer):
+                    if (self._value.registration.condition is not None and
+                        not await self._aexecute_with_injections(self._first_registration.condition,
+                                                                 self._first_registration.condition_args,
+                                                                 self._first_registration.condition_kwargs)):
+                        self.__raise_no_objects_built_error(self._first_registration.key)
+                    return await self._value.acall()
+                case _ if isinstance(self._value, list) and any(isinstance(item, Container.TransientContainer) for item in self._value):
+                    resolved_items = await asyncio.gather(*[self.__aresolve_list_item(item) for item in self._value])
+                    allowed_dependencies = [item for is_allowed, item in resolved_items if is_allowed]
+                    throw_if_condition_not_satisfied_for_all = any(not is_allowed and item.registration.throw_if_condition_not_satisfied_for_all
+                                                                   for is_allowed, item in resolved_items)
+
+                    if len(allowed_dependencies) == 0 and throw_if_condition_not_satisfied_for_all:
+                        self.__raise_no_objects_built_error(self._first_registration.key)
+
+                    return allowed_dependencies
+                case _:
+                    return self.value
+
+        async def __aresolve_list_item(self, item: Any) -> tuple[bool, Any]:
+            if not isinstance(item, Container.TransientContainer):
+                return True, item
+            if (item.registration.condition is not None and
+                not await self._aexecute_with_injections(item.registration.condition,
+                                                         item.registration.condition_args,
+                                                         item.registration.condition_kwargs)):
+                return False, item
+            return True, await item.acall()
+
+        def get_resolver(self) -> Callable[[], Any]:
+            if isinstance(self._value, (Container.TransientContainer, list)):
+                return lambda: self.value
+            value = self._value
+            return lambda: value
+
     class TransientContainer:
         def __init__(self,
                      transient_callable: Callable,
-                     registration: 'Container.Registration'):
+                     registration: 'Container.Registration',
+                     async_transient_callable: Optional[Callable[['Container.Registration'], Awaitable[Any]]] = None):
             self._transient_callable = transient_callable
+            self._async_transient_callable = async_transient_callable
             self.registration = registration
 
         def __call__(self):
             factory_result = self._transient_callable(self.registration)
             return factory_result
 
+        async def acall(self):
+            if self._async_transient_callable is None:
+                return self()
+            return await self._async_transient_callable(self.registration)
+
+    class KeyIndex:
+        """
+        Interns container keys into small integer ids, so that internal dictionaries are indexed by ints
+        instead of typing objects, which are expensive to construct, hash and compare.
+        Every interned key also gets ids for its list[key] and ListOfDependencies[key] variants.
+        """
+        def __init__(self):
+            self.__ids = dict[ContainerKey, int]()
+            self.__keys = list[ContainerKey]()
+            self.__item_ids = list[Optional[int]]()
+            self.__list_ids = list[Optional[int]]()
+            self.__multi_ids = list[Optional[int]]()
+
+        def intern(self, key: ContainerKey) -> int:
+            key_id = self.__add(key)
+            if self.__list_ids[key_id] is None:
+                list_id = self.__add(list[key])
+                multi_id = self.__add(Container.ListOfDependencies[key])
+                self.__item_ids[list_id] = key_id
+                self.__item_ids[multi_id] = key_id
+                self.__list_ids[key_id] = list_id
+                self.__multi_ids[key_id] = multi_id
+            return key_id
+
+        def find(self, key: ContainerKey) -> Optional[int]:
+            return self.__ids.get(key)
+
+        def key_of(self, key_id: int) -> ContainerKey:
+            return self.__keys[key_id]
+
+        def item_of(self, key_id: Optional[int]) -> Optional[int]:
+            return None if key_id is None else self.__item_ids[key_id]
+
+        def list_of(self, key_id: Optional[int]) -> Optional[int]:
+            return None if key_id is None else self.__list_ids[key_id]
+
+        def multi_of(self, key_id: Optional[int]) -> Optional[int]:
+            return None if key_id is None else self.__multi_ids[key_id]
+
+        def __add(self, key: ContainerKey) -> int:
+            key_id = self.__ids.get(key)
+            if key_id is None:
+                key_id = len(self.__keys)
+                self.__ids[key] = key_id
+                self.__keys.append(key)
+                self.__item_ids.append(None)
+                self.__list_ids.append(None)
+                self.__multi_ids.append(None)
+            return key_id
+
     def __init__(self):
-        self._registered = dict[ContainerKey, Container.RegistrationsDictValue]()
-        self.__built = dict[ContainerKey, Container.BuiltDictValue]()
+        self.__keys = Container.KeyIndex()
+        self._registered = dict[int, Container.RegistrationsDictValue]()
+        self.__built = dict[int, Container.BuiltDictValue]()
         self.__is_built = False
+        self.__scanned_modules = set[str]()
+        self.__lazy_modules = dict[str, list[str]]()
+        self.__lazy_key_names = dict[str, list[str]]()
+        self.__build_graph = BuildGraph()
+        self.__build_graph_recorder = NULL_BUILD_GRAPH_RECORDER
 
     def register_singleton(self,
                            instance: ContainerObject,
@@ -197,10 +306,8 @@ class Container: # TODO: Add validation and proper error handling
         if self.__is_built:
             raise PartialContainerException("Container already built")
 
-        actual_key = key if key is not None else registration_object
-
         registration = Container.Registration(registration_type,
-                                              actual_key,
+                                              key if key is not None else registration_object,
                                               registration_object,
                                               factory_args=factory_args,
                                               factory_kwargs=factory_kwargs,
@@ -210,79 +317,182 @@ class Container: # TODO: Add validation and proper error handling
                                               condition_args=condition_args,
                                               condition_kwargs=condition_kwargs,
                                               throw_if_condition_not_satisfied_for_all=throw_if_condition_not_satisfied_for_all)
-        if Container.ListOfDependencies[actual_key] in self._registered and isinstance(self._registered[Container.ListOfDependencies[actual_key]], Container.ListOfDependencies):
-            self._registered[Container.ListOfDependencies[actual_key]].append(registration)
-        elif actual_key in self._registered:
+        self.__add_registration(registration)
+        return None
+
+    def __add_registration(self, registration: 'Container.Registration') -> int:
+        key_id = self.__keys.intern(registration.key)
+        multi_id = self.__keys.multi_of(key_id)
+        if multi_id in self._registered and isinstance(self._registered[multi_id], Container.ListOfDependencies):
+            self._registered[multi_id].append(registration)
+            return multi_id
+        elif key_id in self._registered:
             container = Container.ListOfDependencies()
-            container.registrations.append(self._registered[actual_key])
+            container.registrations.append(self._registered[key_id])
             container.registrations.append(registration)
-            self._registered[Container.ListOfDependencies[actual_key]] = container
-            del self._registered[actual_key]
+            self._registered[multi_id] = container
+            del self._registered[key_id]
+            return multi_id
         else:
-            self._registered[actual_key] = registration
-        return None
+            self._registered[key_id] = registration
+            return key_id
+
+    def scan(self, package: ModuleType | str, lazy: bool = False) -> None:
+        """
+        Registers objects decorated with injectable in the package and all of its submodules.
+        When lazy is set, modules, which are not imported yet, are indexed by their source code instead,
+        and each of them is imported only when one of the keys it registers is requested from the container.
+        """
+        if self.__is_built:
+            raise PartialContainerException("Container already built")
+
+        for module_name in iter_module_names(package):
+            if module_name in self.__scanned_modules or module_name in self.__lazy_key_names:
+                continue
+
+            key_names = find_injectable_key_names(module_name) if lazy and module_name not in sys.modules else None
+            if key_names is None:
+                self.__import_injectables(module_name)
+                continue
+
+            self.__lazy_key_names[module_name] = key_names
+            for key_name in key_names:
+                self.__lazy_modules.setdefault(key_name, []).append(module_name)
+
+    def __import_injectables(self, module_name: str) -> list[int]:
+        self.__scanned_modules.add(module_name)
+        module = importlib.import_module(module_name)
+        return [self.__add_registration(registration) for registration in getattr(module, INJECTABLES_ATTRIBUTE, [])]
+
+    def __load_lazy(self, key: ContainerKey) -> bool:
+        if not self.__lazy_modules:
+            return False
+
+        registered_key_ids = []
+        key_names = [Container.__get_key_name(key)]
+        while key_names:
+            for module_name in self.__lazy_modules.pop(key_names.pop(), []):
+                if module_name not in self.__scanned_modules:
+                    registered_key_ids.extend(self.__import_injectables(module_name))
+                    key_names.extend(self.__lazy_key_names[module_name])
+
+        for key_id in registered_key_ids:
+            if key_id in self._registered:
+                self.__build_dependency(key_id)
+        return len(registered_key_ids) > 0
+
+    @staticmethod
+    def __get_key_name(key: ContainerKey) -> Optional[str]:
+        if getattr(key, '__origin__', None) is list:
+            key = key.__args__[0]
+        return key if isinstance(key, str) else getattr(key, '__name__', None)
+
+    @property
+    def build_graph(self) -> BuildGraph:
+        """
+        Dependency graph of the registrations with durations measured during build.
+        Use it to export the graph to DOT or JSON and to find the critical path of the build.
+        """
+        return self.__build_graph
 
     def build(self) -> None:
-        for key, registration in self._registered.items():
-            self.__build_dependency(key)
+        self.__build_graph_recorder = BuildGraphRecorder(self.__build_graph, self.__keys.key_of)
+        try:
+            for key_id in list(self._registered):
+                if key_id in self._registered:
+                    self.__build_dependency(key_id)
+        finally:
+            self.__build_graph_recorder = NULL_BUILD_GRAPH_RECORDER
         self.__is_built = True
 
     def __create_build_dict_value(self,
                                   registration: 'Container.Registration',
                                   value: Any):
-        return Container.BuiltDictValue(registration, value, self.__execute_with_injections)
-
-    def __build_dependency(self, registration_key: ContainerKey) -> None | tuple[ContainerKey | None, list[ContainerKey] | None]: # TODO: Add circular dependency tracking
-        if registration_key not in self._registered:
-            raise PartialContainerException(f"The object with key {registration_key} is not registered")
-
+        return Container.BuiltDictValue(registration, value, self.__execute_with_injections, self.__aexecute_with_injections)
+
+    def __find_registered(self, key: ContainerKey) -> int:
+        key_id = self.__keys.find(key)
+        if key_id not in self._registered and self.__load_lazy(key):
+            key_id = self.__keys.find(key)
+        if key_id not in self._registered:
+            raise PartialContainerException(f"The object with key {key} is not registered")
+        return key_id
+
+    def __build_dependency(self, registration_key_id: int) -> tuple[int | None, int | None]: # TODO: Add circular dependency tracking
+        if self.__lazy_modules:
+            item_key_id = self.__keys.item_of(registration_key_id)
+            self.__load_lazy(self.__keys.key_of(registration_key_id if item_key_id is None else item_key_id))
+            if registration_key_id not in self._registered:
+                registration_key_id = self.__keys.multi_of(registration_key_id)
+        self.__build_graph_recorder.add_dependency(registration_key_id)
         built_dependencies = []
-        multiple_registrations = isinstance(self._registered[registration_key], Container.ListOfDependencies)
-
-        if multiple_registrations:
-            already_built_item_key = registration_key.__args__[0] if registration_key.__args__[0] in self.__built else None
-            already_built_list_key = list[already_built_item_key] if list[already_built_item_key] in self.__built else None
-
-            if already_built_item_key or already_built_list_key:
-                return already_built_item_key, already_built_list_key
-        else:
-            if registration_key in self.__built:
-                return registration_key, None
-
-        registrations = self._registered[registration_key].registrations if multiple_registrations else [self._registered[registration_key]]
-        for registration in registrations:
-            if registration.condition is not None and registration.type not in [RegistrationType.TRANSIENT_FACTORY, RegistrationType.TRANSIENT]:
-                if not self.__execute_with_injections(registration.condition, registration.condition_args, registration.condition_kwargs):
-                    continue
-            built_dependencies.extend(self.__build_registration(registration))
-
-        if len(built_dependencies) == 0:
-            if not multiple_registrations or any(r.throw_if_condition_not_satisfied_for_all for r in registrations):
-                raise PartialContainerException(f"No objects with key {registration_key} were built because built conditions have not been met for any of the registrations.")
+        multiple_registrations = isinstance(self._registered[registration_key_id], Container.ListOfDependencies)
 
         if multiple_registrations:
-            built_item_key = None
-            if len(built_dependencies) == 1:
-                built_item_key = registration_key.__args__[0]
-                self.__built[built_item_key] = self.__create_build_dict_value(registration, built_dependencies[0])
-
-            built_list_key = list[registration_key.__args__[0]]
-            self.__built[built_list_key] = self.__create_build_dict_value(registration, built_dependencies)
+            item_key_id = self.__keys.item_of(registration_key_id)
+            list_key_id = self.__keys.list_of(item_key_id)
+            already_built_item_key_id = item_key_id if item_key_id in self.__built else None
+            already_built_list_key_id = list_key_id if list_key_id in self.__built else None
 
-            return built_item_key, built_list_key
+            if already_built_item_key_id is not None or already_built_list_key_id is not None:
+                return already_built_item_key_id, already_built_list_key_id
         else:
-            self.__built[registration_key] = self.__create_build_dict_value(registration, built_dependencies[0])
-            return registration_key, None
+            if registration_key_id in self.__built:
+                return registration_key_id, None
+
+        self.__build_graph_recorder.start(registration_key_id)
+        try:
+            registrations = self._registered[registration_key_id].registrations if multiple_registrations else [self._registered[registration_key_id]]
+            for registration in registrations:
+                if registration.condition is not None and registration.type not in [RegistrationType.TRANSIENT_FACTORY, RegistrationType.TRANSIENT]:
+                    if not self.__execute_with_injections(registration.condition, registration.condition_args, registration.condition_kwargs):
+                        continue
+                self.__record_from_container_dependencies(registration)
+                built_dependencies.extend(self.__build_registration(registration))
+
+            if len(built_dependencies) == 0:
+                if not multiple_registrations or any(r.throw_if_condition_not_satisfied_for_all for r in registrations):
+                    raise PartialContainerException(f"No objects with key {self.__keys.key_of(registration_key_id)} were built because built conditions have not been met for any of the registrations.")
+
+            if multiple_registrations:
+                built_item_key_id = None
+                if len(built_dependencies) == 1:
+                    built_item_key_id = item_key_id
+                    self.__built[built_item_key_id] = self.__create_build_dict_value(registration, built_dependencies[0])
+
+                self.__built[list_key_id] = self.__create_build_dict_value(registration, built_dependencies)
+
+                return built_item_key_id, list_key_id
+            else:
+                self.__built[registration_key_id] = self.__create_build_dict_value(registration, built_dependencies[0])
+                return registration_key_id, None
+        finally:
+            self.__build_graph_recorder.stop()
+
+    def __record_from_container_dependencies(self, registration: 'Container.Registration') -> None:
+        if self.__build_graph_recorder is NULL_BUILD_GRAPH_RECORDER:
+            return
+        references = [registration.obj,
+                      *(registration.factory_args or []),
+                      *(registration.factory_kwargs or {}).values(),
+                      *(registration.condition_args or []),
+                      *(registration.condition_kwargs or {}).values()]
+        for reference in references:
+            if isinstance(reference, FromContainer):
+                source_key_id = self.__keys.find(reference.source_key)
+                if source_key_id in self._registered:
+                    self.__build_graph_recorder.add_dependency(source_key_id)
 
     def __build_registration(self, registration: 'Container.Registration'):
         match registration:
             case _ if registration.type == RegistrationType.SINGLETON and isinstance(registration.obj,
                                                                                      FromContainer):
-                self.__build_dependency(registration.obj.source_key)
-                return [registration.obj(self.__built)]
+                return [self.__execute_from_container(registration.obj)]
             case _ if registration.type == RegistrationType.TRANSIENT and isinstance(registration.obj,
                                                                                      FromContainer):
-                transient_container = Container.TransientContainer(self.__execute_transient_from_container, registration)
+                transient_container = Container.TransientContainer(self.__execute_transient_from_container,
+                                                                   registration,
+                                                                   self.__aexecute_transient_from_container)
                 return [transient_container]
             case _ if registration.type == RegistrationType.SINGLETON \
                       and not isinstance(registration.obj, FromContainer) \
@@ -318,7 +528,9 @@ class Container: # TODO: Add validation and proper error handling
             case _ if registration.type == RegistrationType.SINGLETON_FACTORY:
                 return [self.__execute_singleton_factory(registration)]
             case _ if registration.type == RegistrationType.TRANSIENT_FACTORY:
-                transient_container = Container.TransientContainer(self.__execute_transient_factory, registration)
+                transient_container = Container.TransientContainer(self.__execute_transient_factory,
+                                                                   registration,
+                                                                   self.__aexecute_transient_factory)
                 return [transient_container]
             case _:
                 raise PartialContainerException("Unsupported registration type and configuration")
@@ -340,8 +552,25 @@ class Container: # TODO: Add validation and proper error handling
                 return self.__copy(registration.obj)
 
     def __execute_transient_from_container(self, registration: 'Container.Registration') -> Any:
-        self.__build_dependency(registration.obj.source_key)
-        return registration.obj(self.__built)
+        return self.__execute_from_container(registration.obj)
+
+    async def __aexecute_transient_from_container(self, registration: 'Container.Registration') -> Any:
+        return await self.__aexecute_from_container(registration.obj)
+
+    def __execute_from_container(self, from_container: 'FromContainer') -> Any:
+        source_key_id = self.__find_registered(from_container.source_key)
+        if source_key_id not in self.__built:
+            self.__build_dependency(source_key_id)
+        else:
+            self.__build_graph_recorder.add_dependency(source_key_id)
+        return from_container.select(self.__built[source_key_id].value)
+
+    async def __aexecute_from_container(self, from_container: 'FromContainer') -> Any:
+        source_key_id = self.__find_registered(from_container.source_key)
+        if source_key_id not in self.__built:
+            self.__build_dependency(source_key_id)
+        injectable = from_container.select(await self.__built[source_key_id].avalue())
+        return await injectable if inspect.isawaitable(injectable) else injectable
 
     def __execute_transient_function(self, registration: 'Container.Registration') -> Any:
         partial_func = self.__build_partial(self.__copy(registration.obj), registration.inject_returns)
@@ -353,6 +582,12 @@ class Container: # TODO: Add validation and proper error handling
                                              registration.factory_kwargs)
         return self.__execute_factory(self.__copy(obj), registration.inject_returns)
 
+    async def __aexecute_transient_factory(self, registration: 'Container.Registration') -> Any:
+        obj = await self.__aexecute_with_injections(registration.obj,
+                                                    registration.factory_args,
+                                                    registration.factory_kwargs)
+        return self.__execute_factory(self.__copy(obj), registration.inject_returns)
+
     def __execute_factory(self, obj, inject_returns):
         match obj:
             case _ if isfunction(obj):
@@ -391,21 +626,49 @@ class Container: # TODO: Add validation and proper error handling
                                   kwargs: Optional[dict[str, ContainerObject]]=None) -> Any:
         match factory:
             case _ if args is not None and kwargs is not None:
-                return factory(*self.__build_from_container_args(args), **self.__build_from_container_kwargs(kwargs))
+                result = factory(*self.__build_from_container_args(args), **self.__build_from_container_kwargs(kwargs))
             case _ if args is not None and kwargs is None:
-                return factory(*self.__build_from_container_args(args))
+                result = factory(*self.__build_from_container_args(args))
             case _ if args is None and kwargs is not None:
-                return factory(**self.__build_from_container_kwargs(kwargs))
+                result = factory(**self.__build_from_container_kwargs(kwargs))
             case _:
-                return factory()
+                result = factory()
+
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise PartialContainerException(f"Cannot await the result of {factory} synchronously. "
+                                            f"Async factories and conditions are supported only for transient registrations resolved with aresolve")
+        return result
+
+    async def __aexecute_with_injections(self,
+                                         factory: Callable,
+                                         args: Optional[list[ContainerObject]]=None,
+                                         kwargs: Optional[dict[str, ContainerObject]]=None) -> Any:
+        args = args if args is not None else []
+        kwargs = kwargs if kwargs is not None else {}
+        items = [*args, *kwargs.values()]
+
+        injectables = iter(await asyncio.gather(*[self.__aexecute_from_container(item) for item in items if isinstance(item, FromContainer)]))
+        unwrapped = []
+        for item in items:
+            if isinstance(item, FromContainer):
+                injectable = next(injectables)
+                if isinstance(injectable, list):
+                    raise PartialContainerException(f"Cannot resolve dependency from the list of registered under key {item.source_key} because more than one object is available under this key")
+                unwrapped.append(injectable)
+            else:
+                unwrapped.append(item)
+
+        result = factory(*unwrapped[:len(args)], **dict(zip(kwargs.keys(), unwrapped[len(args):])))
+        return await result if inspect.isawaitable(result) else result
 
     def __build_from_container_args(self, obj: list[ContainerObject]):
         unwrapped = []
         for item in obj:
             match item:
                 case _ if isinstance(item, FromContainer):
-                    self.__build_dependency(item.source_key)
-                    injectable = item(self.__built) if item.selector is not None else self.__built[item.source_key].value
+                    injectable = self.__execute_from_container(item)
 
                     if isinstance(injectable, list):
                         raise PartialContainerException(f"Cannot resolve dependency from the list of registered under key {item.source_key} because more than one object is available under this key")
@@ -419,8 +682,7 @@ class Container: # TODO: Add validation and proper error handling
         for key, item in obj.items():
             match item:
                 case _ if isinstance(item, FromContainer):
-                    self.__build_dependency(item.source_key)
-                    injectable = item(self.__built) if item.selector is not None else self.__built[item.source_key].value
+                    injectable = self.__execute_from_container(item)
 
                     if isinstance(injectable, list):
                         raise PartialContainerException(f"Cannot resolve dependency from the list of registered under key {item.source_key} because more than one object is available under this key")
@@ -441,22 +703,26 @@ class Container: # TODO: Add validation and proper error handling
         last_not_registered_annotation = None
         for param_name, param in sig.parameters.items():
             param_is_list = hasattr(param.annotation, '__origin__') and param.annotation.__origin__ is list
-            reg_container_type = Container.ListOfDependencies[param.annotation.__args__[0]] if param.annotation and param_is_list \
-                else Container.ListOfDependencies[param.annotation] if param.annotation \
-                else None
+            if self.__lazy_modules:
+                self.__load_lazy(param_name)
+                self.__load_lazy(param.annotation)
+
+            param_name_id = self.__keys.find(param_name)
+            annotation_id = self.__keys.find(param.annotation)
+            reg_container_id = self.__keys.multi_of(self.__keys.item_of(annotation_id) if param_is_list else annotation_id)
 
-            reg_dep_key = param_name if param_name in self._registered \
-                else param.annotation if param.annotation in self._registered \
-                else reg_container_type if reg_container_type in self._registered \
+            reg_dep_key_id = param_name_id if param_name_id in self._registered \
+                else annotation_id if annotation_id in self._registered \
+                else reg_container_id if reg_container_id in self._registered \
                 else None
 
-            registered_multiple_times = reg_container_type == reg_dep_key
+            registered_multiple_times = reg_container_id == reg_dep_key_id
 
-            if not reg_dep_key is None:
+            if not reg_dep_key_id is None:
                 if last_not_registered_name is not None:
                     raise PartialContainerException(f"Cannot build partial function without registered parameter {last_not_registered_name}:{last_not_registered_annotation}")
 
-                built_dep_keys = self.__build_dependency(reg_dep_key)
+                built_dep_keys = self.__build_dependency(reg_dep_key_id)
 
                 if built_dep_keys is None:
                     last_not_registered_name = param_name
@@ -496,14 +762,52 @@ class Container: # TODO: Add validation and proper error handling
         if not self.__is_built:
             raise PartialContainerException("Container not built")
 
-        if not key in self._registered and hasattr(key, '__args__') \
-                and Container.ListOfDependencies[key.__args__[0]] not in self._registered:
-            raise PartialContainerException(f"Object with key {key} not registered")
+        return self.__get_built(key).value
+
+    async def aresolve(self, key: ContainerKey):
+        """
+        Resolves the object like resolve does, but awaits async transient factories, conditions and FromContainer selectors.
+        FromContainer arguments of a transient factory are resolved concurrently.
+        """
+        if not self.__is_built:
+            raise PartialContainerException("Container not built")
+
+        return await self.__get_built(key).avalue()
+
+    def resolve_many(self, keys: Iterable[ContainerKey]) -> list[Any]:
+        if not self.__is_built:
+            raise PartialContainerException("Container not built")
+
+        return [self.__get_built(key).value for key in keys]
+
+    def resolver(self, keys: Iterable[ContainerKey]) -> Callable[[], list[Any]]:
+        """
+        Precomputes the resolution of the given keys and returns a function,
+        which resolves all of them in one pass each time it is called.
+        """
+        if not self.__is_built:
+            raise PartialContainerException("Container not built")
+
+        resolvers = tuple(self.__get_built(key).get_resolver() for key in keys)
 
-        if not key in self.__built and list[key] not in self.__built:
-            raise PartialContainerException(f"Object with key {key} not built")
+        def resolve_all() -> list[Any]:
+            return [resolve() for resolve in resolvers]
+        return resolve_all
 
-        return self.__built[key].value
+    def __get_built(self, key: ContainerKey) -> 'Container.BuiltDictValue':
+        built = self.__built.get(self.__keys.find(key))
+        if built is None and self.__load_lazy(key):
+            built = self.__built.get(self.__keys.find(key))
+        if built is None:
+            self.__raise_not_resolvable(key)
+        return built
+
+    def __raise_not_resolvable(self, key: ContainerKey) -> None:
+        if not self.__keys.find(key) in self._registered and hasattr(key, '__args__') \
+                and self.__keys.find(Container.ListOfDependencies[key.__args__[0]]) not in self._registered:
+            raise PartialContainerException(f"Object with key {key} not registered")
+
+        raise PartialContainerException(f"Object with key {key} not built")
 
     @dataclass
     class Registration:
@@ -533,6 +837,48 @@ class Container: # TODO: Add validation and proper error handling
         def append(self, registration):
             self.registrations.append(registration)
 
+INJECTABLES_ATTRIBUTE = "__injectables__"
+
+
+def injectable(*,
+               key: Optional[ContainerKey] = None,
+               lifetime: RegistrationType = RegistrationType.SINGLETON,
+               factory_args: Optional[list[ContainerObject]] = None,
+               factory_kwargs: Optional[dict[str, ContainerObject]] = None,
+               inject_returns: bool = False,
+               inject_items: bool = False,
+               condition: Optional[Callable[[...], bool] | Callable[[], bool]] = None,
+               condition_args: Optional[list[ContainerObject]] = None,
+               condition_kwargs: Optional[dict[str, ContainerObject]] = None,
+               throw_if_condition_not_satisfied_for_all: bool = False):
+    """
+    Marks the decorated object for registration in the containers, which scan its module.
+    The arguments have the same meaning as the arguments of the corresponding Container.register_* method.
+    """
+    is_factory = lifetime in [RegistrationType.SINGLETON_FACTORY, RegistrationType.TRANSIENT_FACTORY]
+    if is_factory and inject_items:
+        raise PartialContainerException("inject_items is not supported for factory registrations")
+    if not is_factory and (factory_args is not None or factory_kwargs is not None):
+        raise PartialContainerException("factory_args and factory_kwargs are supported only for factory registrations")
+
+    def decorator(obj: Any) -> Any:
+        registration = Container.Registration(lifetime,
+                                              key if key is not None else obj,
+                                              obj,
+                                              factory_args=factory_args,
+                                              factory_kwargs=factory_kwargs,
+                                              inject_returns=inject_returns,
+                                              inject_items=inject_items,
+                                              condition=condition,
+                                              condition_args=condition_args,
+                                              condition_kwargs=condition_kwargs,
+                                              throw_if_condition_not_satisfied_for_all=throw_if_condition_not_satisfied_for_all)
+        module_globals = vars(sys.modules[obj.__module__])
+        module_globals.setdefault(INJECTABLES_ATTRIBUTE, []).append(registration)
+        return obj
+    return decorator
+
+
 TDependencyKey = TypeVar('TDependencyKey', bound=ContainerKey)
 @dataclass
 class FromContainer(Generic[TDependencyKey]):
@@ -540,8 +886,11 @@ class FromContainer(Generic[TDependencyKey]):
     selector: Optional[Callable[[TDependencyKey], Any]] = None
 
     def __call__(self, built: dict[TDependencyKey, Any]) -> Any:
+        return self.select(built[self.source_key].value)
+
+    def select(self, source: Any) -> Any:
         match self.selector:
             case None:
-                return built[self.source_key].value
+                return source
             case _:
-                return self.selector(built[self.source_key].value)
+                return self.selector(source)
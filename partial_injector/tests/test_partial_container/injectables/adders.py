@@ -0,0 +1,9 @@
+from partial_injector.partial_container import injectable
+
+from .contracts import NumberAdder, NumberReturner
+
+
+@injectable(key=NumberAdder)
+def __add_numbers(number_returners: list[NumberReturner]) -> int:
+    return sum(number_returner() for number_returner in number_returners)
+add_numbers: NumberAdder = __add_numbers
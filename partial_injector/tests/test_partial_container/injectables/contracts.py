@@ -0,0 +1,5 @@
+from typing import Callable
+
+type NumberReturner = Callable[[], int]
+type NumberAdder = Callable[[], int]
+type Greeter = Callable[[], str]
@@ -0,0 +1,9 @@
+from partial_injector.partial_container import injectable
+
+from .contracts import Greeter
+
+
+@injectable(key=Greeter)
+def __greet() -> str:
+    return "hello"
+greet: Greeter = __greet
@@ -0,0 +1,20 @@
+from partial_injector.partial_container import injectable, RegistrationType
+
+from .contracts import NumberReturner
+
+
+@injectable(key=NumberReturner)
+def __return_one() -> int:
+    return 1
+return_one: NumberReturner = __return_one
+
+
+@injectable(key=NumberReturner)
+def __return_two() -> int:
+    return 2
+return_two: NumberReturner = __return_two
+
+
+@injectable(key="base", lifetime=RegistrationType.SINGLETON_FACTORY)
+def make_base() -> int:
+    return 40
@@ -0,0 +1,144 @@
+import asyncio
+import re
+
+import pytest
+
+from partial_injector.error_handling import PartialContainerException
+from partial_injector.partial_container import Container, FromContainer
+
+
+class Token:
+    def __init__(self, value: int):
+        self.value = value
+
+
+@pytest.mark.asyncio
+async def test_aresolve_awaits_async_transient_factory_each_time():
+    # Arrange
+    container = Container()
+    counter = {"value": 0}
+
+    async def make_token() -> Token:
+        await asyncio.sleep(0)
+        counter["value"] += 1
+        return Token(counter["value"])
+
+    container.register_transient_factory(make_token, key=Token)
+    container.build()
+
+    # Act
+    first = await container.aresolve(Token)
+    second = await container.aresolve(Token)
+
+    # Assert
+    assert (first.value, second.value) == (1, 2)
+
+
+@pytest.mark.asyncio
+async def test_aresolve_awaits_async_condition():
+    # Arrange
+    container = Container()
+
+    async def is_enabled() -> bool:
+        await asyncio.sleep(0)
+        return False
+
+    container.register_transient_factory(lambda: 1, key=int, condition=is_enabled)
+    container.build()
+
+    # Act / Assert
+    with pytest.raises(PartialContainerException,
+                       match=re.escape("No objects with key <class 'int'> were built because built conditions have not been met for any of the registrations at the moment of resolution.")):
+        await container.aresolve(int)
+
+
+@pytest.mark.asyncio
+async def test_aresolve_filters_list_of_transients_by_async_conditions():
+    # Arrange
+    container = Container()
+
+    async def allow(value: bool) -> bool:
+        await asyncio.sleep(0)
+        return value
+
+    container.register_transient_factory(lambda: 1, key=int, condition=allow, condition_args=[True])
+    container.register_transient_factory(lambda: 2, key=int, condition=allow, condition_args=[False])
+    container.register_singleton(3, key=int)
+    container.build()
+
+    # Act
+    result = await container.aresolve(list[int])
+
+    # Assert
+    assert result == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_aresolve_resolves_async_from_container_arguments_concurrently():
+    # Arrange
+    container = Container()
+    running = {"current": 0, "max": 0}
+
+    async def fetch(value: str) -> str:
+        running["current"] += 1
+        running["max"] = max(running["max"], running["current"])
+        await asyncio.sleep(0.01)
+        running["current"] -= 1
+        return value
+
+    container.register_transient_factory(fetch, key="first", factory_args=["a"])
+    container.register_transient_factory(fetch, key="second", factory_args=["b"])
+    container.register_transient_factory(lambda first, second: first + second,
+                                         key="joined",
+                                         factory_args=[FromContainer("first")],
+                                         factory_kwargs={"second": FromContainer("second")})
+    container.build()
+
+    # Act
+    result = await container.aresolve("joined")
+
+    # Assert
+    assert result == "ab"
+    assert running["max"] == 2
+
+
+@pytest.mark.asyncio
+async def test_aresolve_returns_singletons_as_resolve_does():
+    # Arrange
+    container = Container()
+    container.register_singleton(42, key=int)
+    container.register_transient(FromContainer(int, lambda value: f"str: {value + 1}"), key=str)
+    container.build()
+
+    # Act / Assert
+    assert await container.aresolve(int) == 42
+    assert await container.aresolve(str) == "str: 43"
+
+
+def test_resolve_raises_for_async_transient_factory():
+    # Arrange
+    container = Container()
+
+    async def make_token() -> Token:
+        return Token(1)
+
+    container.register_transient_factory(make_token, key=Token)
+    container.build()
+
+    # Act / Assert
+    with pytest.raises(PartialContainerException, match="resolved with aresolve"):
+        container.resolve(Token)
+
+
+def test_build_raises_for_async_singleton_condition():
+    # Arrange
+    container = Container()
+
+    async def is_enabled() -> bool:
+        return False
+
+    container.register_singleton(1, key=int, condition=is_enabled)
+
+    # Act / Assert
+    with pytest.raises(PartialContainerException, match="Cannot await the result"):
+        container.build()
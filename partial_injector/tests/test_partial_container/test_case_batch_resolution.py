@@ -0,0 +1,82 @@
+import pytest
+
+from partial_injector.error_handling import PartialContainerException
+from partial_injector.partial_container import Container
+
+
+class NumberContainer:
+    def __init__(self):
+        self.value = 0
+
+    def increment(self) -> int:
+        self.value += 1
+        return self.value
+
+
+def test_resolve_many_returns_values_in_keys_order():
+    # Arrange
+    container = Container()
+    container.register_singleton(1, key="one")
+    container.register_singleton("two", key=str)
+    container.register_singleton(3, key=int)
+    container.register_singleton(4, key=int)
+    container.build()
+
+    # Act
+    result = container.resolve_many([list[int], "one", str])
+
+    # Assert
+    assert result == [[3, 4], 1, "two"]
+
+
+def test_resolver_returns_singletons_and_new_transients_on_each_call():
+    # Arrange
+    container = Container()
+    container.register_singleton(1, key="one")
+    container.register_transient(NumberContainer(), key=NumberContainer)
+    container.build()
+    resolve_all = container.resolver(["one", NumberContainer])
+
+    # Act
+    first_one, first_number_container = resolve_all()
+    second_one, second_number_container = resolve_all()
+
+    # Assert
+    assert first_one == second_one == 1
+    assert first_number_container is not second_number_container
+
+
+def test_resolver_evaluates_transient_conditions_on_each_call():
+    # Arrange
+    container = Container()
+    allowed = {"value": True}
+    container.register_transient_factory(lambda: 1, key=int, condition=lambda: allowed["value"])
+    container.build()
+    resolve_all = container.resolver([int])
+
+    # Act / Assert
+    assert resolve_all() == [1]
+    allowed["value"] = False
+    with pytest.raises(PartialContainerException, match="No objects with key <class 'int'> were built"):
+        resolve_all()
+
+
+def test_resolver_raises_for_not_built_key_when_created():
+    # Arrange
+    container = Container()
+    container.register_singleton(1, key="one")
+    container.build()
+
+    # Act / Assert
+    with pytest.raises(PartialContainerException, match="Object with key unknown not built"):
+        container.resolver(["one", "unknown"])
+
+
+def test_resolve_many_raises_when_container_not_built():
+    # Arrange
+    container = Container()
+    container.register_singleton(1, key="one")
+
+    # Act / Assert
+    with pytest.raises(PartialContainerException, match="Container not built"):
+        container.resolve_many(["one"])
@@ -0,0 +1,94 @@
+import json
+import time
+from typing import Callable
+
+from partial_injector.partial_container import Container, FromContainer
+
+type SlowReturner = Callable[[], int]
+type FastReturner = Callable[[], int]
+type NumberAdder = Callable[[], int]
+
+
+def __slow_factory() -> int:
+    time.sleep(0.02)
+    return 1
+
+
+def __fast_factory() -> int:
+    return 2
+
+
+def __add_numbers(slow_returner: SlowReturner, fast_returner: FastReturner) -> int:
+    return slow_returner() + fast_returner()
+add_numbers: NumberAdder = __add_numbers
+
+
+def build_container() -> Container:
+    container = Container()
+    container.register_singleton_factory(__slow_factory, key="slow")
+    container.register_singleton_factory(__fast_factory, key="fast")
+    container.register_singleton(FromContainer("slow", lambda value: lambda: value), key=SlowReturner)
+    container.register_singleton(FromContainer("fast", lambda value: lambda: value), key=FastReturner)
+    container.register_singleton(add_numbers, key=NumberAdder)
+    container.register_transient_factory(lambda value: value, key="transient", factory_args=[FromContainer("fast")])
+    container.build()
+    return container
+
+
+def test_build_graph_contains_dependencies_of_registrations():
+    # Arrange
+    container = build_container()
+
+    # Act
+    graph = container.build_graph
+    dependencies = {node.key: sorted(graph.nodes[dependency_id].key for dependency_id in node.dependencies)
+                    for node in graph.nodes.values()}
+
+    # Assert
+    assert dependencies["NumberAdder"] == ["FastReturner", "SlowReturner"]
+    assert dependencies["SlowReturner"] == ["slow"]
+    assert dependencies["transient"] == ["fast"]
+    assert dependencies["slow"] == []
+
+
+def test_build_graph_critical_path_goes_through_slowest_chain():
+    # Arrange
+    container = build_container()
+
+    # Act
+    graph = container.build_graph
+    critical_path = [graph.nodes[node_id].key for node_id in graph.critical_path()]
+
+    # Assert
+    assert critical_path == ["slow", "SlowReturner", "NumberAdder"]
+    assert graph.nodes[graph.critical_path()[0]].duration >= 0.02
+    assert graph.critical_path_duration() <= graph.total_duration()
+    assert graph.parallel_speedup() >= 1.0
+
+
+def test_build_graph_exports_to_json_and_dot():
+    # Arrange
+    container = build_container()
+
+    # Act
+    exported = json.loads(container.build_graph.to_json())
+    dot = container.build_graph.to_dot()
+
+    # Assert
+    assert {node["key"] for node in exported["nodes"]} == {"slow", "fast", "SlowReturner", "FastReturner", "NumberAdder", "transient"}
+    assert exported["critical_path"] == container.build_graph.critical_path()
+    assert dot.startswith("digraph build {")
+    assert 'label="slow\\n' in dot
+
+
+def test_build_graph_does_not_change_on_resolution_after_build():
+    # Arrange
+    container = build_container()
+    graph = container.build_graph.to_dict()
+
+    # Act
+    container.resolve("transient")
+    container.resolve(NumberAdder)
+
+    # Assert
+    assert container.build_graph.to_dict() == graph
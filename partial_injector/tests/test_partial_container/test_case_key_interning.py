@@ -0,0 +1,77 @@
+import re
+from typing import Callable
+
+import pytest
+
+from partial_injector.error_handling import PartialContainerException
+from partial_injector.partial_container import Container
+
+type NumberReturner = Callable[[], int]
+type NumberAdder = Callable[[], int]
+
+
+def __return_one() -> int:
+    return 1
+return_one: NumberReturner = __return_one
+
+
+def __return_two() -> int:
+    return 2
+return_two: NumberReturner = __return_two
+
+
+def __add_numbers(number_returners: list[NumberReturner]) -> int:
+    return sum(number_returner() for number_returner in number_returners)
+add_numbers: NumberAdder = __add_numbers
+
+
+def test_container_resolves_same_values_by_alias_and_list_alias_keys():
+    # Arrange
+    container = Container()
+    container.register_singleton(return_one, key=NumberReturner)
+    container.register_singleton(return_two, key=NumberReturner)
+    container.register_singleton(add_numbers, key=NumberAdder)
+    container.register_singleton(add_numbers, key="adder")
+    container.build()
+
+    # Act
+    number_returners = container.resolve(list[NumberReturner])
+
+    # Assert
+    assert [number_returner() for number_returner in number_returners] == [1, 2]
+    assert container.resolve(NumberAdder)() == 3
+    assert container.resolve("adder")() == 3
+
+
+def test_singleton_factories_with_same_key_are_called_once_when_injected_many_times():
+    # Arrange
+    container = Container()
+    call_count = {"count": 0}
+
+    def make_number_returner() -> NumberReturner:
+        call_count["count"] += 1
+        return return_one
+
+    container.register_singleton_factory(make_number_returner, key=NumberReturner)
+    container.register_singleton_factory(make_number_returner, key=NumberReturner)
+    container.register_singleton(add_numbers, key=NumberAdder)
+    container.register_singleton(add_numbers, key="adder")
+    container.build()
+
+    # Act
+    result = container.resolve(NumberAdder)()
+
+    # Assert
+    assert result == 2
+    assert call_count["count"] == 2
+
+
+def test_resolve_list_of_unregistered_key_raises_not_registered():
+    # Arrange
+    container = Container()
+    container.register_singleton(return_one, key=NumberReturner)
+    container.build()
+
+    # Act / Assert
+    with pytest.raises(PartialContainerException, match=re.escape("Object with key list[int] not registered")):
+        container.resolve(list[int])
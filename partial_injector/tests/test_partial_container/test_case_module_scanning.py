@@ -0,0 +1,109 @@
+import sys
+
+import pytest
+
+from partial_injector.error_handling import PartialContainerException
+from partial_injector.partial_container import Container, FromContainer, injectable, RegistrationType
+
+from . import injectables
+from .injectables.contracts import NumberAdder, NumberReturner, Greeter
+
+INJECTABLE_MODULES = [f"{injectables.__name__}.{name}" for name in ["number_returners", "adders", "greeters"]]
+
+
+@pytest.fixture
+def unimported_injectables():
+    for module_name in INJECTABLE_MODULES:
+        sys.modules.pop(module_name, None)
+    yield
+    for module_name in INJECTABLE_MODULES:
+        sys.modules.pop(module_name, None)
+
+
+def test_scan_registers_decorated_objects_of_all_modules(unimported_injectables):
+    # Arrange
+    container = Container()
+    container.scan(injectables)
+    container.build()
+
+    # Act
+    number_adder = container.resolve(NumberAdder)
+
+    # Assert
+    assert number_adder() == 3
+    assert container.resolve(Greeter)() == "hello"
+    assert container.resolve("base") == 40
+
+
+def test_lazy_scan_imports_only_modules_of_resolved_keys(unimported_injectables):
+    # Arrange
+    container = Container()
+    container.scan(injectables, lazy=True)
+    container.build()
+
+    # Act
+    number_adder = container.resolve(NumberAdder)
+
+    # Assert
+    assert number_adder() == 3
+    assert f"{injectables.__name__}.adders" in sys.modules
+    assert f"{injectables.__name__}.number_returners" in sys.modules
+    assert f"{injectables.__name__}.greeters" not in sys.modules
+
+
+def test_lazy_scan_imports_modules_of_from_container_dependencies(unimported_injectables):
+    # Arrange
+    container = Container()
+    container.scan(injectables, lazy=True)
+    container.register_singleton_factory(lambda base: base + 2, key="answer", factory_args=[FromContainer("base")])
+    container.build()
+
+    # Act
+    answer = container.resolve("answer")
+
+    # Assert
+    assert answer == 42
+    assert f"{injectables.__name__}.adders" not in sys.modules
+
+
+def test_lazy_scan_resolves_all_registrations_of_list_key(unimported_injectables):
+    # Arrange
+    container = Container()
+    container.scan(injectables, lazy=True)
+    container.build()
+
+    # Act
+    number_returners = container.resolve(list[NumberReturner])
+
+    # Assert
+    assert [number_returner() for number_returner in number_returners] == [1, 2]
+
+
+def test_lazy_scan_resolves_manual_and_lazy_registrations_of_list_key(unimported_injectables):
+    # Arrange
+    container = Container()
+    container.register_singleton(lambda: 99, key=NumberReturner)
+    container.scan(injectables, lazy=True)
+    container.build()
+
+    # Act
+    number_returners = container.resolve(list[NumberReturner])
+
+    # Assert
+    assert [number_returner() for number_returner in number_returners] == [99, 1, 2]
+
+
+def test_scan_after_build_raises(unimported_injectables):
+    # Arrange
+    container = Container()
+    container.build()
+
+    # Act / Assert
+    with pytest.raises(PartialContainerException, match="Container already built"):
+        container.scan(injectables)
+
+
+def test_injectable_rejects_factory_args_for_singleton():
+    # Act / Assert
+    with pytest.raises(PartialContainerException, match="factory_args and factory_kwargs are supported only for factory registrations"):
+        injectable(key="value", lifetime=RegistrationType.SINGLETON, factory_args=[1])
@@ -57,4 +57,16 @@ def test_from_container_lambda_executed_when_passed_as_parameter():
     value2 = container.resolve("factory2")
 
     assert value1 == 'value1'
-    assert value2 == 'value2'
\ No newline at end of file
+    assert value2 == 'value2'
+
+def test_from_container_can_be_called_with_built_objects():
+    @dataclass
+    class Built:
+        value: Configuration
+
+    configuration = Configuration(section=ConfigurationSection(property1='value1', property2='value2'))
+    from_container = FromContainer(Configuration, lambda conf: conf.section.property2)
+
+    assert from_container({Configuration: Built(configuration)}) == 'value2'
+    assert from_container.select(configuration) == 'value2'
+    assert FromContainer(Configuration)({Configuration: Built(configuration)}) is configuration
@@ -0,0 +1,27 @@
+import asyncio
+import sys
+import time
+
+from spinq import async_iterables
+
+
+async def rows(count: int):
+    for x in range(count):
+        yield x
+
+
+async def fetch_details(x: int) -> int:
+    await asyncio.sleep(0.001)
+    return x * 2
+
+
+async def main(size: int) -> None:
+    for max_concurrency in (1, 8, 64):
+        started = time.perf_counter()
+        count = await async_iterables.count_(async_iterables.select_(rows(size), fetch_details, max_concurrency))
+        elapsed = time.perf_counter() - started
+        print(f"max_concurrency {max_concurrency:<4} {count} items {elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000))
@@ -0,0 +1,33 @@
+import sys
+from dataclasses import dataclass
+
+from spinq.cache import QueryCache
+from spinq.expressions import it
+from spinq.query import Query
+
+from timing import measure
+
+
+@dataclass(frozen=True)
+class Product:
+    id: int
+    price: float
+    category: int
+
+
+def main(size: int, requests: int = 100) -> None:
+    products = [Product(i, (i * 7919) % 1000 / 10, i % 50) for i in range(size)]
+    cache = QueryCache()
+    cases = [
+        ("Query", lambda: Query(products).where_(it.price > 50).order_by_(it.price).first_()),
+        ("QueryCache", lambda: cache.query(products, version=1).where_(it.price > 50).order_by_(it.price).first_()),
+        ("Query lookup", lambda: Query(products).where_(it.category == 7).to_list_()),
+        ("QueryCache find_", lambda: cache.query(products, version=1).find_(it.category, 7)),
+    ]
+    for name, function in cases:
+        function()  # The first request fills the cache
+        print(f"{name:<20} {measure(function, number=requests) * 1e6:12.1f} us per request")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
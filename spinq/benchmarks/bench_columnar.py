@@ -0,0 +1,40 @@
+import random
+import sys
+from dataclasses import dataclass
+
+from spinq import lists
+from spinq.columnar import columnar
+from spinq.expressions import it
+
+from timing import measure
+
+
+@dataclass
+class Order:
+    customer: str
+    price: float
+    quantity: int
+
+
+def main(size: int) -> None:
+    generator = random.Random(42)
+    orders = [Order(f"customer{generator.randrange(1000)}", generator.random() * 100, generator.randrange(10))
+              for _ in range(size)]
+    query = columnar(orders)
+    query.where_((it.price > 0) & (it.quantity > 0)).count_()  # Builds the price and quantity columns once
+
+    cases = [
+        ("lists.where_ lambda", lambda: lists.where_(orders, lambda o: o.price * o.quantity > 500)),
+        ("lists.where_ it", lambda: lists.where_(orders, it.price * it.quantity > 500)),
+        ("columnar where_", lambda: query.where_(it.price * it.quantity > 500).to_list_()),
+        ("lists.order_by_ lambda", lambda: lists.order_by_(orders, lambda o: o.price)),
+        ("columnar order_by_", lambda: query.order_by_(it.price).to_list_()),
+        ("lists.select_ lambda", lambda: lists.select_(orders, lambda o: o.price * o.quantity)),
+        ("columnar select_", lambda: query.select_(it.price * it.quantity)),
+    ]
+    for name, function in cases:
+        print(f"{name:<24} {measure(function) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,28 @@
+import sys
+
+from spinq import dicts
+from spinq.dicts import IndexedDict
+
+from timing import measure
+
+
+def main(size: int) -> None:
+    plain = {f"user{x}": {"group": x % 100} for x in range(size)}
+    indexed = IndexedDict(plain)
+    indexed.add_index("group", lambda x: x["group"])
+    groups = range(100)
+
+    cases = [
+        ("key by index", lambda: [dicts.get_key_by_index_(plain, x) for x in range(size)],
+         lambda: [dicts.get_key_by_index_(indexed, x) for x in range(size)]),
+        ("first by value", lambda: [dicts.first_(plain, lambda x: x["group"] == group) for group in groups],
+         lambda: [indexed.find_first_or_none_("group", group) for group in groups]),
+        ("all by value", lambda: [[(k, v) for k, v in plain.items() if v["group"] == group] for group in groups],
+         lambda: [indexed.find_("group", group) for group in groups]),
+    ]
+    for name, linear, indexed_lookup in cases:
+        print(f"{name:<16} linear {measure(linear) * 1000:10.1f} ms   indexed {measure(indexed_lookup) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
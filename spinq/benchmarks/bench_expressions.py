@@ -0,0 +1,34 @@
+import sys
+from dataclasses import dataclass
+
+from spinq import lists
+from spinq.expressions import it
+
+from timing import measure
+
+
+@dataclass
+class Product:
+    name: str
+    price: int
+
+
+def main(size: int) -> None:
+    products = [Product(f"product {x}", x % 100) for x in range(size)]
+    cases = [
+        ("where_ price > 50", lambda: lists.where_(products, lambda x: x.price > 50),
+         lambda: lists.where_(products, it.price > 50)),
+        ("select_ price", lambda: lists.select_(products, lambda x: x.price),
+         lambda: lists.select_(products, it.price)),
+        ("order_by_ price", lambda: lists.order_by_(products, lambda x: x.price),
+         lambda: lists.order_by_(products, it.price)),
+        ("select_ name.upper()", lambda: lists.select_(products, lambda x: x.name.upper()),
+         lambda: lists.select_(products, it.name.upper())),
+    ]
+    for name, with_lambda, with_expression in cases:
+        print(f"{name:<24} lambda {measure(with_lambda, repeat=5) * 1000:10.1f} ms   "
+              f"expression {measure(with_expression, repeat=5) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,65 @@
+import sys
+
+from spinq import lists
+
+from timing import measure
+
+
+def naive_group_by(sequence: list, key_selector) -> dict:
+    groups = {}
+    for x in sequence:
+        groups.setdefault(key_selector(x), []).append(x)
+    return groups
+
+
+def naive_count_by(sequence: list, key_selector) -> dict:
+    counts = {}
+    for x in sequence:
+        key = key_selector(x)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+
+def naive_sum(sequence: list, selector) -> int:
+    total = 0
+    for x in sequence:
+        total += selector(x)
+    return total
+
+
+def naive_max_by(sequence: list, key_selector):
+    found = sequence[0]
+    found_key = key_selector(found)
+    for x in sequence:
+        key = key_selector(x)
+        if key > found_key:
+            found, found_key = x, key
+    return found
+
+
+def naive_join(outer: list, inner: list, outer_key_selector, inner_key_selector) -> list:
+    return [(x, y) for x in outer for y in inner if outer_key_selector(x) == inner_key_selector(y)]
+
+
+def main(size: int) -> None:
+    sequence = list(range(size))
+    key = lambda x: x % 1000
+    inner = list(range(0, 2000, 2))
+    join_size = min(size, 20_000)
+    cases = [
+        ("group_by", lambda: naive_group_by(sequence, key), lambda: lists.group_by_(sequence, key)),
+        ("count_by", lambda: naive_count_by(sequence, key), lambda: lists.count_by_(sequence, key)),
+        ("sum", lambda: naive_sum(sequence, key), lambda: lists.sum_(sequence, key)),
+        ("max_by", lambda: naive_max_by(sequence, key), lambda: lists.max_by_(sequence, key)),
+        (f"join ({join_size})",
+         lambda: naive_join(sequence[:join_size], inner, key, key),
+         lambda: lists.join_(sequence[:join_size], inner, key, key)),
+    ]
+    for name, naive, spinq in cases:
+        naive_elapsed = measure(naive)
+        spinq_elapsed = measure(spinq)
+        print(f"{name:<16} naive {naive_elapsed * 1000:10.1f} ms   spinq {spinq_elapsed * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
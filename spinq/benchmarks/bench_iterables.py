@@ -0,0 +1,31 @@
+import sys
+
+from spinq.iterables import chunk_, window_
+
+from timing import measure, measure_peak_memory
+
+
+def naive_chunks(data: bytes, size: int) -> list[bytes]:
+    return [data[start:start + size] for start in range(0, len(data), size)]
+
+
+def naive_windows(sequence: list, size: int) -> list[tuple]:
+    return [tuple(sequence[start:start + size]) for start in range(len(sequence) - size + 1)]
+
+
+def main(size: int) -> None:
+    data = bytes(size)
+    numbers = list(range(size // 100))
+    cases = [
+        ("bytes slices", lambda: naive_chunks(data, 64 * 1024)),
+        ("chunk_ (memoryview)", lambda: list(chunk_(data, 64 * 1024))),
+        ("list slices windows", lambda: naive_windows(numbers, 16)),
+        ("window_", lambda: list(window_(numbers, 16))),
+    ]
+    for name, function in cases:
+        elapsed, peak = measure(function), measure_peak_memory(function)
+        print(f"{name:<24} {elapsed * 1000:10.1f} ms {peak / 1024 / 1024:10.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000_000)
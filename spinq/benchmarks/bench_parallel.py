@@ -0,0 +1,31 @@
+import os
+import sys
+
+from spinq import lists
+from spinq.parallel import parallel, is_free_threaded
+
+from timing import measure
+
+
+def checksum(x: int) -> int:
+    value = x
+    for _ in range(200):
+        value = (value * 1103515245 + 12345) % 2147483648
+    return value
+
+
+def main(size: int) -> None:
+    numbers = range(size)
+    print(f"{'threads' if is_free_threaded() else 'processes'}, {os.process_cpu_count()} cpus")
+
+    baseline = measure(lambda: lists.select_(numbers, checksum))
+    print(f"{'select_':<16} {baseline * 1000:10.1f} ms")
+    workers = 1
+    while workers <= (os.process_cpu_count() or 1):
+        elapsed = measure(lambda: parallel(numbers, chunk_size=10_000, max_workers=workers).select_(checksum))
+        print(f"{f'{workers} workers':<16} {elapsed * 1000:10.1f} ms {baseline / elapsed:6.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,27 @@
+import sys
+
+from spinq import lists
+from spinq.query import Query
+
+from timing import measure, measure_peak_memory
+
+
+def main(size: int) -> None:
+    data = list(range(size))
+    hit = size // 2
+
+    scenarios = {
+        "where->select->first (eager lists)": lambda: lists.first_(lists.select_(lists.where_(data, lambda x: x >= hit), lambda x: x * 2)),
+        "where->select->first (query)": lambda: Query(data).where_(lambda x: x >= hit).select_(lambda x: x * 2).first_(),
+        "where->select->to_list (eager lists)": lambda: lists.select_(lists.where_(data, lambda x: x % 2 == 0), lambda x: x * 2),
+        "where->select->to_list (query)": lambda: Query(data).where_(lambda x: x % 2 == 0).select_(lambda x: x * 2).to_list_(),
+        "where->select->count (eager lists)": lambda: len(lists.select_(lists.where_(data, lambda x: x % 2 == 0), lambda x: x * 2)),
+        "where->select->count (query)": lambda: Query(data).where_(lambda x: x % 2 == 0).select_(lambda x: x * 2).count_(),
+    }
+    for name, scenario in scenarios.items():
+        elapsed, peak = measure(scenario), measure_peak_memory(scenario)
+        print(f"{name:<40} {elapsed * 1000:10.1f} ms {peak / 1024 / 1024:10.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,37 @@
+import sys
+from collections.abc import Iterable
+
+from spinq import lists
+from spinq.query import Query
+
+from timing import measure, measure_peak_memory
+
+
+def legacy_select_many(sequence: list, selector) -> list:
+    seq_dict = {}
+    for i in range(len(sequence)):
+        transformed = selector(sequence[i])
+        if isinstance(transformed, Iterable) and not isinstance(transformed, str):
+            for j in range(len(transformed)):
+                seq_dict[f"{i}{j}"] = transformed[j]
+        else:
+            seq_dict[f"{i}"] = transformed
+    return list(seq_dict.values())
+
+
+def main(size: int) -> None:
+    sequence = list(range(size))
+
+    scenarios = {
+        "legacy select_many": lambda: legacy_select_many(sequence, lambda x: [x, x + 1, x + 2]),
+        "select_many_": lambda: lists.select_many_(sequence, lambda x: [x, x + 1, x + 2]),
+        "Query.select_many_.to_list_": lambda: Query(sequence).select_many_(lambda x: [x, x + 1, x + 2]).to_list_(),
+        "Query.select_many_.count_": lambda: Query(sequence).select_many_(lambda x: [x, x + 1, x + 2]).count_(),
+    }
+    for name, scenario in scenarios.items():
+        elapsed, peak = measure(scenario), measure_peak_memory(scenario)
+        print(f"{name:<30} {elapsed * 1000:10.1f} ms {peak / 1024 / 1024:10.2f} MiB peak")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
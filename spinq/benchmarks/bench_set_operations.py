@@ -0,0 +1,39 @@
+import sys
+
+from spinq import lists
+
+from timing import measure
+
+
+def naive_except(sequence: list, exclusions: list) -> list:
+    return [x for x in sequence if x not in exclusions]
+
+
+def naive_distinct(sequence: list) -> list:
+    distinct = []
+    for x in sequence:
+        if x not in distinct:
+            distinct.append(x)
+    return distinct
+
+
+def main(size: int) -> None:
+    sequence = list(range(size))
+    for exclusions_size in [10, 100, 1_000, 10_000]:
+        exclusions = list(range(0, size, max(1, size // exclusions_size)))[:exclusions_size]
+        naive = measure(lambda: naive_except(sequence, exclusions), repeat=3)
+        hashed = measure(lambda: lists.except_(sequence, exclusions), repeat=3, number=3)
+        print(f"except_ n={size} m={exclusions_size:<6} naive {naive * 1000:10.2f} ms   hash-based {hashed * 1000:8.2f} ms")
+
+    duplicated = [x % (size // 10) for x in sequence]
+    print(f"distinct_ n={size // 10:<8} naive {measure(lambda: naive_distinct(duplicated[:size // 10]), repeat=3) * 1000:10.2f} ms   "
+          f"hash-based {measure(lambda: lists.distinct_(duplicated[:size // 10]), repeat=3, number=3) * 1000:8.2f} ms")
+
+    unhashable = [[x % 100] for x in range(size // 10)]
+    print(f"distinct_ unhashable n={size // 10:<8} {measure(lambda: lists.distinct_(unhashable), repeat=3, number=3) * 1000:10.2f} ms")
+    print(f"union_ n={size} {measure(lambda: lists.union_(sequence, duplicated), repeat=3, number=3) * 1000:10.2f} ms")
+    print(f"intersect_ n={size} {measure(lambda: lists.intersect_(sequence, duplicated), repeat=3, number=3) * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
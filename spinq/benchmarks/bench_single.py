@@ -0,0 +1,42 @@
+import sys
+
+from spinq import lists
+
+from timing import measure, measure_peak_memory
+
+
+def legacy_single_or_none(sequence: list, predicate):
+    filtered = [x for x in sequence if predicate(x)]
+    if len(filtered) == 1:
+        return filtered[0]
+    elif len(filtered) == 0:
+        return None
+    else:
+        raise ValueError("More than one element matches the predicate.")
+
+
+def ignore_value_error(function):
+    def run():
+        try:
+            function()
+        except ValueError:
+            pass
+    return run
+
+
+def main(size: int) -> None:
+    sequence = list(range(size))
+    predicates = {
+        "ambiguous": lambda x: x % 2 == 0,
+        "single match": lambda x: x == size // 2,
+        "no match": lambda x: x < 0,
+    }
+    for predicate_name, predicate in predicates.items():
+        for name, function in [("legacy", legacy_single_or_none), ("single_or_none_", lists.single_or_none_)]:
+            run = ignore_value_error(lambda: function(sequence, predicate))
+            elapsed, peak = measure(run), measure_peak_memory(run)
+            print(f"{predicate_name:<16} {name:<16} {elapsed * 1000:10.1f} ms {peak / 1024:10.1f} KiB peak")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
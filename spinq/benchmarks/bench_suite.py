@@ -0,0 +1,252 @@
+"""
+Times every operator of spinq.lists, spinq.dicts and IndexedDict, including the iterate_ variants, against an equivalent comprehension or itertools baseline.
+Predicate based operators run in three scenarios: the matching item is the first one, the last one or missing.
+Each case reports the best time of several repeats and the peak memory traced during one extra run,
+and checks that spinq and the baseline return the same result.
+
+    python benchmarks/bench_suite.py --sizes 10,1000,100000 --operators where_,first_ --json results.json
+"""
+import argparse
+import json
+import operator
+import sys
+from collections import Counter
+from dataclasses import dataclass, asdict
+from functools import reduce
+from itertools import chain, islice
+from typing import Any, Callable
+
+from spinq import lists, dicts
+from spinq.dicts import IndexedDict
+
+from timing import measure, measure_peak_memory
+
+DEFAULT_SIZES = (10, 1_000, 100_000, 1_000_000, 10_000_000)
+SCENARIOS = ("hit-early", "hit-late", "no-hit")
+NO_SCENARIO = "-"
+NOT_MATCHED = "not matched"
+
+
+@dataclass
+class Case:
+    operator: str
+    spinq: Callable[[Any, Callable[[int], bool]], Any]
+    baseline: Callable[[Any, Callable[[int], bool]], Any]
+    uses_predicate: bool = True
+    dictionary: bool = False
+    indexed: bool = False
+
+
+@dataclass
+class Result:
+    operator: str
+    size: int
+    scenario: str
+    spinq_seconds: float
+    baseline_seconds: float
+    spinq_peak_bytes: int
+    baseline_peak_bytes: int
+    same_result: bool
+
+
+def double(x: int) -> int:
+    return x * 2
+
+
+def pair(x: int) -> list[int]:
+    return [x, x]
+
+
+def bucket(x: int) -> int:
+    return x % 10
+
+
+def baseline_single(data: list, predicate: Callable) -> Any:
+    matches = list(islice(filter(predicate, data), 2))
+    if not matches:
+        raise ValueError("No elements match the predicate.")
+    if len(matches) > 1:
+        raise ValueError("More than one element matches the predicate.")
+    return matches[0]
+
+
+def baseline_distinct(data: list) -> list:
+    return list(dict.fromkeys(data))
+
+
+def baseline_except(data: list, exclusions: list) -> list:
+    excluded = set(exclusions)
+    return [x for x in data if x not in excluded]
+
+
+def baseline_intersect(data: list, other: list) -> list:
+    included = set(other)
+    return [x for x in dict.fromkeys(data) if x in included]
+
+
+def baseline_distinct_by(data: list, key_selector: Callable) -> list:
+    seen = set()
+    result = []
+    for x in data:
+        key = key_selector(x)
+        if key not in seen:
+            seen.add(key)
+            result.append(x)
+    return result
+
+
+def baseline_group_by(data: list, key_selector: Callable) -> dict:
+    groups = {}
+    for x in data:
+        groups.setdefault(key_selector(x), []).append(x)
+    return groups
+
+
+def baseline_join(outer: list, inner: list) -> list:
+    inner_by_key = baseline_group_by(inner, bucket)
+    return [(x, y) for x in outer for y in inner_by_key.get(bucket(x), ())]
+
+
+def baseline_group_join(outer: list, inner: list) -> list:
+    inner_by_key = baseline_group_by(inner, bucket)
+    return [(x, inner_by_key.get(bucket(x), [])) for x in outer]
+
+
+CASES = [
+    Case("first_", lambda d, p: lists.first_(d, p), lambda d, p: next(filter(p, d))),
+    Case("first_or_none_", lambda d, p: lists.first_or_none_(d, p), lambda d, p: next(filter(p, d), None)),
+    Case("first_or_none_with_index_", lambda d, p: lists.first_or_none_with_index_(d, p),
+         lambda d, p: next(((i, x) for i, x in enumerate(d) if p(x)), None)),
+    Case("last_", lambda d, p: lists.last_(d, p), lambda d, p: next(filter(p, reversed(d)))),
+    Case("last_or_none_", lambda d, p: lists.last_or_none_(d, p), lambda d, p: next(filter(p, reversed(d)), None)),
+    Case("single_", lambda d, p: lists.single_(d, p), baseline_single),
+    Case("single_or_none_", lambda d, p: lists.single_or_none_(d, p),
+         lambda d, p: next(iter(list(islice(filter(p, d), 2))), None)),
+    Case("filter_", lambda d, p: lists.filter_(d, p), lambda d, p: list(filter(p, d))),
+    Case("where_", lambda d, p: lists.where_(d, p), lambda d, p: [x for x in d if p(x)]),
+    Case("where_with_index_", lambda d, p: lists.where_with_index_(d, p),
+         lambda d, p: {i: x for i, x in enumerate(d) if p(x)}),
+    Case("without_", lambda d, p: lists.without_(d, p), lambda d, p: [x for x in d if not p(x)]),
+    Case("any_", lambda d, p: lists.any_(d, p), lambda d, p: any(map(p, d))),
+    Case("all_", lambda d, p: lists.all_(d, lambda x: not p(x)), lambda d, p: not any(map(p, d))),
+    Case("none_", lambda d, p: lists.none_(d, p), lambda d, p: not any(map(p, d))),
+    Case("except_", lambda d, _: lists.except_(d, d[::2]), lambda d, _: baseline_except(d, d[::2]), False),
+    Case("union_", lambda d, _: lists.union_(d, d[::2]), lambda d, _: list(dict.fromkeys(chain(d, d[::2]))), False),
+    Case("intersect_", lambda d, _: lists.intersect_(d, d[::2]), lambda d, _: baseline_intersect(d, d[::2]), False),
+    Case("select_", lambda d, _: lists.select_(d, double), lambda d, _: list(map(double, d)), False),
+    Case("select_many_", lambda d, _: lists.select_many_(d, pair),
+         lambda d, _: list(chain.from_iterable(map(pair, d))), False),
+    Case("iterate_select_many_", lambda d, _: list(lists.iterate_select_many_(d, pair)),
+         lambda d, _: list(chain.from_iterable(map(pair, d))), False),
+    Case("distinct_", lambda d, _: lists.distinct_(d), lambda d, _: baseline_distinct(d), False),
+    Case("distinct_by_", lambda d, _: lists.distinct_by_(d, bucket), lambda d, _: baseline_distinct_by(d, bucket), False),
+    Case("order_by_", lambda d, _: lists.order_by_(d, bucket), lambda d, _: sorted(d, key=bucket), False),
+    Case("order_by_descending_", lambda d, _: lists.order_by_descending_(d, bucket),
+         lambda d, _: sorted(d, key=bucket, reverse=True), False),
+    Case("take_", lambda d, _: lists.take_(d, 5), lambda d, _: d[:5], False),
+    Case("skip_", lambda d, _: lists.skip_(d, 5), lambda d, _: d[5:], False),
+    Case("group_by_", lambda d, _: lists.group_by_(d, bucket), lambda d, _: baseline_group_by(d, bucket), False),
+    Case("to_lookup_", lambda d, _: lists.to_lookup_(d, bucket), lambda d, _: baseline_group_by(d, bucket), False),
+    Case("join_", lambda d, _: lists.join_(d, range(10), bucket, bucket),
+         lambda d, _: baseline_join(d, list(range(10))), False),
+    Case("iterate_join_", lambda d, _: list(lists.iterate_join_(d, range(10), bucket, bucket)),
+         lambda d, _: baseline_join(d, list(range(10))), False),
+    Case("group_join_", lambda d, _: lists.group_join_(d, range(10), bucket, bucket),
+         lambda d, _: baseline_group_join(d, list(range(10))), False),
+    Case("iterate_group_join_", lambda d, _: list(lists.iterate_group_join_(d, range(10), bucket, bucket)),
+         lambda d, _: baseline_group_join(d, list(range(10))), False),
+    Case("aggregate_", lambda d, _: lists.aggregate_(d, operator.add), lambda d, _: reduce(operator.add, d), False),
+    Case("sum_", lambda d, _: lists.sum_(d, double), lambda d, _: sum(map(double, d)), False),
+    Case("min_by_", lambda d, _: lists.min_by_(d, bucket), lambda d, _: min(d, key=bucket), False),
+    Case("max_by_", lambda d, _: lists.max_by_(d, bucket), lambda d, _: max(d, key=bucket), False),
+    Case("count_by_", lambda d, _: lists.count_by_(d, bucket), lambda d, _: dict(Counter(map(bucket, d))), False),
+    Case("dicts.first_", lambda d, p: dicts.first_(d, p), lambda d, p: next((k, v) for k, v in d.items() if p(v)),
+         dictionary=True),
+    Case("dicts.first_or_none_", lambda d, p: dicts.first_or_none_(d, p),
+         lambda d, p: next(((k, v) for k, v in d.items() if p(v)), None), dictionary=True),
+    Case("dicts.get_key_by_index_", lambda d, _: dicts.get_key_by_index_(d, len(d) - 1),
+         lambda d, _: list(d)[len(d) - 1], False, True),
+    Case("dicts.get_key_value_by_index_", lambda d, _: dicts.get_key_value_by_index_(d, len(d) - 1),
+         lambda d, _: list(d.items())[len(d) - 1], False, True),
+    Case("IndexedDict.key_at", lambda d, _: d.key_at(len(d) - 1), lambda d, _: list(d)[len(d) - 1], False, indexed=True),
+    Case("IndexedDict.find_", lambda d, _: d.find_("bucket", 3),
+         lambda d, _: [(k, v) for k, v in d.items() if bucket(v) == 3], False, indexed=True),
+]
+
+
+def run(function: Callable[[], Any]) -> Any:
+    try:
+        return function()
+    except (ValueError, StopIteration):
+        # Both mean that nothing matched, spinq raises ValueError where the baselines leak StopIteration
+        return NOT_MATCHED
+
+
+def measure_case(function: Callable[[], Any], repeat: int) -> tuple[float, int, Any]:
+    result = run(function)
+    best = measure(lambda: run(function), repeat, min_seconds=0.05)
+    return best, measure_peak_memory(lambda: run(function)), result
+
+
+def predicate_for(scenario: str, size: int) -> Callable[[int], bool]:
+    target = {"hit-early": 0, "hit-late": size - 1, "no-hit": -1}.get(scenario, -1)
+    return lambda x: x == target
+
+
+def run_suite(sizes: list[int], operators: list[str] | None, repeat: int) -> list[Result]:
+    results = []
+    for size in sizes:
+        data = list(range(size))
+        dictionary = dict(zip(data, data))
+        indexed = IndexedDict(dictionary)
+        indexed.add_index("bucket", bucket)
+        for case in CASES:
+            if operators and case.operator not in operators:
+                continue
+            source = indexed if case.indexed else dictionary if case.dictionary else data
+            for scenario in (SCENARIOS if case.uses_predicate else (NO_SCENARIO,)):
+                predicate = predicate_for(scenario, size)
+                spinq_seconds, spinq_peak, spinq_result = measure_case(lambda: case.spinq(source, predicate), repeat)
+                baseline_seconds, baseline_peak, baseline_result = measure_case(lambda: case.baseline(source, predicate), repeat)
+                result = Result(case.operator, size, scenario, spinq_seconds, baseline_seconds,
+                                spinq_peak, baseline_peak, spinq_result == baseline_result)
+                print_result(result)
+                results.append(result)
+    return results
+
+
+def print_result(result: Result) -> None:
+    ratio = result.spinq_seconds / result.baseline_seconds if result.baseline_seconds else float("inf")
+    print(f"{result.operator:<30} {result.size:>10} {result.scenario:<10} "
+          f"spinq {format_seconds(result.spinq_seconds)} {result.spinq_peak_bytes / 1024:>10.1f} KiB   "
+          f"baseline {format_seconds(result.baseline_seconds)} {result.baseline_peak_bytes / 1024:>10.1f} KiB   "
+          f"{ratio:6.2f}x{'' if result.same_result else '   RESULTS DIFFER'}")
+    sys.stdout.flush()
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:9.1f} us"
+    return f"{seconds * 1e3:9.1f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark spinq operators against plain Python baselines.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="comma separated input sizes")
+    parser.add_argument("--operators", default="", help="comma separated operator names, all by default")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timing repeats, the best one is reported")
+    parser.add_argument("--json", dest="json_path", help="file to write the results to")
+    arguments = parser.parse_args()
+
+    sizes = [int(size) for size in arguments.sizes.split(",")]
+    operators = [name for name in arguments.operators.split(",") if name]
+    results = run_suite(sizes, operators, arguments.repeat)
+
+    if arguments.json_path:
+        with open(arguments.json_path, "w") as file:
+            json.dump([asdict(result) for result in results], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
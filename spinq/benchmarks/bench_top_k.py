@@ -0,0 +1,23 @@
+import random
+import sys
+
+from spinq.query import Query
+
+from timing import measure
+
+
+def main(size: int, count: int) -> None:
+    random.seed(0)
+    scores = [(random.randrange(1000), random.random()) for _ in range(size)]
+    cases = [
+        ("sorted()[:k]", lambda: sorted(scores, key=lambda x: x[0], reverse=True)[:count]),
+        ("take_ (heap)", lambda: Query(scores).order_by_descending_(lambda x: x[0]).take_(count).to_list_()),
+        ("sorted(tuple)", lambda: sorted(scores, key=lambda x: (x[0], x[1]))),
+        ("then_by_", lambda: Query(scores).order_by_(lambda x: x[0]).then_by_(lambda x: x[1]).to_list_()),
+    ]
+    for name, function in cases:
+        print(f"{name:<16} {measure(function) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000, int(sys.argv[2]) if len(sys.argv) > 2 else 10)
@@ -0,0 +1,27 @@
+import sys
+
+import numpy
+
+from spinq import lists
+from spinq.expressions import col
+
+from timing import measure
+
+
+def main(size: int) -> None:
+    array = numpy.random.default_rng(0).integers(0, 1000, size)
+    numbers = array.tolist()
+    cases = [
+        ("where_", lists.where_, lambda x: 100 < x < 500, (col > 100) & (col < 500)),
+        ("select_", lists.select_, lambda x: x * 2 + 1, col * 2 + 1),
+        ("any_ (no hit)", lists.any_, lambda x: x < 0, col < 0),
+        ("order_by_", lists.order_by_, lambda x: x % 100, col % 100),
+    ]
+    for name, operator, function, expression in cases:
+        python_elapsed = measure(lambda: operator(numbers, function))
+        array_elapsed = measure(lambda: operator(array, expression))
+        print(f"{name:<16} lambda {python_elapsed * 1000:9.1f} ms   expression {array_elapsed * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,42 @@
+"""
+Timing helpers shared by the benchmark scripts, which import them from this folder when run as
+python benchmarks/bench_<feature>.py.
+"""
+import time
+import tracemalloc
+from typing import Any, Callable
+
+MAX_LOOPS = 10_000
+
+
+def measure(function: Callable[[], Any], repeat: int = 1, number: int = 1, min_seconds: float = 0.0) -> float:
+    """
+    Returns the best seconds per call of the function out of repeat runs.
+    Each run calls the function number times and keeps calling it, until it takes at least min_seconds,
+    but no more than MAX_LOOPS times.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        loops = 0
+        started = time.perf_counter()
+        while True:
+            function()
+            loops += 1
+            elapsed = time.perf_counter() - started
+            if (loops >= number and elapsed >= min_seconds) or loops >= max(number, MAX_LOOPS):
+                break
+        best = min(best, elapsed / loops)
+    return best
+
+
+def measure_peak_memory(function: Callable[[], Any]) -> int:
+    """
+    Returns the peak bytes allocated by one call of the function, as traced by tracemalloc.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
@@ -1,5 +1,5 @@
 __author__ = "kostiantyn.chomakov@gmail.com"
 
-from . import lists, dicts
+from . import lists, dicts, query, expressions, vectorized, parallel, async_iterables, iterables, columnar, cache
 
-__all__ = ['lists', 'dicts']
\ No newline at end of file
+__all__ = ['lists', 'dicts', 'query', 'expressions', 'vectorized', 'parallel', 'async_iterables', 'iterables', 'columnar', 'cache']
\ No newline at end of file
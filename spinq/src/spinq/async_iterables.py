@@ -0,0 +1,159 @@
+import asyncio
+from collections import deque
+from contextlib import AbstractAsyncContextManager, aclosing, nullcontext
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Iterable
+from inspect import isawaitable
+from typing import Callable, TypeVar, Optional, Any
+
+from .expressions import as_callable
+from .lists import NOT_FOUND
+
+T = TypeVar('T')
+T2 = TypeVar('T2')
+
+type MaybeAwaitable[R] = R | Awaitable[R]
+
+
+async def where_(source: AsyncIterable[T],
+                 predicate: Callable[[T], MaybeAwaitable[bool]],
+                 max_concurrency: int = 1) -> AsyncIterator[T]:
+    """
+    Yields the matching items in the source order.
+    Up to max_concurrency async predicates are awaited at the same time.
+    """
+    async with aclosing(_evaluate(source, predicate, max_concurrency)) as evaluated:
+        async for x, matches in evaluated:
+            if matches:
+                yield x
+
+
+async def select_(source: AsyncIterable[T],
+                  selector: Callable[[T], MaybeAwaitable[T2]],
+                  max_concurrency: int = 1) -> AsyncIterator[T2]:
+    """
+    Yields the selected values in the source order.
+    Up to max_concurrency async selectors are awaited at the same time.
+    """
+    async with aclosing(_evaluate(source, selector, max_concurrency)) as evaluated:
+        async for _, value in evaluated:
+            yield value
+
+
+async def select_many_(source: AsyncIterable[T],
+                       selector: Callable[[T], MaybeAwaitable[Iterable[T2] | AsyncIterable[T2]]],
+                       max_concurrency: int = 1) -> AsyncIterator[T2]:
+    async with aclosing(_evaluate(source, selector, max_concurrency)) as evaluated:
+        async for _, transformed in evaluated:
+            if isinstance(transformed, AsyncIterable):
+                async for y in transformed:
+                    yield y
+            elif isinstance(transformed, Iterable) and not isinstance(transformed, str):
+                for y in transformed:
+                    yield y
+            else:
+                yield transformed
+
+
+async def first_(source: AsyncIterable[T], predicate: Optional[Callable[[T], MaybeAwaitable[bool]]] = None) -> T:
+    async with _filtered(source, predicate) as filtered:
+        async for x in filtered:
+            return x
+    raise ValueError("No elements match the predicate.")
+
+
+async def first_or_none_(source: AsyncIterable[T],
+                         predicate: Optional[Callable[[T], MaybeAwaitable[bool]]] = None) -> Optional[T]:
+    async with _filtered(source, predicate) as filtered:
+        async for x in filtered:
+            return x
+    return None
+
+
+async def any_(source: AsyncIterable[T], predicate: Optional[Callable[[T], MaybeAwaitable[bool]]] = None) -> bool:
+    async with _filtered(source, predicate) as filtered:
+        async for _ in filtered:
+            return True
+    return False
+
+
+async def all_(source: AsyncIterable[T], predicate: Callable[[T], MaybeAwaitable[bool]]) -> bool:
+    predicate = as_callable(predicate)
+    async for x in source:
+        if not await _resolve(predicate(x)):
+            return False
+    return True
+
+
+async def count_(source: AsyncIterable[T], predicate: Optional[Callable[[T], MaybeAwaitable[bool]]] = None) -> int:
+    count = 0
+    async with _filtered(source, predicate) as filtered:
+        async for _ in filtered:
+            count += 1
+    return count
+
+
+async def to_list_(source: AsyncIterable[T]) -> list[T]:
+    return [x async for x in source]
+
+
+async def aggregate_(source: AsyncIterable[T], func: Callable[[T2, T], MaybeAwaitable[T2]], seed: T2 = NOT_FOUND) -> T2:
+    accumulator = seed
+    async for x in source:
+        accumulator = x if accumulator is NOT_FOUND else await _resolve(func(accumulator, x))
+    if accumulator is NOT_FOUND:
+        raise ValueError("Sequence contains no elements.")
+    return accumulator
+
+
+async def sum_(source: AsyncIterable[T], selector: Optional[Callable[[T], MaybeAwaitable[Any]]] = None) -> Any:
+    selector = as_callable(selector)
+    total = 0
+    async for x in source:
+        total += x if selector is None else await _resolve(selector(x))
+    return total
+
+
+async def _resolve(value: MaybeAwaitable[T]) -> T:
+    return await value if isawaitable(value) else value
+
+
+async def _evaluate(source: AsyncIterable[T],
+                    function: Callable[[T], MaybeAwaitable[T2]],
+                    max_concurrency: int) -> AsyncIterator[tuple[T, T2]]:
+    """
+    Yields the items together with the function results in the source order.
+    Awaitable results are awaited with up to max_concurrency items in flight,
+    the pending ones are cancelled, when the iteration is closed early.
+    """
+    if max_concurrency < 1:
+        raise ValueError("Max concurrency must be positive.")
+    function = as_callable(function)
+
+    if max_concurrency == 1:
+        async for x in source:
+            result = function(x)
+            yield x, (await result if isawaitable(result) else result)
+        return
+
+    pending = deque[tuple[T, asyncio.Future]]()
+    try:
+        async for x in source:
+            if len(pending) >= max_concurrency:
+                item, future = pending.popleft()
+                yield item, await future
+            pending.append((x, asyncio.ensure_future(_resolve(function(x)))))
+        while pending:
+            item, future = pending.popleft()
+            yield item, await future
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def _filtered(source: AsyncIterable[T],
+              predicate: Optional[Callable[[T], MaybeAwaitable[bool]]]) -> AbstractAsyncContextManager[AsyncIterable[T]]:
+    """
+    Filters the source with where_, which is closed on exit, so returning early does not leave it to the garbage collector.
+    """
+    return nullcontext(source) if predicate is None else aclosing(where_(source, predicate))
+
@@ -0,0 +1,236 @@
+from collections import OrderedDict
+from collections.abc import Iterable, Hashable
+from threading import Lock
+from typing import Callable, TypeVar, Optional, Generic, Any
+
+from .expressions import Expression, Constant
+from .lists import Lookup
+from .query import Query
+
+T = TypeVar('T')
+T2 = TypeVar('T2')
+K = TypeVar('K')
+
+
+class QueryCache:
+    """
+    LRU cache of query results over datasets, which rarely change.
+    Results are keyed on the source, identified by its version or by the source object itself,
+    and on the structure of the query: the operators with their arguments, where it expressions are compared
+    structurally and other functions by identity, so lambdas created per call never hit the cache.
+    Cached results are shared between the callers and must not be modified.
+    Results of stale sources are removed by invalidate or evicted, when the cache is full.
+    """
+    __slots__ = ('maxsize', 'hits', 'misses', '_entries', '_lock')
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("Max size must be positive.")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict[tuple, tuple[Any, Any]]()
+        self._lock = Lock()
+
+    def query(self, source: Iterable[T], version: Optional[Hashable] = None) -> 'CachedQuery[T]':
+        """
+        Starts a cached query over the source.
+        Sources without version are identified by the object, so they must not be changed in place.
+        """
+        source_key = ('version', version) if version is not None else ('id', id(source))
+        return CachedQuery(self, source, source_key, Query(source), ())
+
+    def invalidate(self, source: Optional[Iterable[Any]] = None, version: Optional[Hashable] = None) -> None:
+        """
+        Removes the results of the source or of the version, or all results, when neither is given.
+        """
+        with self._lock:
+            if source is None and version is None:
+                self._entries.clear()
+                return
+            source_key = ('version', version) if version is not None else ('id', id(source))
+            for key in [key for key in self._entries if key[0] == source_key]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: tuple, source: Iterable[Any], evaluate: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        result = evaluate()
+        with self._lock:
+            # The source is kept alive with the result, so its id is not reused by another object meanwhile
+            self._entries[key] = (source, result)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+
+class CachedQuery(Generic[T]):
+    """
+    Query, which terminal operators return cached results of the same query over the same source.
+    to_lookup_ and find_ reuse a prebuilt hash index of the results instead of scanning them again.
+    """
+    __slots__ = ('_cache', '_source', '_source_key', '_query', '_key')
+
+    def __init__(self, cache: QueryCache, source: Iterable[Any], source_key: tuple, query: Query[T], key: tuple):
+        self._cache = cache
+        self._source = source
+        self._source_key = source_key
+        self._query = query
+        self._key = key
+
+    def where_(self, predicate: Callable[[T], bool]) -> 'CachedQuery[T]':
+        return self.__stage('where_', predicate)
+
+    def select_(self, selector: Callable[[T], T2]) -> 'CachedQuery[T2]':
+        return self.__stage('select_', selector)
+
+    def without_(self, predicate: Callable[[T], bool]) -> 'CachedQuery[T]':
+        return self.__stage('without_', predicate)
+
+    def distinct_(self) -> 'CachedQuery[T]':
+        return self.__stage('distinct_')
+
+    def distinct_by_(self, key_selector: Callable[[T], Any]) -> 'CachedQuery[T]':
+        return self.__stage('distinct_by_', key_selector)
+
+    def order_by_(self, key_selector: Callable[[T], Any]) -> 'CachedQuery[T]':
+        return self.__stage('order_by_', key_selector)
+
+    def order_by_descending_(self, key_selector: Callable[[T], Any]) -> 'CachedQuery[T]':
+        return self.__stage('order_by_descending_', key_selector)
+
+    def then_by_(self, key_selector: Callable[[T], Any]) -> 'CachedQuery[T]':
+        return self.__stage('then_by_', key_selector)
+
+    def then_by_descending_(self, key_selector: Callable[[T], Any]) -> 'CachedQuery[T]':
+        return self.__stage('then_by_descending_', key_selector)
+
+    def skip_(self, count: int) -> 'CachedQuery[T]':
+        return self.__stage('skip_', count)
+
+    def take_(self, count: int) -> 'CachedQuery[T]':
+        return self.__stage('take_', count)
+
+    def first_(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
+        return self.__terminal('first_', predicate)
+
+    def first_or_none_(self, predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        return self.__terminal('first_or_none_', predicate)
+
+    def last_(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
+        return self.__terminal('last_', predicate)
+
+    def last_or_none_(self, predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        return self.__terminal('last_or_none_', predicate)
+
+    def single_(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
+        return self.__terminal('single_', predicate)
+
+    def single_or_none_(self, predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        return self.__terminal('single_or_none_', predicate)
+
+    def any_(self, predicate: Optional[Callable[[T], bool]] = None) -> bool:
+        return self.__terminal('any_', predicate)
+
+    def all_(self, predicate: Callable[[T], bool]) -> bool:
+        return self.__terminal('all_', predicate)
+
+    def count_(self, predicate: Optional[Callable[[T], bool]] = None) -> int:
+        return self.__terminal('count_', predicate)
+
+    def to_list_(self) -> list[T]:
+        return self.__terminal('to_list_')
+
+    def to_lookup_(self, key_selector: Callable[[T], K]) -> Lookup[K, T]:
+        return self.__terminal('to_lookup_', key_selector)
+
+    def find_(self, key_selector: Callable[[T], K], key: K) -> list[T]:
+        """
+        Returns the items with the key, looked up in the cached to_lookup_ index of the query results.
+        """
+        return self.to_lookup_(key_selector)[key]
+
+    def sum_(self, selector: Optional[Callable[[T], Any]] = None) -> Any:
+        return self.__terminal('sum_', selector)
+
+    def min_by_(self, key_selector: Callable[[T], Any]) -> T:
+        return self.__terminal('min_by_', key_selector)
+
+    def max_by_(self, key_selector: Callable[[T], Any]) -> T:
+        return self.__terminal('max_by_', key_selector)
+
+    def count_by_(self, key_selector: Callable[[T], K]) -> dict[K, int]:
+        return self.__terminal('count_by_', key_selector)
+
+    def __stage(self, name: str, *arguments: Any) -> 'CachedQuery':
+        query = getattr(self._query, name)(*arguments)
+        operator_key = _operator_key(name, arguments)
+        key = None if self._key is None or operator_key is None else self._key + (operator_key,)
+        return CachedQuery(self._cache, self._source, self._source_key, query, key)
+
+    def __terminal(self, name: str, *arguments: Any) -> Any:
+        operator_key = _operator_key(name, arguments)
+        if self._key is None or operator_key is None:
+            return getattr(self._query, name)(*arguments)
+        key = (self._source_key, self._key, operator_key)
+        return self._cache._get(key, self._source, lambda: getattr(self._query, name)(*arguments))
+
+
+def _operator_key(name: str, arguments: tuple[Any, ...]) -> Optional[tuple]:
+    """
+    Returns the key of the operator with its arguments, or None, when the query cannot be cached,
+    because an argument or a constant of an expression cannot be converted into a hashable value.
+    """
+    try:
+        key = name, *map(_argument_key, arguments)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _argument_key(argument: Any) -> Hashable:
+    """
+    Returns the structural key of an expression, and the argument itself otherwise,
+    so functions are compared by identity.
+    """
+    if not isinstance(argument, Expression):
+        return argument
+    if isinstance(argument, Constant):
+        return Constant, _freeze(argument.value_)
+    key = [type(argument)]
+    for name in type(argument).__slots__:
+        value = getattr(argument, name)
+        if isinstance(value, tuple):
+            key.append(tuple(map(_argument_key, value)))
+        elif isinstance(value, dict):
+            key.append(tuple((item_key, _argument_key(item)) for item_key, item in value.items()))
+        else:
+            key.append(_argument_key(value))
+    return tuple(key)
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Converts the value into a hashable one, which is equal for equal values of the same types,
+    lists, tuples, dicts and sets are converted item by item into tuples and frozensets.
+    Raises TypeError for other values, which are not hashable.
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(map(_freeze, value))
+    if isinstance(value, dict):
+        return type(value), frozenset((_freeze(key), _freeze(item)) for key, item in value.items())
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(map(_freeze, value))
+    hash(value)
+    return type(value), value
@@ -0,0 +1,253 @@
+import math
+import operator
+from array import array
+from collections.abc import Sequence
+from itertools import compress
+from operator import attrgetter, itemgetter
+from typing import Callable, TypeVar, Generic, Optional, Any
+
+from .expressions import (Expression, Constant, UnaryOperation, BinaryOperation, COMPARISON_OPERATORS, compile_fields,
+                          as_callable, field_name)
+from .vectorized import argsort
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+T = TypeVar('T')
+
+INT64_MAX = 2 ** 63 - 1
+
+
+class Columns:
+    """
+    Values of the record fields stored column by column.
+    Numeric fields are NumPy arrays, when NumPy is installed, or arrays of the array module otherwise.
+    Other fields are lists. Columns are converted on first use, so unused fields cost nothing.
+    """
+    __slots__ = ('records', '_get_field', '_columns')
+
+    def __init__(self, records: Sequence[Any]):
+        self.records = records
+        self._get_field = itemgetter if records and isinstance(records[0], dict) else attrgetter
+        self._columns = dict[str, Any]()
+
+    def get(self, field: str) -> Any:
+        column = self._columns.get(field)
+        if column is None:
+            column = self._columns[field] = _to_column(list(map(self._get_field(field), self.records)))
+        return column
+
+
+class ColumnarQuery(Generic[T]):
+    """
+    Query over a list of dicts or objects, which evaluates it expressions over fields, e.g. it.price > 10,
+    on the columns of the referenced fields instead of on each record.
+    Operators only narrow down or reorder the selected row numbers, the records are materialized by terminal operators.
+    Other predicates and selectors are called with the records.
+    """
+    __slots__ = ('_columns', '_rows')
+
+    def __init__(self, columns: Columns, rows: Any = None):
+        self._columns = columns
+        self._rows = rows
+
+    def where_(self, predicate: Callable[[T], bool]) -> 'ColumnarQuery[T]':
+        rows = self.__rows()
+        mask = self.__evaluate(predicate)
+        if _is_array(mask) and mask.dtype.kind == 'b':
+            return ColumnarQuery(self._columns, rows[mask])
+        return ColumnarQuery(self._columns, _to_rows(compress(rows, mask)))
+
+    def order_by_(self, key_selector: Callable[[T], Any]) -> 'ColumnarQuery[T]':
+        return self.__order_by(key_selector, False)
+
+    def order_by_descending_(self, key_selector: Callable[[T], Any]) -> 'ColumnarQuery[T]':
+        return self.__order_by(key_selector, True)
+
+    def take_(self, count: int) -> 'ColumnarQuery[T]':
+        return ColumnarQuery(self._columns, self.__rows()[:max(count, 0)])
+
+    def select_(self, selector: Callable[[T], Any]) -> list[Any]:
+        values = self.__evaluate(selector)
+        return values.tolist() if _is_array(values) else list(values)
+
+    def column_(self, field: str) -> Any:
+        """
+        Returns the values of the field for the selected rows, as a NumPy array for numeric fields, when NumPy is installed.
+        """
+        return _take(self._columns.get(field), self.__rows())
+
+    def group_by_(self, key_selector: Callable[[T], Any]) -> dict[Any, list[T]]:
+        keys = self.__evaluate(key_selector)
+        records = self._columns.records
+        groups = {}
+        for key, row in zip(keys.tolist() if _is_array(keys) else keys, _to_list(self.__rows())):
+            group = groups.get(key)
+            if group is None:
+                groups[key] = [records[row]]
+            else:
+                group.append(records[row])
+        return groups
+
+    def count_(self) -> int:
+        return len(self.__rows())
+
+    def first_or_none_(self) -> Optional[T]:
+        rows = self.__rows()
+        return self._columns.records[int(rows[0])] if len(rows) else None
+
+    def to_list_(self) -> list[T]:
+        records = self._columns.records
+        if self._rows is None:
+            return list(records)
+        return [records[row] for row in _to_list(self._rows)]
+
+    def __order_by(self, key_selector: Callable[[T], Any], descending: bool) -> 'ColumnarQuery[T]':
+        rows = self.__rows()
+        keys = self.__evaluate(key_selector)
+        if _is_array(keys):
+            return ColumnarQuery(self._columns, _take(rows, argsort(keys, descending)))
+
+        keys = list(keys)
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=descending)
+        return ColumnarQuery(self._columns, _take(rows, order))
+
+    def __rows(self) -> Any:
+        if self._rows is None:
+            self._rows = _to_rows(range(len(self._columns.records)))
+        return self._rows
+
+    def __evaluate(self, expression: Callable[[T], Any]) -> Any:
+        """
+        Returns the values of the expression for the selected rows,
+        computed on whole NumPy columns, when possible, otherwise row by row over the columns.
+        Columns are not used, when the integer values can exceed int64 or NumPy reports a division by zero or an overflow,
+        so the results and the errors are the same as of the row by row evaluation.
+        Functions and expressions, which use the record itself, are called with the records.
+        """
+        rows = self.__rows()
+        try:
+            fields, function = compile_fields(expression) if isinstance(expression, Expression) else ((), None)
+        except ValueError:
+            fields, function = (), None
+        if function is None:
+            records = self._columns.records
+            return map(as_callable(expression), (records[row] for row in _to_list(rows)))
+
+        columns = [_take(self._columns.get(field), rows) for field in fields]
+        if columns and all(_is_array(column) for column in columns) and _fits_int64(expression, fields, columns):
+            try:
+                with numpy.errstate(all='raise'):
+                    values = function(*columns)
+                if _is_array(values) and values.shape == (len(rows),):
+                    return values
+            except (TypeError, ValueError, AttributeError, FloatingPointError):
+                pass
+        if not fields:
+            return [function()] * len(rows)
+        return map(function, *(_to_list(column) for column in columns))
+
+
+def columnar(records: Sequence[T]) -> ColumnarQuery[T]:
+    return ColumnarQuery(Columns(records))
+
+
+def _fits_int64(expression: Expression, fields: tuple[str, ...], columns: list[Any]) -> bool:
+    """
+    Checks that the integer values of the expression and of all its subexpressions stay within int64 for the columns,
+    because NumPy integers wrap around silently.
+    """
+    magnitude = _magnitude(expression, dict(zip(fields, map(_column_magnitude, columns))))
+    return magnitude is None or magnitude <= INT64_MAX
+
+
+def _column_magnitude(column: Any) -> int | None:
+    if column.dtype.kind == 'f':
+        return None
+    if column.dtype.kind == 'b' or len(column) == 0:
+        return 1
+    return max(-int(column.min()), int(column.max()))
+
+
+def _magnitude(expression: Expression, magnitudes: dict[str, int | None]) -> int | float | None:
+    """
+    Returns the largest absolute value, which the expression can have for the columns with the given magnitudes,
+    None for floating point values and math.inf, when the bound is not known or any subexpression exceeds int64.
+    """
+    field = field_name(expression)
+    if field is not None:
+        return magnitudes[field]
+
+    match expression:
+        case Constant(value_=float()):
+            return None
+        case Constant(value_=int(value)):
+            return abs(value)
+        case UnaryOperation(operator_=operator_function, operand_=operand):
+            magnitude = _magnitude(operand, magnitudes)
+            return magnitude + 1 if magnitude is not None and operator_function is operator.invert else magnitude
+        case BinaryOperation(operator_=operator_function, left_=left, right_=right):
+            left, right = _magnitude(left, magnitudes), _magnitude(right, magnitudes)
+            if left == math.inf or right == math.inf or (left or 0) > INT64_MAX or (right or 0) > INT64_MAX:
+                return math.inf
+            if operator_function in COMPARISON_OPERATORS:
+                return 1
+            if left is None or right is None or operator_function is operator.truediv:
+                return None
+            return _binary_magnitude(operator_function, left, right)
+        case _:
+            return math.inf
+
+
+def _binary_magnitude(operator_function: Callable[[Any, Any], Any], left: int, right: int) -> int | float:
+    match operator_function:
+        case operator.add | operator.sub:
+            return left + right
+        case operator.mul:
+            return left * right
+        case operator.floordiv:
+            return left
+        case operator.mod:
+            return right
+        case operator.pow:
+            return math.inf if left > 1 and right * left.bit_length() > 64 else left ** right
+        case operator.and_ | operator.or_ | operator.xor:
+            return (1 << max(left, right).bit_length()) - 1
+        case _:
+            return math.inf
+
+
+def _to_column(values: list[Any]) -> Any:
+    value_types = set(map(type, values))
+    if len(value_types) != 1 or value_types.isdisjoint({int, float, bool}):
+        return values
+    try:
+        if numpy is not None:
+            return numpy.array(values, dtype={int: numpy.int64, float: numpy.float64, bool: numpy.bool_}[value_types.pop()])
+        if value_types == {bool}:
+            return values
+        return array('q' if value_types == {int} else 'd', values)
+    except OverflowError:
+        return values
+
+
+def _to_rows(rows: Any) -> Any:
+    if numpy is not None:
+        return numpy.fromiter(rows, dtype=numpy.intp)
+    return array('q', rows)
+
+
+def _take(column: Any, rows: Any) -> Any:
+    if _is_array(column):
+        return column[rows]
+    return [column[row] for row in _to_list(rows)]
+
+
+def _to_list(values: Any) -> list[Any]:
+    return values.tolist() if _is_array(values) or isinstance(values, array) else values
+
+
+def _is_array(values: Any) -> bool:
+    return numpy is not None and isinstance(values, numpy.ndarray)
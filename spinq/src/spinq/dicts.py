@@ -1,29 +1,137 @@
+from collections.abc import MutableMapping, Iterator, Hashable
 from itertools import islice
-from typing import Callable, TypeVar, Optional
+from typing import Callable, TypeVar, Optional, Any
+
+from .expressions import as_callable
 
 K = TypeVar('K')
 V = TypeVar('V')
 
-def first_(dictionary: dict[K, V], predicate: Callable[[V], bool] = lambda x: True) -> tuple[K, V]:
-    try:
-        return next(((k, v) for k, v in dictionary.items() if predicate(v)))
-    except StopIteration:
+
+class IndexedDict(MutableMapping[K, V]):
+    """
+    Dictionary, which keeps its keys in a list for O(1) positional access
+    and maintains secondary indexes of values for repeated lookups by a selected value.
+    Indexes remember the selected value of each key, so a value mutated in place can still be replaced or deleted,
+    but it is found by its old selected value until it is set again.
+    Deleting a key costs O(n), because the keys after it are shifted.
+    """
+    __slots__ = ('_items', '_keys', '_indexes')
+
+    def __init__(self, items: Any = ()):
+        self._items = dict[K, V]()
+        self._keys = list[K]()
+        self._indexes = dict[str, tuple[Callable[[V], Hashable], dict[Hashable, dict[K, None]], dict[K, Hashable]]]()
+        self.update(items)
+
+    def __getitem__(self, key: K) -> V:
+        return self._items[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if key in self._items:
+            self.__unindex(key)
+        else:
+            self._keys.append(key)
+        self._items[key] = value
+        self.__index(key, value)
+
+    def __delitem__(self, key: K) -> None:
+        del self._items[key]
+        self._keys.remove(key)
+        self.__unindex(key)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._items
+
+    def __repr__(self) -> str:
+        return f"IndexedDict({self._items!r})"
+
+    def key_at(self, index: int) -> K:
+        try:
+            return self._keys[index]
+        except IndexError:
+            raise ValueError("Index out of range.")
+
+    def item_at(self, index: int) -> tuple[K, V]:
+        key = self.key_at(index)
+        return key, self._items[key]
+
+    def add_index(self, name: str, value_selector: Callable[[V], Hashable]) -> None:
+        value_selector = as_callable(value_selector)
+        index = dict[Hashable, dict[K, None]]()
+        indexed_values = dict[K, Hashable]()
+        for key, value in self._items.items():
+            indexed_value = indexed_values[key] = value_selector(value)
+            index.setdefault(indexed_value, {})[key] = None
+        self._indexes[name] = (value_selector, index, indexed_values)
+
+    def find_(self, index_name: str, indexed_value: Hashable) -> list[tuple[K, V]]:
+        """
+        Returns the items, for which the value selector of the index returns the indexed value.
+        """
+        keys = self.__get_index(index_name).get(indexed_value, {})
+        return [(key, self._items[key]) for key in keys]
+
+    def find_first_or_none_(self, index_name: str, indexed_value: Hashable) -> Optional[tuple[K, V]]:
+        keys = self.__get_index(index_name).get(indexed_value)
+        if not keys:
+            return None
+        key = next(iter(keys))
+        return key, self._items[key]
+
+    def __get_index(self, name: str) -> dict[Hashable, dict[K, None]]:
+        try:
+            return self._indexes[name][1]
+        except KeyError:
+            raise ValueError(f"Index {name} does not exist.")
+
+    def __index(self, key: K, value: V) -> None:
+        for value_selector, index, indexed_values in self._indexes.values():
+            indexed_value = indexed_values[key] = value_selector(value)
+            index.setdefault(indexed_value, {})[key] = None
+
+    def __unindex(self, key: K) -> None:
+        for _, index, indexed_values in self._indexes.values():
+            indexed_value = indexed_values.pop(key)
+            keys = index[indexed_value]
+            del keys[key]
+            if not keys:
+                del index[indexed_value]
+
+
+def first_(dictionary: dict[K, V], predicate: Optional[Callable[[V], bool]] = None) -> tuple[K, V]:
+    found = first_or_none_(dictionary, predicate)
+    if found is None:
         raise ValueError("No elements match the predicate.")
+    return found
 
 
-def first_or_none_(dictionary: dict[K, V], predicate: Callable[[V], bool] = lambda x: True) -> Optional[tuple[K, V]]:
+def first_or_none_(dictionary: dict[K, V], predicate: Optional[Callable[[V], bool]] = None) -> Optional[tuple[K, V]]:
+    if predicate is None:
+        return next(iter(dictionary.items()), None)
+    predicate = as_callable(predicate)
     return next(((k, v) for k, v in dictionary.items() if predicate(v)), None)
 
 
-def get_key_by_index_(dictionary: dict[K, V], index: int) -> tuple[K, V]:
+def get_key_by_index_(dictionary: dict[K, V], index: int) -> K:
+    if isinstance(dictionary, IndexedDict):
+        return dictionary.key_at(index)
     try:
         return next(islice(dictionary, index, index + 1))
-    except IndexError:
+    except StopIteration:
         raise ValueError("Index out of range.")
 
 
 def get_key_value_by_index_(dictionary: dict[K, V], index: int) -> tuple[K, V]:
+    if isinstance(dictionary, IndexedDict):
+        return dictionary.item_at(index)
     try:
         return next(islice(dictionary.items(), index, index + 1))
-    except IndexError:
+    except StopIteration:
         raise ValueError("Index out of range.")
\ No newline at end of file
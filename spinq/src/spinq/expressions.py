@@ -0,0 +1,374 @@
+import keyword
+import math
+import operator
+from typing import Any, Callable
+
+BINARY_OPERATOR_SYMBOLS = {
+    operator.lt: "<", operator.le: "<=", operator.gt: ">", operator.ge: ">=", operator.eq: "==", operator.ne: "!=",
+    operator.add: "+", operator.sub: "-", operator.mul: "*", operator.truediv: "/", operator.floordiv: "//",
+    operator.mod: "%", operator.pow: "**", operator.and_: "&", operator.or_: "|", operator.xor: "^"
+}
+UNARY_OPERATOR_SYMBOLS = {operator.neg: "-", operator.pos: "+", operator.invert: "~"}
+COMPARISON_OPERATORS = {operator.lt, operator.le, operator.gt, operator.ge, operator.eq, operator.ne}
+
+ELEMENT_NAME = "it"
+
+
+class Expression:
+    """
+    Node of an introspectable expression tree, which is built by applying operators to it,
+    e.g. (it.price > 10) & (it.name.lower() != "test") or it["price"] * 2.
+    The tree is compiled into a single generated function on first use, which is available as function_.
+    spinq operators call function_ directly, and calling the expression evaluates it for a single item as well,
+    except for attribute expressions, calling which builds a method call expression.
+    Vectorized backends evaluate the same tree on whole arrays.
+    """
+    __slots__ = ('_function',)
+
+    def __init__(self):
+        self._function = None
+
+    @property
+    def function_(self) -> Callable[[Any], Any]:
+        if self._function is None:
+            self._function = _compile(self)
+        return self._function
+
+    def __call__(self, item: Any) -> Any:
+        return self.function_(item)
+
+    def __getattr__(self, name: str) -> 'Attribute':
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return Attribute(self, name)
+
+    def __getitem__(self, key: Any) -> 'Item':
+        return Item(self, key)
+
+    def __lt__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.lt, self, other)
+
+    def __le__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.le, self, other)
+
+    def __gt__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.gt, self, other)
+
+    def __ge__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.ge, self, other)
+
+    def __eq__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.eq, self, other)
+
+    def __ne__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.ne, self, other)
+
+    def __add__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.add, self, other)
+
+    def __radd__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.add, other, self)
+
+    def __sub__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.sub, self, other)
+
+    def __rsub__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.sub, other, self)
+
+    def __mul__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.mul, self, other)
+
+    def __rmul__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.mul, other, self)
+
+    def __truediv__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.truediv, self, other)
+
+    def __rtruediv__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.truediv, other, self)
+
+    def __floordiv__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.floordiv, self, other)
+
+    def __rfloordiv__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.floordiv, other, self)
+
+    def __mod__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.mod, self, other)
+
+    def __rmod__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.mod, other, self)
+
+    def __pow__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.pow, self, other)
+
+    def __rpow__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.pow, other, self)
+
+    def __and__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.and_, self, other)
+
+    def __rand__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.and_, other, self)
+
+    def __or__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.or_, self, other)
+
+    def __ror__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.or_, other, self)
+
+    def __xor__(self, other: Any) -> 'BinaryOperation':
+        return BinaryOperation(operator.xor, self, other)
+
+    def __neg__(self) -> 'UnaryOperation':
+        return UnaryOperation(operator.neg, self)
+
+    def __pos__(self) -> 'UnaryOperation':
+        return UnaryOperation(operator.pos, self)
+
+    def __abs__(self) -> 'UnaryOperation':
+        return UnaryOperation(operator.abs, self)
+
+    def __invert__(self) -> 'UnaryOperation':
+        return UnaryOperation(operator.invert, self)
+
+    def __bool__(self) -> bool:
+        raise TypeError("Expressions cannot be used as booleans, combine conditions with &, | and ~ instead of and, or and not.")
+
+    def __repr__(self) -> str:
+        return _to_source(self, None)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Leaves out the compiled function, which cannot be pickled, so expressions can be sent to worker processes.
+        """
+        return {name: getattr(self, name) for cls in type(self).__mro__ for name in getattr(cls, '__slots__', ())
+                if name != '_function'}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._function = None
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    __hash__ = object.__hash__
+
+
+class Element(Expression):
+    """
+    The item the expression is evaluated for.
+    """
+    __slots__ = ()
+
+
+class Constant(Expression):
+    __slots__ = ('value_',)
+
+    def __init__(self, value: Any):
+        super().__init__()
+        self.value_ = value
+
+
+class Attribute(Expression):
+    __slots__ = ('target_', 'name_')
+
+    def __init__(self, target: Expression, name: str):
+        if not _is_identifier(name):
+            raise ValueError(f"{name} is not a valid attribute name.")
+        super().__init__()
+        self.target_ = target
+        self.name_ = name
+
+    def __call__(self, *args: Any, **kwargs: Any) -> 'MethodCall':
+        return MethodCall(self.target_, self.name_, args, kwargs)
+
+
+class Item(Expression):
+    __slots__ = ('target_', 'key_')
+
+    def __init__(self, target: Expression, key: Any):
+        super().__init__()
+        self.target_ = target
+        self.key_ = key
+
+
+class MethodCall(Expression):
+    __slots__ = ('target_', 'name_', 'arguments_', 'keyword_arguments_')
+
+    def __init__(self, target: Expression, name: str, arguments: tuple[Any, ...], keyword_arguments: dict[str, Any]):
+        if not all(_is_identifier(key) for key in keyword_arguments):
+            raise ValueError("Keyword argument names must be valid identifiers.")
+        super().__init__()
+        self.target_ = target
+        self.name_ = name
+        self.arguments_ = tuple(as_expression(argument) for argument in arguments)
+        self.keyword_arguments_ = {key: as_expression(value) for key, value in keyword_arguments.items()}
+
+
+class UnaryOperation(Expression):
+    __slots__ = ('operator_', 'operand_')
+
+    def __init__(self, operator_function: Callable[[Any], Any], operand: Expression):
+        super().__init__()
+        self.operator_ = operator_function
+        self.operand_ = operand
+
+
+class BinaryOperation(Expression):
+    __slots__ = ('operator_', 'left_', 'right_')
+
+    def __init__(self, operator_function: Callable[[Any, Any], Any], left: Any, right: Any):
+        super().__init__()
+        self.operator_ = operator_function
+        self.left_ = as_expression(left)
+        self.right_ = as_expression(right)
+
+
+def as_expression(value: Any) -> Expression:
+    return value if isinstance(value, Expression) else Constant(value)
+
+
+def as_callable(function: Callable[[Any], Any] | None) -> Callable[[Any], Any] | None:
+    """
+    Returns the compiled function of an expression and any other function as is.
+    """
+    return function.function_ if isinstance(function, Expression) else function
+
+
+def compile_fields(expression: Expression) -> tuple[tuple[str, ...], Callable[..., Any]]:
+    """
+    Compiles the expression into a function of the values of the item fields it references,
+    e.g. it.price > 10 into lambda price: (price > 10), and returns the field names in the order of the arguments.
+    it.name and it["name"] both reference the field name. Raises ValueError, if the expression uses the item itself.
+    """
+    constants = {}
+    fields = {}
+    source = _to_source(as_expression(expression), constants, fields)
+    function = eval(f"lambda {', '.join(fields.values())}: {source}", {"__builtins__": GENERATED_BUILTINS, **constants})
+    return tuple(fields), function
+
+
+def _compile(expression: Expression) -> Callable[[Any], Any]:
+    """
+    Generates the source code of a lambda, which evaluates the whole tree without intermediate calls,
+    e.g. lambda it: (it.price > 10).
+    Simple attribute and item lookups of the item are compiled to operator.attrgetter and operator.itemgetter.
+    """
+    match expression:
+        case Attribute() if _is_attribute_path(expression):
+            return operator.attrgetter(_attribute_path(expression))
+        case Item(target_=Element(), key_=key) if not isinstance(key, Expression):
+            return operator.itemgetter(key)
+
+    constants = {}
+    source = _to_source(expression, constants)
+    return eval(f"lambda {ELEMENT_NAME}: {source}", {"__builtins__": GENERATED_BUILTINS, **constants})
+
+
+def _to_source(expression: Expression,
+               constants: dict[str, Any] | None,
+               fields: dict[str, str] | None = None) -> str:
+    """
+    Renders the expression as Python source, non-literal constants are referenced by names added to constants.
+    When fields are given, the fields of the item are rendered as variables, which names are added to fields.
+    """
+    def render(node: Expression) -> str:
+        return _to_source(node, constants, fields)
+
+    if fields is not None and (field := field_name(expression)) is not None:
+        return fields.setdefault(field, f"_f{len(fields)}")
+
+    match expression:
+        case Element():
+            if fields is not None:
+                raise ValueError(f"Expression {expression!r} uses the item itself instead of its fields.")
+            return ELEMENT_NAME
+        case Constant(value_=value):
+            if constants is not None and not _is_literal(value):
+                name = f"_c{len(constants)}"
+                constants[name] = value
+                return name
+            return repr(value)
+        case Attribute(target_=target, name_=name):
+            return f"{render(target)}.{name}"
+        case Item(target_=target, key_=key):
+            return f"{render(target)}[{render(as_expression(key))}]"
+        case MethodCall(target_=target, name_=name, arguments_=arguments, keyword_arguments_=keyword_arguments):
+            rendered_arguments = [render(argument) for argument in arguments]
+            rendered_arguments += [f"{key}={render(value)}" for key, value in keyword_arguments.items()]
+            return f"{render(target)}.{name}({', '.join(rendered_arguments)})"
+        case UnaryOperation(operator_=operator_function, operand_=operand):
+            if operator_function is operator.abs:
+                return f"abs({render(operand)})"
+            if operator_function is operator.invert and constants is not None:
+                return f"(not {render(operand)})" if _is_condition(operand) else f"_invert({render(operand)})"
+            return f"({UNARY_OPERATOR_SYMBOLS[operator_function]}{render(operand)})"
+        case BinaryOperation(operator_=operator_function, left_=left, right_=right):
+            return f"({render(left)} {BINARY_OPERATOR_SYMBOLS[operator_function]} {render(right)})"
+        case _:
+            raise TypeError(f"Unsupported expression {type(expression).__name__}.")
+
+
+def field_name(expression: Expression) -> str | None:
+    """
+    Returns the name of the item field, which the expression looks up, e.g. price for it.price and it["price"], or None.
+    """
+    match expression:
+        case Attribute(target_=Element(), name_=name):
+            return name
+        case Item(target_=Element(), key_=str(key)):
+            return key
+        case _:
+            return None
+
+
+def _is_identifier(name: str) -> bool:
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _is_literal(value: Any) -> bool:
+    if type(value) is float:
+        return math.isfinite(value)
+    return value is None or type(value) in (bool, int, str, bytes)
+
+
+def _is_condition(expression: Expression) -> bool:
+    """
+    Checks, if the expression is a comparison or a combination of comparisons with &, | and ~, which is a bool per item.
+    """
+    match expression:
+        case BinaryOperation(operator_=operator_function) if operator_function in COMPARISON_OPERATORS:
+            return True
+        case BinaryOperation(operator_=operator.and_ | operator.or_, left_=left, right_=right):
+            return _is_condition(left) and _is_condition(right)
+        case UnaryOperation(operator_=operator.invert, operand_=operand):
+            return _is_condition(operand)
+        case _:
+            return False
+
+
+def _invert(value: Any) -> Any:
+    """
+    Negates bools logically, as ~ does for NumPy bool arrays, and inverts other values bitwise.
+    """
+    return not value if type(value) is bool else ~value
+
+
+GENERATED_BUILTINS = {"abs": abs, "_invert": _invert}
+
+
+def _is_attribute_path(expression: Expression) -> bool:
+    while isinstance(expression, Attribute):
+        expression = expression.target_
+    return isinstance(expression, Element)
+
+
+def _attribute_path(expression: Attribute) -> str:
+    names = []
+    while isinstance(expression, Attribute):
+        names.append(expression.name_)
+        expression = expression.target_
+    return ".".join(reversed(names))
+
+
+it = Element()
+col = it
@@ -0,0 +1,86 @@
+from collections import deque
+from collections.abc import Iterable, Iterator
+from itertools import accumulate, groupby, islice, pairwise
+from typing import Callable, TypeVar, Optional, Any
+
+from .expressions import as_callable
+from .lists import NOT_FOUND
+
+T = TypeVar('T')
+T2 = TypeVar('T2')
+
+BYTES_LIKE = (bytes, bytearray, memoryview)
+
+
+def chunk_(sequence: Iterable[T], size: int) -> Iterator[list[T] | memoryview]:
+    """
+    Yields consecutive chunks of at most size items.
+    Chunks of bytes-like sequences are memoryview slices of the same buffer, so nothing is copied.
+    """
+    _validate_positive(size, "Size")
+    if isinstance(sequence, BYTES_LIKE):
+        view = memoryview(sequence)
+        return (view[start:start + size] for start in range(0, len(view), size))
+    return _iterate_chunks(iter(sequence), size)
+
+
+def window_(sequence: Iterable[T], size: int, step: int = 1) -> Iterator[tuple[T, ...] | memoryview]:
+    """
+    Yields windows of exactly size items, which start step items apart.
+    Windows of bytes-like sequences are memoryview slices of the same buffer, so nothing is copied.
+    """
+    _validate_positive(size, "Size")
+    _validate_positive(step, "Step")
+    if isinstance(sequence, BYTES_LIKE):
+        view = memoryview(sequence)
+        return (view[start:start + size] for start in range(0, len(view) - size + 1, step))
+    return _iterate_windows(iter(sequence), size, step)
+
+
+def pairwise_(sequence: Iterable[T]) -> Iterator[tuple[T, T]]:
+    return pairwise(sequence)
+
+
+def zip_(sequence: Iterable[T], *others: Iterable[Any], strict: bool = False) -> Iterator[tuple[Any, ...]]:
+    return zip(sequence, *others, strict=strict)
+
+
+def scan_(sequence: Iterable[T], func: Callable[[T2, T], T2], seed: T2 = NOT_FOUND) -> Iterator[T2]:
+    """
+    Yields the running aggregate after each item, the seed itself is not yielded.
+    """
+    if seed is NOT_FOUND:
+        return accumulate(sequence, func)
+    return islice(accumulate(sequence, func, initial=seed), 1, None)
+
+
+def distinct_until_changed_(sequence: Iterable[T], key_selector: Optional[Callable[[T], Any]] = None) -> Iterator[T]:
+    """
+    Yields the items, which differ from the previous item, or which key differs from the key of the previous item.
+    """
+    return (next(group) for _, group in groupby(sequence, as_callable(key_selector)))
+
+
+def _iterate_chunks(iterator: Iterator[T], size: int) -> Iterator[list[T]]:
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _iterate_windows(iterator: Iterator[T], size: int, step: int) -> Iterator[tuple[T, ...]]:
+    window = deque(islice(iterator, size), maxlen=size)
+    if len(window) < size:
+        return
+    yield tuple(window)
+    if step == 1:
+        for x in iterator:
+            window.append(x)
+            yield tuple(window)
+        return
+    while len(items := tuple(islice(iterator, step))) == step:
+        window.extend(items)
+        yield tuple(window)
+
+
+def _validate_positive(value: int, name: str) -> None:
+    if value < 1:
+        raise ValueError(f"{name} must be positive.")
@@ -1,95 +1,297 @@
-from typing import Callable, TypeVar, Optional
-from collections.abc import Iterable
+from collections import Counter, defaultdict
+from functools import reduce
+from itertools import chain, islice, filterfalse
+from typing import Callable, TypeVar, Optional, Any
+from collections.abc import Iterable, Iterator, Hashable
+
+from . import vectorized
+from .expressions import Expression, as_callable
 
 T = TypeVar('T')
 T2 = TypeVar('T2')
+K = TypeVar('K', bound=Hashable)
+R = TypeVar('R')
+
+NOT_FOUND = object()
+
+
+class HashAwareSet:
+    """
+    Set, which keeps hashable items in a hash set and falls back to a list with linear lookup for unhashable items.
+    Items are found by equality across both, e.g. {1} is found after frozenset({1}) was added and the other way round,
+    at the cost of a linear scan of the hashable items for each unhashable one.
+    """
+    __slots__ = ('_hashable', '_unhashable')
+
+    def __init__(self, items: Iterable[Any] = ()):
+        self._hashable = set()
+        self._unhashable = []
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            if item in self._hashable:
+                return True
+        except TypeError:
+            return item in self._unhashable or any(hashable == item for hashable in self._hashable)
+        return bool(self._unhashable) and item in self._unhashable
+
+    def __len__(self) -> int:
+        return len(self._hashable) + len(self._unhashable)
+
+    def add(self, item: Any) -> bool:
+        """
+        Adds the item and returns True, if it was not in the set yet.
+        """
+        try:
+            if item in self._hashable or (self._unhashable and item in self._unhashable):
+                return False
+            self._hashable.add(item)
+            return True
+        except TypeError:
+            if item in self._unhashable or any(hashable == item for hashable in self._hashable):
+                return False
+            self._unhashable.append(item)
+            return True
+
 
-def first_(sequence: list[T], predicate: Callable[[T], bool] = lambda x: True) -> T:
-    try:
-        return next((x for x in sequence if predicate(x)))
-    except StopIteration:
+class Lookup(dict[K, list[T]]):
+    """
+    Dictionary of groups, which returns an empty list for the keys without items instead of raising KeyError.
+    """
+    def __missing__(self, key: K) -> list[T]:
+        return []
+
+
+def first_(sequence: list[T], predicate: Optional[Callable[[T], bool]] = None) -> T:
+    found = next(_filtered(sequence, predicate), NOT_FOUND)
+    if found is NOT_FOUND:
         raise ValueError("No elements match the predicate.")
+    return found
 
-def first_or_none_(sequence: list[T], predicate: Callable[[T], bool] = lambda x: True) -> Optional[T]:
-    return next((x for x in sequence if predicate(x)), None)
+def first_or_none_(sequence: list[T], predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+    return next(_filtered(sequence, predicate), None)
 
-def first_or_none_with_index_(sequence: list[T], predicate: Callable[[T], bool] = lambda x: True) -> Optional[tuple[int, T]]:
+def first_or_none_with_index_(sequence: list[T], predicate: Optional[Callable[[T], bool]] = None) -> Optional[tuple[int, T]]:
+    if predicate is None:
+        return next(enumerate(sequence), None)
+    predicate = as_callable(predicate)
     return next(((index, x) for index, x in enumerate(sequence) if predicate(x)), None)
 
-def last_(sequence: list[T], predicate: Callable[[T], bool] = lambda x: True) -> T:
-    try:
-        return next((x for x in reversed(sequence) if predicate(x)))
-    except StopIteration:
+def last_(sequence: list[T], predicate: Optional[Callable[[T], bool]] = None) -> T:
+    found = next(_filtered(reversed(sequence), predicate), NOT_FOUND)
+    if found is NOT_FOUND:
         raise ValueError("No elements match the predicate.")
+    return found
 
-def last_or_none_(sequence: list[T], predicate: Callable[[T], bool] = lambda x: True) -> Optional[T]:
-    return next((x for x in reversed(sequence) if predicate(x)), None)
+def last_or_none_(sequence: list[T], predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+    return next(_filtered(reversed(sequence), predicate), None)
 
-def single_(sequence: list[T], predicate: Callable[[T], bool]) -> T:
-    filtered = [x for x in sequence if predicate(x)]
-    if len(filtered) == 1:
-        return filtered[0]
-    elif len(filtered) == 0:
+def single_(sequence: Iterable[T], predicate: Callable[[T], bool]) -> T:
+    matches = filter(as_callable(predicate), sequence)
+    found = next(matches, NOT_FOUND)
+    if found is NOT_FOUND:
         raise ValueError("No elements match the predicate.")
-    else:
+    if next(matches, NOT_FOUND) is not NOT_FOUND:
         raise ValueError("More than one element matches the predicate.")
+    return found
 
-def single_or_none_(sequence: list[T], predicate: Callable[[T], bool]) -> Optional[T]:
-    filtered = [x for x in sequence if predicate(x)]
-    if len(filtered) == 1:
-        return filtered[0]
-    elif len(filtered) == 0:
+def single_or_none_(sequence: Iterable[T], predicate: Callable[[T], bool]) -> Optional[T]:
+    matches = filter(as_callable(predicate), sequence)
+    found = next(matches, NOT_FOUND)
+    if found is NOT_FOUND:
         return None
-    else:
+    if next(matches, NOT_FOUND) is not NOT_FOUND:
         raise ValueError("More than one element matches the predicate.")
+    return found
 
 def filter_(sequence: list[T], predicate: Callable[[T], bool]) -> list[T]:
-    return [x for x in sequence if predicate(x)]
+    return list(filter(as_callable(predicate), sequence))
 
 def except_(sequence: list[T], exclusions: list[T]) -> list[T]:
-    return [x for x in sequence if x not in exclusions]
+    excluded = HashAwareSet(exclusions)
+    return [x for x in sequence if x not in excluded]
 
 def without_(sequence: list[T], predicate: Callable[[T], bool]) -> list[T]:
-    return [x for x in sequence if not predicate(x)]
+    return list(filterfalse(as_callable(predicate), sequence))
 
 def union_(sequence1: list[T], sequence2: list[T]) -> list[T]:
-    return list(set(sequence1) | set(sequence2))
+    return distinct_(chain(sequence1, sequence2))
+
+def intersect_(sequence1: list[T], sequence2: list[T]) -> list[T]:
+    included = HashAwareSet(sequence2)
+    seen = HashAwareSet()
+    return [x for x in sequence1 if x in included and seen.add(x)]
 
 def select_(sequence: list[T], selector: Callable[[T], T2]) -> list[T2]:
-    return [selector(x) for x in sequence]
+    if isinstance(selector, Expression):
+        result = vectorized.select(sequence, selector)
+        if result is not vectorized.NOT_VECTORIZED:
+            return result
+    return list(map(as_callable(selector), sequence))
 
-def select_many_(sequence: list[T], selector: Callable[[T], list[T2]]) -> list[T2]:
-    seq_dict = {}
-    for i in range(len(sequence)):
-        transformed = selector(sequence[i])
+def select_many_(sequence: list[T], selector: Callable[[T], Iterable[T2]]) -> list[T2]:
+    selector = as_callable(selector)
+    results = []
+    for x in sequence:
+        transformed = selector(x)
         if isinstance(transformed, Iterable) and not isinstance(transformed, str):
-            for j in range(len(transformed)):
-                seq_dict[f"{i}{j}"] = transformed[j]
+            results.extend(transformed)
         else:
-            seq_dict[f"{i}"] = transformed
-    results = list(seq_dict.values())
+            results.append(transformed)
     return results
 
+def iterate_select_many_(sequence: Iterable[T], selector: Callable[[T], Iterable[T2]]) -> Iterator[T2]:
+    selector = as_callable(selector)
+    for x in sequence:
+        transformed = selector(x)
+        if isinstance(transformed, Iterable) and not isinstance(transformed, str):
+            yield from transformed
+        else:
+            yield transformed
+
 def where_(sequence: list[T], predicate: Callable[[T], bool]) -> list[T]:
-    return [x for x in sequence if predicate(x)]
+    if isinstance(predicate, Expression):
+        result = vectorized.where(sequence, predicate)
+        if result is not vectorized.NOT_VECTORIZED:
+            return result
+    return list(filter(as_callable(predicate), sequence))
 
 def where_with_index_(sequence: list[T], predicate: Callable[[T], bool]) -> dict[int, T]:
+    predicate = as_callable(predicate)
     return {index: item for index, item in enumerate(sequence) if predicate(item)}
 
 def distinct_(sequence: list[T]) -> list[T]:
-    return list(set(sequence))
+    seen = HashAwareSet()
+    return [x for x in sequence if seen.add(x)]
+
+def distinct_by_(sequence: list[T], key_selector: Callable[[T], Any]) -> list[T]:
+    key_selector = as_callable(key_selector)
+    seen = HashAwareSet()
+    return [x for x in sequence if seen.add(key_selector(x))]
 
 def order_by_(sequence: list[T], key_selector: Callable[[T], T]) -> list[T]:
-    return sorted(sequence, key=key_selector)
+    if isinstance(key_selector, Expression):
+        result = vectorized.order_by(sequence, key_selector)
+        if result is not vectorized.NOT_VECTORIZED:
+            return result
+    return sorted(sequence, key=as_callable(key_selector))
 
 def order_by_descending_(sequence: list[T], key_selector: Callable[[T], T]) -> list[T]:
-    return sorted(sequence, key=key_selector, reverse=True)
+    if isinstance(key_selector, Expression):
+        result = vectorized.order_by(sequence, key_selector, descending=True)
+        if result is not vectorized.NOT_VECTORIZED:
+            return result
+    return sorted(sequence, key=as_callable(key_selector), reverse=True)
+
+def take_(sequence: Iterable[T], count: int) -> list[T]:
+    return list(islice(sequence, max(count, 0)))
+
+def skip_(sequence: Iterable[T], count: int) -> list[T]:
+    return list(islice(sequence, max(count, 0), None))
 
 def any_(sequence: list[T], predicate: Callable[[T], bool]) -> bool:
-    return any(predicate(x) for x in sequence)
+    if isinstance(predicate, Expression):
+        result = vectorized.any_(sequence, predicate)
+        if result is not vectorized.NOT_VECTORIZED:
+            return result
+    return any(map(as_callable(predicate), sequence))
 
 def all_(sequence: list[T], predicate: Callable[[T], bool]) -> bool:
-    return all(predicate(x) for x in sequence)
+    if isinstance(predicate, Expression):
+        result = vectorized.all_(sequence, predicate)
+        if result is not vectorized.NOT_VECTORIZED:
+            return result
+    return all(map(as_callable(predicate), sequence))
 
 def none_(sequence: list[T], predicate: Callable[[T], bool]) -> bool:
-    return all(not predicate(x) for x in sequence)
\ No newline at end of file
+    return not any(map(as_callable(predicate), sequence))
+
+def group_by_(sequence: Iterable[T],
+              key_selector: Callable[[T], K],
+              element_selector: Optional[Callable[[T], T2]] = None) -> dict[K, list[T2]]:
+    key_selector = as_callable(key_selector)
+    element_selector = as_callable(element_selector)
+    groups = defaultdict(list)
+    if element_selector is None:
+        for x in sequence:
+            groups[key_selector(x)].append(x)
+    else:
+        for x in sequence:
+            groups[key_selector(x)].append(element_selector(x))
+    return dict(groups)
+
+def to_lookup_(sequence: Iterable[T],
+               key_selector: Callable[[T], K],
+               element_selector: Optional[Callable[[T], T2]] = None) -> Lookup[K, T2]:
+    return Lookup(group_by_(sequence, key_selector, element_selector))
+
+def join_(outer: Iterable[T],
+          inner: Iterable[T2],
+          outer_key_selector: Callable[[T], K],
+          inner_key_selector: Callable[[T2], K],
+          result_selector: Callable[[T, T2], R] = lambda x, y: (x, y)) -> list[R]:
+    return list(iterate_join_(outer, inner, outer_key_selector, inner_key_selector, result_selector))
+
+def iterate_join_(outer: Iterable[T],
+                  inner: Iterable[T2],
+                  outer_key_selector: Callable[[T], K],
+                  inner_key_selector: Callable[[T2], K],
+                  result_selector: Callable[[T, T2], R] = lambda x, y: (x, y)) -> Iterator[R]:
+    """
+    Hash join, which groups the inner sequence once and streams the outer sequence.
+    """
+    outer_key_selector = as_callable(outer_key_selector)
+    inner_groups = group_by_(inner, inner_key_selector)
+    for x in outer:
+        matches = inner_groups.get(outer_key_selector(x))
+        if matches is not None:
+            for y in matches:
+                yield result_selector(x, y)
+
+def group_join_(outer: Iterable[T],
+                inner: Iterable[T2],
+                outer_key_selector: Callable[[T], K],
+                inner_key_selector: Callable[[T2], K],
+                result_selector: Callable[[T, list[T2]], R] = lambda x, y: (x, y)) -> list[R]:
+    return list(iterate_group_join_(outer, inner, outer_key_selector, inner_key_selector, result_selector))
+
+def iterate_group_join_(outer: Iterable[T],
+                        inner: Iterable[T2],
+                        outer_key_selector: Callable[[T], K],
+                        inner_key_selector: Callable[[T2], K],
+                        result_selector: Callable[[T, list[T2]], R] = lambda x, y: (x, y)) -> Iterator[R]:
+    outer_key_selector = as_callable(outer_key_selector)
+    inner_lookup = to_lookup_(inner, inner_key_selector)
+    for x in outer:
+        yield result_selector(x, inner_lookup[outer_key_selector(x)])
+
+def aggregate_(sequence: Iterable[T], func: Callable[[T2, T], T2], seed: T2 = NOT_FOUND) -> T2:
+    iterator = iter(sequence)
+    if seed is NOT_FOUND:
+        seed = next(iterator, NOT_FOUND)
+        if seed is NOT_FOUND:
+            raise ValueError("Sequence contains no elements.")
+    return reduce(func, iterator, seed)
+
+def sum_(sequence: Iterable[T], selector: Optional[Callable[[T], Any]] = None) -> Any:
+    return sum(sequence if selector is None else map(as_callable(selector), sequence))
+
+def min_by_(sequence: Iterable[T], key_selector: Callable[[T], Any]) -> T:
+    found = min(sequence, key=as_callable(key_selector), default=NOT_FOUND)
+    if found is NOT_FOUND:
+        raise ValueError("Sequence contains no elements.")
+    return found
+
+def max_by_(sequence: Iterable[T], key_selector: Callable[[T], Any]) -> T:
+    found = max(sequence, key=as_callable(key_selector), default=NOT_FOUND)
+    if found is NOT_FOUND:
+        raise ValueError("Sequence contains no elements.")
+    return found
+
+def count_by_(sequence: Iterable[T], key_selector: Callable[[T], K]) -> dict[K, int]:
+    return dict(Counter(map(as_callable(key_selector), sequence)))
+
+def _filtered(sequence: Iterable[T], predicate: Optional[Callable[[T], bool]]) -> Iterator[T]:
+    return iter(sequence) if predicate is None else filter(as_callable(predicate), sequence)
@@ -0,0 +1,117 @@
+import os
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, reduce
+from itertools import chain, islice
+from typing import Callable, TypeVar, Generic, Optional, Any
+
+from .expressions import as_callable
+from .lists import NOT_FOUND, select_many_
+
+T = TypeVar('T')
+T2 = TypeVar('T2')
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class ParallelSequence(Generic[T]):
+    """
+    Runs operators over chunks of the sequence in parallel and returns the results in the order of the sequence.
+    Chunks are processed by threads on free-threaded builds and by processes otherwise,
+    so with processes the sequence items, the results and the functions have to be picklable, i.e. no lambdas.
+    Expressions are picklable and compiled in the workers.
+    At most two chunks per worker are in flight, so the sequence can be a lazy iterable of any length.
+    """
+    __slots__ = ('_sequence', '_chunk_size', '_max_workers', '_executor')
+
+    def __init__(self,
+                 sequence: Iterable[T],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None):
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive.")
+        self._sequence = sequence
+        self._chunk_size = chunk_size
+        self._max_workers = max_workers or os.process_cpu_count() or 1
+        self._executor = executor
+
+    def select_(self, selector: Callable[[T], T2]) -> list[T2]:
+        return list(chain.from_iterable(self.__map_chunks(partial(_select_chunk, selector))))
+
+    def where_(self, predicate: Callable[[T], bool]) -> list[T]:
+        return list(chain.from_iterable(self.__map_chunks(partial(_where_chunk, predicate))))
+
+    def select_many_(self, selector: Callable[[T], Iterable[T2]]) -> list[T2]:
+        return list(chain.from_iterable(self.__map_chunks(partial(select_many_, selector=selector))))
+
+    def aggregate_(self,
+                   func: Callable[[T2, T], T2],
+                   seed: T2 = NOT_FOUND,
+                   combine: Optional[Callable[[T2, T2], T2]] = None) -> T2:
+        """
+        Aggregates each chunk with func and then the partial results with combine, which defaults to func.
+        The seed is used for every chunk, so it has to be neutral for func, like 0 for addition.
+        """
+        aggregate_chunk = partial(reduce, func) if seed is NOT_FOUND else partial(_aggregate_chunk, func, seed)
+        partial_results = list(self.__map_chunks(aggregate_chunk))
+        if not partial_results:
+            if seed is NOT_FOUND:
+                raise ValueError("Sequence contains no elements.")
+            return seed
+        return reduce(combine or func, partial_results)
+
+    def __map_chunks(self, function: Callable[[list[T]], T2]) -> Iterator[T2]:
+        if self._executor is not None:
+            yield from _map_bounded(self._executor, function, self.__chunks(), self._max_workers * 2)
+            return
+
+        executor_type = ThreadPoolExecutor if is_free_threaded() else ProcessPoolExecutor
+        with executor_type(max_workers=self._max_workers) as executor:
+            yield from _map_bounded(executor, function, self.__chunks(), self._max_workers * 2)
+
+    def __chunks(self) -> Iterator[list[T]]:
+        iterator = iter(self._sequence)
+        while chunk := list(islice(iterator, self._chunk_size)):
+            yield chunk
+
+
+def parallel(sequence: Iterable[T],
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             max_workers: Optional[int] = None,
+             executor: Optional[Executor] = None) -> ParallelSequence[T]:
+    return ParallelSequence(sequence, chunk_size, max_workers, executor)
+
+
+def is_free_threaded() -> bool:
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _map_bounded(executor: Executor,
+                 function: Callable[[Any], T2],
+                 items: Iterable[Any],
+                 max_pending: int) -> Iterator[T2]:
+    pending = deque()
+    for item in items:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _select_chunk(selector: Callable[[T], T2], chunk: list[T]) -> list[T2]:
+    selector = as_callable(selector)
+    return [selector(x) for x in chunk]
+
+
+def _where_chunk(predicate: Callable[[T], bool], chunk: list[T]) -> list[T]:
+    predicate = as_callable(predicate)
+    return [x for x in chunk if predicate(x)]
+
+
+def _aggregate_chunk(func: Callable[[T2, T], T2], seed: T2, chunk: list[T]) -> T2:
+    return reduce(func, chunk, seed)
@@ -0,0 +1,351 @@
+from collections.abc import Iterable, Iterator
+import heapq
+from itertools import chain, islice
+from typing import Callable, TypeVar, Optional, Generic, Any
+
+from .expressions import as_callable
+from .iterables import chunk_, window_, pairwise_, zip_, scan_, distinct_until_changed_
+from .lists import (HashAwareSet, Lookup, NOT_FOUND, iterate_select_many_, single_, single_or_none_, group_by_,
+                    to_lookup_, iterate_join_, iterate_group_join_, aggregate_, sum_, min_by_, max_by_, count_by_)
+
+T = TypeVar('T')
+T2 = TypeVar('T2')
+K = TypeVar('K')
+R = TypeVar('R')
+
+type Stage = tuple[str, Callable]
+
+WHERE = "WHERE"
+SELECT = "SELECT"
+TRANSFORM = "TRANSFORM"
+ORDER = "ORDER"
+SLICE = "SLICE"
+
+
+class Query(Generic[T]):
+    """
+    Lazy query over any iterable.
+    Operators only record stages and return a new query, the source is iterated by terminal operators.
+    Consecutive where_ and select_ stages are fused into a single generator, so they don't allocate anything per stage.
+    """
+    __slots__ = ('_source', '_stages')
+
+    def __init__(self, source: Iterable[T], stages: tuple[Stage, ...] = ()):
+        self._source = source
+        self._stages = stages
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__build())
+
+    def where_(self, predicate: Callable[[T], bool]) -> 'Query[T]':
+        return self._with_stage(WHERE, as_callable(predicate))
+
+    def select_(self, selector: Callable[[T], T2]) -> 'Query[T2]':
+        return self._with_stage(SELECT, as_callable(selector))
+
+    def select_many_(self, selector: Callable[[T], Iterable[T2]]) -> 'Query[T2]':
+        return self._with_stage(TRANSFORM, lambda sequence: iterate_select_many_(sequence, selector))
+
+    def without_(self, predicate: Callable[[T], bool]) -> 'Query[T]':
+        predicate = as_callable(predicate)
+        return self._with_stage(WHERE, lambda x: not predicate(x))
+
+    def distinct_(self) -> 'Query[T]':
+        return self._with_stage(TRANSFORM, lambda sequence: _distinct_by(sequence, None))
+
+    def distinct_by_(self, key_selector: Callable[[T], Any]) -> 'Query[T]':
+        key_selector = as_callable(key_selector)
+        return self._with_stage(TRANSFORM, lambda sequence: _distinct_by(sequence, key_selector))
+
+    def except_(self, exclusions: Iterable[T]) -> 'Query[T]':
+        def except_exclusions(sequence: Iterable[T]) -> Iterator[T]:
+            excluded = HashAwareSet(exclusions)
+            return (x for x in sequence if x not in excluded)
+        return self._with_stage(TRANSFORM, except_exclusions)
+
+    def union_(self, other: Iterable[T]) -> 'Query[T]':
+        return self._with_stage(TRANSFORM, lambda sequence: _distinct_by(chain(sequence, other), None))
+
+    def intersect_(self, other: Iterable[T]) -> 'Query[T]':
+        def intersect_other(sequence: Iterable[T]) -> Iterator[T]:
+            included = HashAwareSet(other)
+            return (x for x in _distinct_by(sequence, None) if x in included)
+        return self._with_stage(TRANSFORM, intersect_other)
+
+    def order_by_(self, key_selector: Callable[[T], Any]) -> 'Query[T]':
+        return self._with_stage(ORDER, _Ordering(((as_callable(key_selector), False),)))
+
+    def order_by_descending_(self, key_selector: Callable[[T], Any]) -> 'Query[T]':
+        return self._with_stage(ORDER, _Ordering(((as_callable(key_selector), True),)))
+
+    def then_by_(self, key_selector: Callable[[T], Any]) -> 'Query[T]':
+        return self.__then_by(key_selector, False)
+
+    def then_by_descending_(self, key_selector: Callable[[T], Any]) -> 'Query[T]':
+        return self.__then_by(key_selector, True)
+
+    def skip_(self, count: int) -> 'Query[T]':
+        return self._with_stage(SLICE, _Slice(max(count, 0), None))
+
+    def take_(self, count: int) -> 'Query[T]':
+        """
+        Takes the first count items.
+        Directly after ordering, with optional skip_ in between, only the needed items are selected with a heap,
+        so the ordering costs O(n log k) instead of a full sort.
+        """
+        count = max(count, 0)
+        stages = self._stages
+        skipped = 0
+        index = len(stages) - 1
+        while index >= 0 and stages[index][0] == SLICE and stages[index][1].stop is None:
+            skipped += stages[index][1].start
+            index -= 1
+        if index >= 0 and stages[index][0] == ORDER:
+            ordering = stages[index][1].limited(skipped + count)
+            stages = stages[:index] + ((ORDER, ordering),) + stages[index + 1:]
+        return Query(self._source, stages + ((SLICE, _Slice(0, count)),))
+
+    def group_by_(self,
+                  key_selector: Callable[[T], K],
+                  element_selector: Optional[Callable[[T], T2]] = None) -> 'Query[tuple[K, list[T2]]]':
+        return self._with_stage(TRANSFORM,
+                                lambda sequence: iter(group_by_(sequence, key_selector, element_selector).items()))
+
+    def join_(self,
+              inner: Iterable[T2],
+              outer_key_selector: Callable[[T], K],
+              inner_key_selector: Callable[[T2], K],
+              result_selector: Callable[[T, T2], R] = lambda x, y: (x, y)) -> 'Query[R]':
+        return self._with_stage(TRANSFORM, lambda sequence: iterate_join_(
+            sequence, inner, outer_key_selector, inner_key_selector, result_selector))
+
+    def group_join_(self,
+                    inner: Iterable[T2],
+                    outer_key_selector: Callable[[T], K],
+                    inner_key_selector: Callable[[T2], K],
+                    result_selector: Callable[[T, list[T2]], R] = lambda x, y: (x, y)) -> 'Query[R]':
+        return self._with_stage(TRANSFORM, lambda sequence: iterate_group_join_(
+            sequence, inner, outer_key_selector, inner_key_selector, result_selector))
+
+    def chunk_(self, size: int) -> 'Query[list[T]]':
+        return self._with_stage(TRANSFORM, lambda sequence: chunk_(sequence, size))
+
+    def window_(self, size: int, step: int = 1) -> 'Query[tuple[T, ...]]':
+        return self._with_stage(TRANSFORM, lambda sequence: window_(sequence, size, step))
+
+    def pairwise_(self) -> 'Query[tuple[T, T]]':
+        return self._with_stage(TRANSFORM, pairwise_)
+
+    def zip_(self, *others: Iterable[Any], strict: bool = False) -> 'Query[tuple[Any, ...]]':
+        return self._with_stage(TRANSFORM, lambda sequence: zip_(sequence, *others, strict=strict))
+
+    def scan_(self, func: Callable[[T2, T], T2], seed: T2 = NOT_FOUND) -> 'Query[T2]':
+        return self._with_stage(TRANSFORM, lambda sequence: scan_(sequence, func, seed))
+
+    def distinct_until_changed_(self, key_selector: Optional[Callable[[T], Any]] = None) -> 'Query[T]':
+        return self._with_stage(TRANSFORM, lambda sequence: distinct_until_changed_(sequence, key_selector))
+
+    def first_(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
+        try:
+            return next(iter(self.__filtered(predicate)))
+        except StopIteration:
+            raise ValueError("No elements match the predicate.")
+
+    def first_or_none_(self, predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        return next(iter(self.__filtered(predicate)), None)
+
+    def last_(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
+        found = False
+        last = None
+        for last in self.__filtered(predicate):
+            found = True
+        if not found:
+            raise ValueError("No elements match the predicate.")
+        return last
+
+    def last_or_none_(self, predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        last = None
+        for last in self.__filtered(predicate):
+            pass
+        return last
+
+    def single_(self, predicate: Optional[Callable[[T], bool]] = None) -> T:
+        return single_(self.__build(), predicate if predicate is not None else _always)
+
+    def single_or_none_(self, predicate: Optional[Callable[[T], bool]] = None) -> Optional[T]:
+        return single_or_none_(self.__build(), predicate if predicate is not None else _always)
+
+    def any_(self, predicate: Optional[Callable[[T], bool]] = None) -> bool:
+        for _ in self.__filtered(predicate):
+            return True
+        return False
+
+    def all_(self, predicate: Callable[[T], bool]) -> bool:
+        return all(map(as_callable(predicate), self.__build()))
+
+    def none_(self, predicate: Optional[Callable[[T], bool]] = None) -> bool:
+        return not self.any_(predicate)
+
+    def count_(self, predicate: Optional[Callable[[T], bool]] = None) -> int:
+        count = 0
+        for _ in self.__filtered(predicate):
+            count += 1
+        return count
+
+    def to_list_(self) -> list[T]:
+        return list(self.__build())
+
+    def to_lookup_(self,
+                   key_selector: Callable[[T], K],
+                   element_selector: Optional[Callable[[T], T2]] = None) -> Lookup[K, T2]:
+        return to_lookup_(self.__build(), key_selector, element_selector)
+
+    def aggregate_(self, func: Callable[[T2, T], T2], seed: T2 = NOT_FOUND) -> T2:
+        return aggregate_(self.__build(), func, seed)
+
+    def sum_(self, selector: Optional[Callable[[T], Any]] = None) -> Any:
+        return sum_(self.__build(), selector)
+
+    def min_by_(self, key_selector: Callable[[T], Any]) -> T:
+        return min_by_(self.__build(), key_selector)
+
+    def max_by_(self, key_selector: Callable[[T], Any]) -> T:
+        return max_by_(self.__build(), key_selector)
+
+    def count_by_(self, key_selector: Callable[[T], K]) -> dict[K, int]:
+        return count_by_(self.__build(), key_selector)
+
+    def _with_stage(self, kind: str, function: Callable) -> 'Query':
+        return Query(self._source, self._stages + ((kind, function),))
+
+    def __then_by(self, key_selector: Callable[[T], Any], descending: bool) -> 'Query[T]':
+        if not self._stages or self._stages[-1][0] != ORDER:
+            raise ValueError("then_by_ must directly follow order_by_, order_by_descending_ or another then_by_.")
+        return Query(self._source, self._stages[:-1] + ((ORDER, self._stages[-1][1].then_by(as_callable(key_selector), descending)),))
+
+    def __filtered(self, predicate: Optional[Callable[[T], bool]]) -> Iterable[T]:
+        return self.__build() if predicate is None else self.where_(predicate).__build()
+
+    def __build(self) -> Iterable:
+        iterable = self._source
+        predicate = None
+        selector = None
+
+        for kind, function in self._stages:
+            if kind == WHERE:
+                if selector is not None:
+                    iterable = _fuse(iterable, predicate, selector)
+                    predicate = selector = None
+                predicate = function if predicate is None else _both(predicate, function)
+            elif kind == SELECT:
+                selector = function if selector is None else _compose(selector, function)
+            else:
+                iterable = function(_fuse(iterable, predicate, selector))
+                predicate = selector = None
+
+        return _fuse(iterable, predicate, selector)
+
+
+def _always(_: Any) -> bool:
+    return True
+
+
+def _fuse(iterable: Iterable, predicate: Optional[Callable], selector: Optional[Callable]) -> Iterable:
+    match predicate, selector:
+        case None, None:
+            return iterable
+        case _, None:
+            return filter(predicate, iterable)
+        case None, _:
+            return map(selector, iterable)
+        case _:
+            return (selector(x) for x in iterable if predicate(x))
+
+
+def _both(first: Callable[[Any], bool], second: Callable[[Any], bool]) -> Callable[[Any], bool]:
+    return lambda x: first(x) and second(x)
+
+
+def _compose(first: Callable[[Any], Any], second: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda x: second(first(x))
+
+
+def _distinct_by(sequence: Iterable[T], key_selector: Optional[Callable[[T], Any]]) -> Iterator[T]:
+    seen = HashAwareSet()
+    if key_selector is None:
+        return (x for x in sequence if seen.add(x))
+    return (x for x in sequence if seen.add(key_selector(x)))
+
+
+class _Ordering:
+    """
+    Stable ordering by one or more keys.
+    The items are materialized once and sorted by each key in place, starting from the last one,
+    which is faster than comparing tuple keys. When the limit is set, only the first limit items are selected with a heap.
+    """
+    __slots__ = ('keys', 'limit')
+
+    def __init__(self, keys: tuple[tuple[Callable[[Any], Any], bool], ...], limit: Optional[int] = None):
+        self.keys = keys
+        self.limit = limit
+
+    def then_by(self, key_selector: Callable[[Any], Any], descending: bool) -> '_Ordering':
+        return _Ordering(self.keys + ((key_selector, descending),), self.limit)
+
+    def limited(self, limit: int) -> '_Ordering':
+        return _Ordering(self.keys, limit if self.limit is None else min(self.limit, limit))
+
+    def __call__(self, sequence: Iterable[T]) -> Iterator[T]:
+        if self.limit is None:
+            items = list(sequence)
+            for key_selector, descending in reversed(self.keys):
+                items.sort(key=key_selector, reverse=descending)
+            return iter(items)
+        key, descending = self.__get_heap_key()
+        select = heapq.nlargest if descending else heapq.nsmallest
+        return iter(select(self.limit, sequence, key=key))
+
+    def __get_heap_key(self) -> tuple[Callable[[Any], Any], bool]:
+        descending = self.keys[0][1]
+        if all(key_descending == descending for _, key_descending in self.keys):
+            if len(self.keys) == 1:
+                return self.keys[0][0], descending
+            selectors = tuple(key_selector for key_selector, _ in self.keys)
+            return lambda x: tuple(key_selector(x) for key_selector in selectors), descending
+
+        selectors = tuple(key_selector for key_selector, _ in self.keys)
+        directions = tuple(key_descending for _, key_descending in self.keys)
+        return lambda x: _MixedKey(tuple(key_selector(x) for key_selector in selectors), directions), False
+
+
+class _Slice:
+    __slots__ = ('start', 'stop')
+
+    def __init__(self, start: int, stop: Optional[int]):
+        self.start = start
+        self.stop = stop
+
+    def __call__(self, sequence: Iterable[T]) -> Iterator[T]:
+        return islice(sequence, self.start, self.stop)
+
+
+class _MixedKey:
+    """
+    Sort key of several values, which are compared in ascending or descending direction each.
+    """
+    __slots__ = ('values', 'directions')
+
+    def __init__(self, values: tuple, directions: tuple[bool, ...]):
+        self.values = values
+        self.directions = directions
+
+    def __lt__(self, other: '_MixedKey') -> bool:
+        for value, other_value, descending in zip(self.values, other.values, self.directions):
+            if value != other_value:
+                return value > other_value if descending else value < other_value
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        return self.values == other.values if isinstance(other, _MixedKey) else NotImplemented
+
+    __hash__ = None
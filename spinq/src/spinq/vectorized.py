@@ -0,0 +1,109 @@
+from collections.abc import Iterable
+from typing import Any
+
+from .expressions import Expression, Element, Constant, UnaryOperation, BinaryOperation
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+NOT_VECTORIZED = object()
+
+NUMERIC_KINDS = "biuf"
+
+
+def is_available() -> bool:
+    return numpy is not None
+
+
+def where(sequence: Iterable[Any], predicate: Expression) -> Any:
+    array, mask = _evaluate_mask(sequence, predicate)
+    if mask is None:
+        return NOT_VECTORIZED
+    return array[mask]
+
+
+def select(sequence: Iterable[Any], selector: Expression) -> Any:
+    array = _to_array(sequence)
+    if array is None:
+        return NOT_VECTORIZED
+    values = _evaluate(selector, array)
+    return NOT_VECTORIZED if values is None else values
+
+
+def any_(sequence: Iterable[Any], predicate: Expression) -> Any:
+    _, mask = _evaluate_mask(sequence, predicate)
+    return NOT_VECTORIZED if mask is None else bool(mask.any())
+
+
+def all_(sequence: Iterable[Any], predicate: Expression) -> Any:
+    _, mask = _evaluate_mask(sequence, predicate)
+    return NOT_VECTORIZED if mask is None else bool(mask.all())
+
+
+def order_by(sequence: Iterable[Any], key_selector: Expression, descending: bool = False) -> Any:
+    array = _to_array(sequence)
+    if array is None:
+        return NOT_VECTORIZED
+    keys = _evaluate(key_selector, array)
+    if keys is None:
+        return NOT_VECTORIZED
+    return array[argsort(keys, descending)]
+
+
+def argsort(keys: Any, descending: bool = False) -> Any:
+    """
+    Returns the indices, which sort the keys array, keeping equal keys in their original order in both directions.
+    """
+    if descending:
+        # Stable ascending sort of the reversed keys, read backwards, keeps equal keys in their original order
+        return len(keys) - 1 - numpy.argsort(keys[::-1], kind='stable')[::-1]
+    return numpy.argsort(keys, kind='stable')
+
+
+def _to_array(sequence: Iterable[Any]) -> Any:
+    """
+    Returns the sequence, if it is a one-dimensional numeric NumPy array, otherwise None.
+    Lists are not converted, because the conversion alone costs more than evaluating the expression item by item.
+    """
+    if numpy is None or not isinstance(sequence, numpy.ndarray):
+        return None
+    return sequence if sequence.ndim == 1 and sequence.dtype.kind in NUMERIC_KINDS else None
+
+
+def _evaluate_mask(sequence: Iterable[Any], predicate: Expression) -> tuple[Any, Any]:
+    array = _to_array(sequence)
+    if array is None:
+        return None, None
+    mask = _evaluate(predicate, array)
+    if mask is None or mask.dtype.kind != 'b':
+        return None, None
+    return array, mask
+
+
+def _evaluate(expression: Expression, array: Any) -> Any:
+    """
+    Evaluates the expression for the whole array and returns an array of the same length, or None if it is not possible.
+    """
+    try:
+        result = _evaluate_node(expression, array)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(result, numpy.ndarray) or result.shape != array.shape:
+        return None
+    return result
+
+
+def _evaluate_node(expression: Expression, array: Any) -> Any:
+    match expression:
+        case Element():
+            return array
+        case Constant(value_=value):
+            return value
+        case UnaryOperation(operator_=operator_function, operand_=operand):
+            return operator_function(_evaluate_node(operand, array))
+        case BinaryOperation(operator_=operator_function, left_=left, right_=right):
+            return operator_function(_evaluate_node(left, array), _evaluate_node(right, array))
+        case _:
+            raise TypeError(f"Expression {expression!r} cannot be vectorized.")
@@ -0,0 +1,16 @@
+__author__ = "kostiantyn.chomakov@gmail.com"
+
+from . import test_query, test_lists, test_expressions, test_parallel, test_dicts, test_async_iterables, test_iterables, \
+    test_columnar, test_cache
+
+__all__ = [
+    'test_query',
+    'test_lists',
+    'test_expressions',
+    'test_parallel',
+    'test_dicts',
+    'test_async_iterables',
+    'test_iterables',
+    'test_columnar',
+    'test_cache'
+]
\ No newline at end of file
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from spinq import async_iterables
+
+
+async def numbers(count: int, visited: list[int] | None = None):
+    for x in range(count):
+        if visited is not None:
+            visited.append(x)
+        yield x
+
+
+@pytest.mark.asyncio
+async def test_where_and_select_stream_items():
+    query = async_iterables.select_(async_iterables.where_(numbers(10), lambda x: x % 2 == 0), lambda x: x * 10)
+
+    assert await async_iterables.to_list_(query) == [0, 20, 40, 60, 80]
+
+
+@pytest.mark.asyncio
+async def test_first_stops_reading_source():
+    visited = []
+
+    assert await async_iterables.first_(numbers(100, visited), lambda x: x > 2) == 3
+    assert visited == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_first_raises_when_nothing_matches():
+    with pytest.raises(ValueError, match="No elements match the predicate."):
+        await async_iterables.first_(numbers(3), lambda x: x > 5)
+    assert await async_iterables.first_or_none_(numbers(3), lambda x: x > 5) is None
+
+
+@pytest.mark.asyncio
+async def test_early_returning_operators_close_filtered_iteration(monkeypatch):
+    closed = []
+    where_ = async_iterables.where_
+
+    async def tracked_where_(source, predicate):
+        try:
+            async for x in where_(source, predicate):
+                yield x
+        finally:
+            closed.append(True)
+
+    monkeypatch.setattr(async_iterables, "where_", tracked_where_)
+
+    assert await async_iterables.first_(numbers(10), lambda x: x > 2) == 3
+    assert await async_iterables.first_or_none_(numbers(10), lambda x: x > 2) == 3
+    assert await async_iterables.any_(numbers(10), lambda x: x > 2)
+    assert closed == [True, True, True]
+
+
+@pytest.mark.asyncio
+async def test_async_selector_runs_with_bounded_concurrency_and_keeps_order():
+    running = 0
+    max_running = 0
+
+    async def slow_square(x: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.001 * (5 - x % 5))
+        running -= 1
+        return x * x
+
+    selected = async_iterables.select_(numbers(20), slow_square, max_concurrency=4)
+
+    assert await async_iterables.to_list_(selected) == [x * x for x in range(20)]
+    assert max_running == 4
+
+
+@pytest.mark.asyncio
+async def test_async_predicate_and_select_many():
+    async def is_odd(x: int) -> bool:
+        await asyncio.sleep(0)
+        return x % 2 == 1
+
+    odd = async_iterables.where_(numbers(6), is_odd, max_concurrency=3)
+    flattened = async_iterables.select_many_(odd, lambda x: numbers(x))
+
+    assert await async_iterables.to_list_(flattened) == [0, 0, 1, 2, 0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_aggregation_operators():
+    assert await async_iterables.any_(numbers(5), lambda x: x == 4)
+    assert not await async_iterables.all_(numbers(5), lambda x: x < 4)
+    assert await async_iterables.count_(numbers(5), lambda x: x > 1) == 3
+    assert await async_iterables.sum_(numbers(5)) == 10
+    assert await async_iterables.aggregate_(numbers(4), lambda acc, x: acc * 10 + x) == 123
+    assert await async_iterables.aggregate_(numbers(0), lambda acc, x: acc + x, 7) == 7
+    with pytest.raises(ValueError, match="Sequence contains no elements."):
+        await async_iterables.aggregate_(numbers(0), lambda acc, x: acc + x)
+
+
+@pytest.mark.asyncio
+async def test_pending_selectors_are_cancelled_when_iteration_stops():
+    cancelled = []
+
+    async def slow(x: int) -> int:
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return x
+
+    async def fast_first(x: int):
+        return x if x == 0 else await slow(x)
+
+    selected = async_iterables.select_(numbers(10), fast_first, max_concurrency=3)
+    first = await anext(selected)
+    await selected.aclose()
+    await asyncio.sleep(0)
+
+    assert first == 0
+    assert cancelled == [1, 2]
@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+
+import pytest
+
+from spinq.cache import QueryCache
+from spinq.expressions import it
+
+
+@dataclass(frozen=True)
+class Product:
+    name: str
+    price: float
+    category: str
+
+
+PRODUCTS = [
+    Product("Apple", 1.5, "fruit"),
+    Product("Carrot", 0.5, "vegetable"),
+    Product("Melon", 4.0, "fruit"),
+]
+
+
+class CountingList(list):
+    def __init__(self, items):
+        super().__init__(items)
+        self.iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return super().__iter__()
+
+
+def test_same_query_over_same_source_is_evaluated_once():
+    source = CountingList(PRODUCTS)
+    cache = QueryCache()
+
+    results = [cache.query(source).where_(it.price > 1).order_by_(it.name).first_() for _ in range(3)]
+
+    assert results == [PRODUCTS[0]] * 3
+    assert source.iterations == 1
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_queries_are_keyed_on_structure_and_arguments():
+    cache = QueryCache()
+    query = cache.query(PRODUCTS)
+
+    assert query.where_(it.price > 1).count_() == 2
+    assert query.where_(it.price > 2).count_() == 1
+    assert query.where_(it.price > True).count_() == 2
+    assert query.where_(it.price > 1).select_(it.name).to_list_() == ["Apple", "Melon"]
+    assert query.where_(it.price > 1).to_list_() == [PRODUCTS[0], PRODUCTS[2]]
+    assert cache.misses == 5
+    assert query.where_(it.price > 1).count_() == 2
+    assert cache.hits == 1
+
+
+def test_functions_are_compared_by_identity():
+    cache = QueryCache()
+    is_cheap = lambda p: p.price < 1
+
+    assert cache.query(PRODUCTS).where_(is_cheap).to_list_() == [PRODUCTS[1]]
+    assert cache.query(PRODUCTS).where_(is_cheap).to_list_() == [PRODUCTS[1]]
+    assert cache.query(PRODUCTS).where_(lambda p: p.price < 1).to_list_() == [PRODUCTS[1]]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_unhashable_constants_are_compared_by_value():
+    cache = QueryCache()
+    source = [[1], [2]]
+    suffix = [0]
+
+    first = cache.query(source).select_(it + suffix).to_list_()
+    suffix.append(9)
+    second = cache.query(source).select_(it + suffix).to_list_()
+
+    assert first == [[1, 0], [2, 0]]
+    assert second == [[1, 0, 9], [2, 0, 9]]
+    assert cache.query(source).select_(it + [0, 9]).to_list_() is second
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_queries_with_constants_which_cannot_be_frozen_are_not_cached():
+    class Unhashable:
+        __hash__ = None
+
+        def __radd__(self, other):
+            return other
+
+    cache = QueryCache()
+
+    assert cache.query([1, 2]).select_(it + Unhashable()).to_list_() == [1, 2]
+    assert cache.query([1, 2]).select_(it + Unhashable()).where_(it > 1).count_() == 1
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_versions_and_invalidation():
+    cache = QueryCache()
+    products = list(PRODUCTS)
+
+    assert cache.query(products, version=1).count_() == 3
+    products.append(Product("Pear", 2.0, "fruit"))
+    assert cache.query(products, version=1).count_() == 3
+    assert cache.query(products, version=2).count_() == 4
+
+    cache.invalidate(version=1)
+    assert len(cache) == 1
+    cache.invalidate(products)
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_least_recently_used_results_are_evicted():
+    cache = QueryCache(maxsize=2)
+    query = cache.query(PRODUCTS)
+
+    query.count_()
+    query.to_list_()
+    query.count_()
+    query.any_()
+
+    assert len(cache) == 2
+    query.count_()
+    query.to_list_()
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    with pytest.raises(ValueError):
+        QueryCache(maxsize=0)
+
+
+def test_find_uses_prebuilt_index():
+    source = CountingList(PRODUCTS)
+    query = QueryCache().query(source).where_(it.price > 1)
+
+    assert query.find_(it.category, "fruit") == [PRODUCTS[0], PRODUCTS[2]]
+    assert query.find_(it.category, "vegetable") == []
+    assert source.iterations == 1
+
+
+def test_errors_are_not_cached():
+    query = QueryCache().query(PRODUCTS)
+
+    with pytest.raises(ValueError):
+        query.first_(it.price > 10)
+    with pytest.raises(ValueError):
+        query.first_(it.price > 10)
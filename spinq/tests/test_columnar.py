@@ -0,0 +1,120 @@
+from dataclasses import dataclass
+
+import pytest
+
+from spinq import columnar as columnar_module
+from spinq.columnar import columnar
+from spinq.expressions import it, compile_fields
+
+
+@dataclass
+class Product:
+    name: str
+    price: float
+    quantity: int
+
+
+PRODUCTS = [
+    Product("Apple", 1.5, 10),
+    Product("Melon", 4.0, 2),
+    Product("Pear", 1.5, 7),
+    Product("Grape", 3.0, 0),
+]
+
+
+def test_compile_fields_references_fields_as_arguments():
+    fields, function = compile_fields((it.price * it["quantity"] > 10) & (it.price < 5))
+
+    assert fields == ("price", "quantity")
+    assert function(1.5, 10) is True
+    assert function(1.5, 2) is False
+
+
+def test_compile_fields_rejects_the_item_itself():
+    with pytest.raises(ValueError):
+        compile_fields(it * 2)
+
+
+def test_where_over_dataclasses_keeps_records_and_order():
+    query = columnar(PRODUCTS).where_((it.price < 4) & (it.quantity > 0))
+
+    assert query.to_list_() == [PRODUCTS[0], PRODUCTS[2]]
+    assert query.count_() == 2
+
+
+def test_where_over_dicts_with_string_fields_and_method_calls():
+    records = [{"name": "Apple", "price": 1.5}, {"name": "melon", "price": 4.0}, {"name": "Pear", "price": 1.0}]
+
+    query = columnar(records).where_(it.name.lower().startswith("p") | (it["price"] > 3))
+
+    assert query.select_(it.name) == ["melon", "Pear"]
+
+
+def test_functions_and_item_expressions_fall_back_to_records():
+    query = columnar(PRODUCTS).where_(lambda p: p.quantity > 5).where_(it.price > 1)
+
+    assert query.select_(lambda p: p.name) == ["Apple", "Pear"]
+    assert columnar([1, 2, 3]).where_(it > 1).to_list_() == [2, 3]
+
+
+def test_order_by_is_stable_in_both_directions():
+    assert [p.name for p in columnar(PRODUCTS).order_by_(it.price).to_list_()] == ["Apple", "Pear", "Grape", "Melon"]
+    assert [p.name for p in columnar(PRODUCTS).order_by_descending_(it.price).to_list_()] == \
+           ["Melon", "Grape", "Apple", "Pear"]
+    assert columnar(PRODUCTS).order_by_descending_(it.name).take_(2).select_(it.name) == ["Pear", "Melon"]
+
+
+def test_select_group_by_and_column():
+    query = columnar(PRODUCTS).where_(it.quantity > 0)
+
+    assert query.select_(it.price * it.quantity) == [15.0, 8.0, 10.5]
+    assert query.group_by_(it.price) == {1.5: [PRODUCTS[0], PRODUCTS[2]], 4.0: [PRODUCTS[1]]}
+    assert list(query.column_("quantity")) == [10, 2, 7]
+
+
+def test_first_or_none_and_empty_results():
+    assert columnar(PRODUCTS).where_(it.price > 2).first_or_none_() is PRODUCTS[1]
+    assert columnar(PRODUCTS).where_(it.price > 100).first_or_none_() is None
+    assert columnar([]).where_(it.price > 1).to_list_() == []
+
+
+def test_numeric_columns_are_arrays():
+    numpy = pytest.importorskip("numpy")
+
+    columns = columnar_module.Columns(PRODUCTS)
+
+    assert columns.get("price").dtype == numpy.float64
+    assert columns.get("quantity").dtype == numpy.int64
+    assert isinstance(columns.get("name"), list)
+
+
+def test_numeric_columns_without_numpy(monkeypatch):
+    monkeypatch.setattr(columnar_module, "numpy", None)
+
+    query = columnar(PRODUCTS).where_(it.quantity > 1).order_by_descending_(it.price * it.quantity)
+
+    assert query.select_(it.name) == ["Apple", "Pear", "Melon"]
+    assert columnar_module.Columns(PRODUCTS).get("quantity").typecode == "q"
+
+
+def test_integer_overflow_falls_back_to_rows():
+    records = [{"a": 2 ** 62, "b": 4}, {"a": 3, "b": 5}]
+
+    assert columnar(records).select_(it.a * it.b) == [2 ** 64, 15]
+    assert columnar(records).where_(it.a * it.b > 100).to_list_() == [records[0]]
+    assert columnar(records).select_(it.a + it.b) == [2 ** 62 + 4, 8]
+
+
+def test_zero_divisor_raises_like_rows():
+    records = [{"a": 7, "b": 2}, {"a": 5, "b": 0}]
+
+    with pytest.raises(ZeroDivisionError):
+        columnar(records).where_(it.a // it.b > 1)
+    with pytest.raises(ZeroDivisionError):
+        columnar(records).select_(it.a / it.b)
+    assert columnar(records).where_(it.b > 0).select_(it.a // it.b) == [3]
+
+
+def test_negated_conditions_match_on_columns_and_rows():
+    assert columnar(PRODUCTS).where_(~(it.price > 2)).select_(it.name) == ["Apple", "Pear"]
+    assert columnar(PRODUCTS).where_(~(it.name == "Apple")).select_(it.name) == ["Melon", "Pear", "Grape"]
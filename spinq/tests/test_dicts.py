@@ -0,0 +1,59 @@
+import re
+
+import pytest
+
+from spinq.dicts import IndexedDict, get_key_by_index_, get_key_value_by_index_
+
+
+def test_get_key_by_index_raises_value_error_when_out_of_range():
+    with pytest.raises(ValueError, match="Index out of range."):
+        get_key_by_index_({"a": 1}, 1)
+    with pytest.raises(ValueError, match="Index out of range."):
+        get_key_value_by_index_({"a": 1}, 1)
+
+
+def test_indexed_dict_keeps_positions_after_updates_and_deletes():
+    dictionary = IndexedDict({"a": 1, "b": 2, "c": 3})
+    dictionary["a"] = 10
+    del dictionary["b"]
+    dictionary["d"] = 4
+
+    assert list(dictionary.items()) == [("a", 10), ("c", 3), ("d", 4)]
+    assert get_key_by_index_(dictionary, 1) == "c"
+    assert get_key_value_by_index_(dictionary, 2) == ("d", 4)
+    assert dictionary.item_at(-1) == ("d", 4)
+    with pytest.raises(ValueError, match="Index out of range."):
+        dictionary.key_at(3)
+
+
+def test_indexed_dict_maintains_value_indexes():
+    users = IndexedDict({1: {"role": "admin"}, 2: {"role": "user"}, 3: {"role": "admin"}})
+    users.add_index("role", lambda x: x["role"])
+
+    assert users.find_("role", "admin") == [(1, {"role": "admin"}), (3, {"role": "admin"})]
+
+    users[1] = {"role": "user"}
+    del users[3]
+    users[4] = {"role": "admin"}
+
+    assert users.find_("role", "user") == [(2, {"role": "user"}), (1, {"role": "user"})]
+    assert users.find_first_or_none_("role", "admin") == (4, {"role": "admin"})
+    assert users.find_first_or_none_("role", "guest") is None
+    with pytest.raises(ValueError, match=re.escape("Index email does not exist.")):
+        users.find_("email", "x")
+
+
+def test_indexed_dict_replaces_and_deletes_values_mutated_in_place():
+    users = IndexedDict({1: {"role": "admin"}, 2: {"role": "admin"}})
+    users.add_index("role", lambda x: x["role"])
+
+    users[1]["role"] = "user"
+    assert users.find_("role", "admin") == [(1, {"role": "user"}), (2, {"role": "admin"})]
+
+    users[1] = users[1]
+    users[2]["role"] = "guest"
+    del users[2]
+
+    assert users.find_("role", "user") == [(1, {"role": "user"})]
+    assert users.find_("role", "admin") == []
+    assert users.find_("role", "guest") == []
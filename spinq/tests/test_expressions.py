@@ -0,0 +1,147 @@
+import math
+import operator
+from dataclasses import dataclass
+from decimal import Decimal
+
+import pytest
+
+from spinq import lists, dicts
+from spinq.expressions import col, it, BinaryOperation, Constant, Element
+from spinq.query import Query
+from spinq.lists import where_, select_, any_, all_, order_by_, order_by_descending_
+
+
+@dataclass
+class Product:
+    name: str
+    price: int
+
+
+def test_expression_evaluates_single_item():
+    assert ((col > 5) & (col % 2 == 0))(8)
+    assert not ((col > 5) & (col % 2 == 0))(7)
+    assert (10 - col * 2)(3) == 4
+    assert abs(-col)(3) == 3
+
+
+def test_expression_is_introspectable():
+    expression = col > 5
+
+    assert isinstance(expression, BinaryOperation)
+    assert expression.operator_ is operator.gt
+    assert isinstance(expression.left_, Element)
+    assert isinstance(expression.right_, Constant) and expression.right_.value_ == 5
+    assert repr((col + 1) * 2) == "((it + 1) * 2)"
+
+
+def test_attribute_item_and_method_expressions():
+    product = Product("Lamp", 25)
+
+    assert (it.price > 10).function_(product)
+    assert it.name.lower().function_(product) == "lamp"
+    assert it.name.replace("L", "C", count=1).function_(product) == "Camp"
+    assert it["price"].function_({"price": 3}) == 3
+    assert (it["tags"][0] == "a").function_({"tags": ["a"]})
+    assert repr((it.price > 10) & (it.name.lower() != "test")) == "((it.price > 10) & (it.name.lower() != 'test'))"
+
+
+def test_expression_compiles_simple_lookups_to_getters():
+    assert isinstance(it.price.function_, operator.attrgetter)
+    assert isinstance(it.owner.name.function_, operator.attrgetter)
+    assert isinstance(it["price"].function_, operator.itemgetter)
+
+
+def test_expression_references_non_literal_constants():
+    product = Product("Lamp", 2)
+
+    assert (it.price + Decimal("0.5")).function_(product) == Decimal("2.5")
+    assert (it.price < math.inf).function_(product)
+    assert it.name.startswith(("L", "C")).function_(product)
+
+
+def test_attribute_names_must_be_identifiers():
+    with pytest.raises(ValueError):
+        getattr(it, "x + 1")
+    with pytest.raises(ValueError):
+        getattr(it, "class")
+
+
+def test_operators_accept_attribute_expressions():
+    products = [Product("Lamp", 25), Product("Desk", 120), Product("Pen", 2)]
+
+    assert where_(products, it.price > 10) == products[:2]
+    assert select_(products, it.name) == ["Lamp", "Desk", "Pen"]
+    assert order_by_(products, it.price) == [products[2], products[0], products[1]]
+    assert Query(products).where_(it.price < 100).select_(it.name.upper()).to_list_() == ["LAMP", "PEN"]
+    assert dicts.first_({1: products[0], 2: products[1]}, it.price > 100) == (2, products[1])
+
+
+def test_operators_without_predicate_return_items_directly():
+    assert lists.first_([3, 4]) == 3
+    assert lists.last_([3, 4]) == 4
+    assert lists.first_or_none_([]) is None
+    assert lists.first_or_none_with_index_(["a"]) == (0, "a")
+    assert dicts.first_or_none_({"a": 1}) == ("a", 1)
+    with pytest.raises(ValueError, match="No elements match the predicate."):
+        lists.last_([])
+
+
+def test_expression_cannot_be_used_as_boolean():
+    with pytest.raises(TypeError):
+        bool(col > 1)
+
+
+def test_list_operators_accept_expressions_for_non_numeric_items():
+    words = ["bb", "a", "ccc"]
+
+    assert where_(words, col != "a") == ["bb", "ccc"]
+    assert select_(words, col * 2) == ["bbbb", "aa", "cccccc"]
+    assert order_by_(words, col) == ["a", "bb", "ccc"]
+
+
+def test_list_operators_are_vectorized_for_numpy_arrays():
+    numpy = pytest.importorskip("numpy")
+    numbers = numpy.array([5, 1, 4, 1, 3])
+
+    assert where_(numbers, col > 2).tolist() == [5, 4, 3]
+    assert select_(numbers, col * 2 + 1).tolist() == [11, 3, 9, 3, 7]
+    assert any_(numbers, col == 4)
+    assert not all_(numbers, col > 1)
+    assert order_by_(numbers, col).tolist() == [1, 1, 3, 4, 5]
+    assert order_by_descending_(numpy.array([2.5, 0.5, 1.5]), col).tolist() == [2.5, 1.5, 0.5]
+
+
+def test_vectorized_order_by_descending_is_stable():
+    numpy = pytest.importorskip("numpy")
+    numbers = numpy.array([3, 1, 3, 2, 1])
+
+    result = order_by_descending_(numbers, col % 2)
+
+    assert isinstance(result, numpy.ndarray)
+    assert result.tolist() == [3, 1, 3, 1, 2]
+
+
+def test_vectorized_operators_fall_back_to_items_for_other_sequences():
+    numpy = pytest.importorskip("numpy")
+
+    assert where_([5, 1, 4], col > 2) == [5, 4]
+    assert select_(numpy.array(["a", "b"]), col + "!") == ["a!", "b!"]
+
+
+@pytest.mark.parametrize("predicate", [~(it > 5), ~((it > 1) & (it < 10)), ~~(it > 5), (it > 1) & ~(it == 10)])
+def test_negated_conditions_give_same_results_for_lists_and_arrays(predicate):
+    numpy = pytest.importorskip("numpy")
+    numbers = [1, 2, 10]
+
+    assert where_(numbers, predicate) == where_(numpy.array(numbers), predicate).tolist()
+    assert Query(numbers).where_(predicate).to_list_() == where_(numbers, predicate)
+    assert any_(numbers, predicate) == any_(numpy.array(numbers), predicate)
+    assert all_(numbers, predicate) == all_(numpy.array(numbers), predicate)
+
+
+def test_negated_conditions_filter_items():
+    assert where_([1, 2, 10], ~(it > 5)) == [1, 2]
+    assert where_(["x", "yy"], ~(it == "x")) == ["yy"]
+    assert where_([Product("a", 3), Product("b", 7)], ~(it.price > 5)) == [Product("a", 3)]
+    assert where_([True, False], ~it) == [False]
+    assert select_([5, 0], ~it) == [-6, -1]
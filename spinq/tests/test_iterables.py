@@ -0,0 +1,66 @@
+import operator
+
+import pytest
+
+from spinq.iterables import chunk_, window_, pairwise_, zip_, scan_, distinct_until_changed_
+from spinq.query import Query
+
+
+def test_chunk_splits_any_iterable_lazily():
+    chunks = chunk_(iter(range(7)), 3)
+
+    assert next(chunks) == [0, 1, 2]
+    assert list(chunks) == [[3, 4, 5], [6]]
+
+
+def test_chunk_of_bytes_shares_the_buffer():
+    buffer = bytearray(b"abcdefg")
+
+    chunks = list(chunk_(buffer, 3))
+    buffer[0:1] = b"z"
+
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+    assert [bytes(chunk) for chunk in chunks] == [b"zbc", b"def", b"g"]
+
+
+def test_window_yields_full_windows_with_step():
+    assert list(window_(range(5), 3)) == [(0, 1, 2), (1, 2, 3), (2, 3, 4)]
+    assert list(window_(range(7), 2, 3)) == [(0, 1), (3, 4)]
+    assert list(window_(range(2), 3)) == []
+    assert [bytes(window) for window in window_(b"abcde", 2, 2)] == [b"ab", b"cd"]
+
+
+def test_chunk_and_window_validate_size():
+    with pytest.raises(ValueError, match="Size must be positive."):
+        chunk_([1], 0)
+    with pytest.raises(ValueError, match="Step must be positive."):
+        window_([1], 1, 0)
+
+
+def test_pairwise_zip_and_scan():
+    assert list(pairwise_("abc")) == [("a", "b"), ("b", "c")]
+    assert list(zip_([1, 2], "ab")) == [(1, "a"), (2, "b")]
+    with pytest.raises(ValueError):
+        list(zip_([1, 2], "a", strict=True))
+    assert list(scan_([1, 2, 3], operator.add)) == [1, 3, 6]
+    assert list(scan_([1, 2, 3], operator.add, 10)) == [11, 13, 16]
+
+
+def test_distinct_until_changed_removes_consecutive_duplicates():
+    assert list(distinct_until_changed_([1, 1, 2, 2, 1, 3, 3])) == [1, 2, 1, 3]
+    assert list(distinct_until_changed_(["a", "A", "b"], str.lower)) == ["a", "b"]
+
+
+def test_query_streaming_operators():
+    def numbers():
+        number = 0
+        while True:
+            yield number
+            number += 1
+
+    assert Query(numbers()).chunk_(2).first_() == [0, 1]
+    assert Query(numbers()).window_(3).select_(sum).take_(3).to_list_() == [3, 6, 9]
+    assert Query(numbers()).pairwise_().first_() == (0, 1)
+    assert Query("ab").zip_(numbers()).to_list_() == [("a", 0), ("b", 1)]
+    assert Query(numbers()).scan_(operator.add).take_(4).to_list_() == [0, 1, 3, 6]
+    assert Query([1, 1, 2]).distinct_until_changed_().to_list_() == [1, 2]
@@ -0,0 +1,157 @@
+import pytest
+
+from spinq.lists import except_, union_, intersect_, distinct_, distinct_by_, HashAwareSet, select_many_, iterate_select_many_, single_, single_or_none_, \
+    group_by_, to_lookup_, join_, group_join_, aggregate_, sum_, min_by_, max_by_, count_by_, take_, skip_
+
+
+def test_except_removes_exclusions_and_keeps_order():
+    assert except_([5, 1, 4, 2, 3], [4, 1]) == [5, 2, 3]
+
+
+def test_except_supports_unhashable_items():
+    assert except_([[1], [2], {"a": 3}], [[2], {"a": 3}]) == [[1]]
+
+
+def test_union_keeps_order_of_first_occurrence():
+    assert union_([3, 1, 3], [2, 1, 4]) == [3, 1, 2, 4]
+
+
+def test_union_supports_unhashable_items():
+    assert union_([[1], 2], [[1], [3]]) == [[1], 2, [3]]
+
+
+def test_intersect_returns_distinct_common_items_in_order_of_first_sequence():
+    assert intersect_([4, 1, 2, 1, 3], [3, 1, 5]) == [1, 3]
+
+
+def test_distinct_keeps_order_of_first_occurrence():
+    assert distinct_([3, 1, 3, 2, 1]) == [3, 1, 2]
+
+
+def test_distinct_supports_unhashable_items():
+    assert distinct_([{"a": 1}, [1], {"a": 1}, [1]]) == [{"a": 1}, [1]]
+
+
+def test_distinct_by_keeps_first_item_for_each_key():
+    assert distinct_by_(["aa", "b", "cc", "d", "eee"], len) == ["aa", "b", "eee"]
+
+
+def test_hash_aware_set_adds_items_once():
+    items = HashAwareSet([1, [2]])
+
+    assert items.add(3)
+    assert not items.add(1)
+    assert not items.add([2])
+    assert [2] in items
+    assert len(items) == 3
+
+
+def test_hash_aware_set_finds_equal_hashable_and_unhashable_items():
+    hashable_first = HashAwareSet([frozenset({1}), [2]])
+    unhashable_first = HashAwareSet([{1}])
+
+    assert {1} in hashable_first
+    assert not hashable_first.add({1})
+    assert frozenset({1}) in unhashable_first
+    assert not unhashable_first.add(frozenset({1}))
+    assert (len(hashable_first), len(unhashable_first)) == (2, 1)
+    assert distinct_([{3}, frozenset({3}), {4}]) == [{3}, {4}]
+
+
+def test_select_many_keeps_all_items_in_order():
+    result = select_many_(list(range(12)), lambda x: list(range(12)))
+
+    assert len(result) == 144
+    assert result[:13] == list(range(12)) + [0]
+
+
+def test_select_many_flattens_any_iterable_and_keeps_strings_and_scalars():
+    result = select_many_([1, 2, 3], lambda x: (y for y in range(x)) if x < 3 else "abc")
+
+    assert result == [0, 0, 1, "abc"]
+
+
+def test_iterate_select_many_is_lazy():
+    iterator = iterate_select_many_(iter([1, 2]), lambda x: [x, x])
+
+    assert next(iterator) == 1
+    assert list(iterator) == [1, 2, 2]
+
+
+def test_single_stops_at_second_match():
+    visited = []
+
+    def is_even(x: int) -> bool:
+        visited.append(x)
+        return x % 2 == 0
+
+    with pytest.raises(ValueError, match="More than one element matches the predicate."):
+        single_(iter(range(100)), is_even)
+    assert visited == [0, 1, 2]
+
+
+def test_single_returns_the_only_match_of_any_iterable():
+    assert single_((x for x in range(10)), lambda x: x == 5) == 5
+
+
+def test_single_raises_when_nothing_matches():
+    with pytest.raises(ValueError, match="No elements match the predicate."):
+        single_([1, 2], lambda x: x > 2)
+
+
+def test_single_or_none_returns_none_when_nothing_matches():
+    assert single_or_none_(range(3), lambda x: x > 2) is None
+
+
+def test_single_or_none_raises_for_two_none_matches():
+    with pytest.raises(ValueError, match="More than one element matches the predicate."):
+        single_or_none_([None, None], lambda x: x is None)
+
+
+def test_group_by_keeps_order_of_keys_and_items():
+    assert group_by_(["bb", "a", "cc", "d"], len) == {2: ["bb", "cc"], 1: ["a", "d"]}
+    assert group_by_(["bb", "a", "cc"], len, str.upper) == {2: ["BB", "CC"], 1: ["A"]}
+
+
+def test_to_lookup_returns_empty_group_for_missing_key():
+    lookup = to_lookup_(range(5), lambda x: x % 2)
+    assert lookup[0] == [0, 2, 4]
+    assert lookup[3] == []
+    assert 3 not in lookup
+
+
+def test_join_matches_items_by_key():
+    people = [("ann", 1), ("bob", 2), ("eve", 3)]
+    pets = [(1, "cat"), (2, "dog"), (1, "fish")]
+    assert join_(people, pets, lambda x: x[1], lambda x: x[0], lambda x, y: (x[0], y[1])) == \
+        [("ann", "cat"), ("ann", "fish"), ("bob", "dog")]
+
+
+def test_group_join_keeps_outer_items_without_matches():
+    assert group_join_([1, 2, 3], ["a", "bb", "cc"], lambda x: x, len) == [(1, ["a"]), (2, ["bb", "cc"]), (3, [])]
+
+
+def test_aggregate_with_and_without_seed():
+    assert aggregate_([1, 2, 3], lambda acc, x: acc * 10 + x) == 123
+    assert aggregate_(iter([1, 2, 3]), lambda acc, x: acc + [x], []) == [1, 2, 3]
+    assert aggregate_([], lambda acc, x: acc + x, 0) == 0
+    with pytest.raises(ValueError, match="Sequence contains no elements."):
+        aggregate_([], lambda acc, x: acc + x)
+
+
+def test_sum_min_by_max_by_and_count_by():
+    words = ["bb", "a", "ccc", "dd"]
+    assert sum_(words, len) == 8
+    assert sum_(range(4)) == 6
+    assert min_by_(words, len) == "a"
+    assert max_by_(words, len) == "ccc"
+    assert count_by_(words, len) == {2: 2, 1: 1, 3: 1}
+    with pytest.raises(ValueError, match="Sequence contains no elements."):
+        max_by_([], len)
+
+
+def test_take_and_skip():
+    assert take_(iter(range(5)), 2) == [0, 1]
+    assert take_([1], -1) == []
+    assert skip_(range(5), 3) == [3, 4]
+    assert skip_([1, 2], 5) == []
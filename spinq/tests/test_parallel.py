@@ -0,0 +1,58 @@
+import operator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from spinq.expressions import it
+from spinq.parallel import parallel
+
+
+def square(x: int) -> int:
+    return x * x
+
+
+def is_odd(x: int) -> bool:
+    return x % 2 == 1
+
+
+def repeat(x: int) -> list[int]:
+    return [x] * (x % 3)
+
+
+def test_parallel_operators_preserve_order_with_processes():
+    numbers = range(1000)
+
+    assert parallel(numbers, chunk_size=64, max_workers=2).select_(square) == [square(x) for x in numbers]
+    assert parallel(numbers, chunk_size=64, max_workers=2).where_(is_odd) == [x for x in numbers if is_odd(x)]
+
+
+def test_parallel_operators_send_expressions_to_processes():
+    numbers = range(1000)
+
+    assert parallel(numbers, chunk_size=64, max_workers=2).select_(it * 2) == [x * 2 for x in numbers]
+    assert parallel(numbers, chunk_size=64, max_workers=2).where_(it.real > 5) == [x for x in numbers if x > 5]
+
+
+def test_parallel_operators_with_custom_executor():
+    numbers = list(range(100))
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        query = parallel(iter(numbers), chunk_size=7, max_workers=3, executor=executor)
+        assert query.select_many_(repeat) == [y for x in numbers for y in repeat(x)]
+        assert parallel(numbers, chunk_size=7, executor=executor).select_(lambda x: -x) == [-x for x in numbers]
+
+
+def test_parallel_aggregate_combines_chunk_results():
+    with ThreadPoolExecutor() as executor:
+        assert parallel(range(101), chunk_size=10, executor=executor).aggregate_(operator.add) == 5050
+        assert parallel(range(101), chunk_size=10, executor=executor).aggregate_(operator.add, 0) == 5050
+        assert parallel(["ab", "c", "de"], chunk_size=2, executor=executor).aggregate_(
+            lambda acc, x: acc + len(x), 0, operator.add) == 5
+        assert parallel([], executor=executor).aggregate_(operator.add, 0) == 0
+        with pytest.raises(ValueError, match="Sequence contains no elements."):
+            parallel([], executor=executor).aggregate_(operator.add)
+
+
+def test_parallel_rejects_non_positive_chunk_size():
+    with pytest.raises(ValueError, match="Chunk size must be positive."):
+        parallel([1], chunk_size=0)
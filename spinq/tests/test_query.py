@@ -0,0 +1,149 @@
+import pytest
+
+from spinq.query import Query
+
+
+def infinite_numbers():
+    number = 0
+    while True:
+        yield number
+        number += 1
+
+
+def test_query_applies_stages_in_order():
+    result = Query(range(10)).where_(lambda x: x % 2 == 1).select_(lambda x: x * 10).where_(lambda x: x > 10).select_(str).to_list_()
+    assert result == ['30', '50', '70', '90']
+
+
+def test_query_is_lazy_and_stops_at_first_match():
+    visited = []
+
+    def visit(x: int) -> int:
+        visited.append(x)
+        return x
+
+    result = Query(infinite_numbers()).select_(visit).where_(lambda x: x > 2).select_(lambda x: x * 2).first_()
+
+    assert result == 6
+    assert visited == [0, 1, 2, 3]
+
+
+def test_query_can_be_iterated_many_times_over_reiterable_source():
+    query = Query([1, 2, 3]).select_(lambda x: x + 1)
+    assert list(query) == [2, 3, 4]
+    assert list(query) == [2, 3, 4]
+
+
+def test_query_operators_do_not_modify_original_query():
+    query = Query([1, 2, 3])
+    query.where_(lambda x: x > 1)
+    assert query.to_list_() == [1, 2, 3]
+
+
+def test_query_select_many_flattens_results():
+    assert Query([[1, 2], [], [3]]).select_many_(lambda x: x).to_list_() == [1, 2, 3]
+
+
+def test_query_distinct_and_order_by():
+    assert Query([3, 1, 3, 2]).distinct_().order_by_(lambda x: x).to_list_() == [1, 2, 3]
+    assert Query([3, 1, 3, 2]).order_by_descending_(lambda x: x).to_list_() == [3, 3, 2, 1]
+
+
+def test_query_terminal_operators():
+    query = Query(range(5)).where_(lambda x: x > 0)
+
+    assert query.first_() == 1
+    assert query.first_(lambda x: x > 2) == 3
+    assert query.first_or_none_(lambda x: x > 10) is None
+    assert query.last_() == 4
+    assert query.last_or_none_(lambda x: x > 10) is None
+    assert query.any_(lambda x: x == 4)
+    assert query.all_(lambda x: x > 0)
+    assert query.none_(lambda x: x > 4)
+    assert query.count_() == 4
+    assert query.count_(lambda x: x % 2 == 0) == 2
+
+
+def test_query_first_raises_when_nothing_matches():
+    with pytest.raises(ValueError, match="No elements match the predicate."):
+        Query([1, 2]).first_(lambda x: x > 2)
+
+
+def test_query_last_raises_when_nothing_matches():
+    with pytest.raises(ValueError, match="No elements match the predicate."):
+        Query([]).last_()
+
+
+def test_query_set_operators_keep_order():
+    assert Query([1, 2, 2, 3]).except_([2]).to_list_() == [1, 3]
+    assert Query([1, 2]).union_([2, 3]).to_list_() == [1, 2, 3]
+    assert Query([3, 1, 2, 3]).intersect_([3, 2]).to_list_() == [3, 2]
+    assert Query(["aa", "b", "cc"]).distinct_by_(len).to_list_() == ["aa", "b"]
+
+
+def test_query_single_operators():
+    assert Query(range(10)).where_(lambda x: x > 8).single_() == 9
+    assert Query(range(10)).single_or_none_(lambda x: x > 9) is None
+    with pytest.raises(ValueError, match="More than one element matches the predicate."):
+        Query(range(10)).single_(lambda x: x > 7)
+
+
+def test_query_grouping_and_join_operators():
+    query = Query(range(6)).where_(lambda x: x > 0)
+
+    assert query.group_by_(lambda x: x % 2).to_list_() == [(1, [1, 3, 5]), (0, [2, 4])]
+    assert query.join_(["a", "bb"], lambda x: x, len, lambda x, y: y * x).to_list_() == ["a", "bbbb"]
+    assert query.group_join_(["a", "bb", "cc"], lambda x: x, len).first_() == (1, ["a"])
+    assert query.to_lookup_(lambda x: x % 3)[0] == [3]
+
+
+def test_query_join_streams_outer_sequence():
+    joined = Query(infinite_numbers()).join_([2, 4], lambda x: x, lambda x: x)
+    assert joined.first_() == (2, 2)
+
+
+def test_query_aggregation_operators():
+    query = Query(["bb", "a", "ccc"])
+
+    assert query.aggregate_(lambda acc, x: acc + x) == "bbaccc"
+    assert query.sum_(len) == 6
+    assert query.min_by_(len) == "a"
+    assert query.max_by_(len) == "ccc"
+    assert query.count_by_(len) == {2: 1, 1: 1, 3: 1}
+
+
+def test_query_take_and_skip():
+    assert Query(infinite_numbers()).skip_(2).take_(3).to_list_() == [2, 3, 4]
+    assert Query(range(3)).take_(0).to_list_() == []
+
+
+def test_query_ordered_take_matches_full_sort():
+    items = [(x * 7919 % 101, x) for x in range(200)]
+    query = Query(items).order_by_descending_(lambda x: x[0])
+
+    assert query.take_(10).to_list_() == sorted(items, key=lambda x: x[0], reverse=True)[:10]
+    assert query.skip_(5).take_(10).to_list_() == sorted(items, key=lambda x: x[0], reverse=True)[5:15]
+    assert query.take_(10).take_(3).to_list_() == sorted(items, key=lambda x: x[0], reverse=True)[:3]
+
+
+def test_query_then_by_is_stable_with_mixed_directions():
+    items = [("b", 1, 0), ("a", 2, 1), ("b", 2, 2), ("a", 1, 3), ("a", 2, 4)]
+    query = Query(items).order_by_(lambda x: x[0]).then_by_descending_(lambda x: x[1])
+
+    assert query.to_list_() == [("a", 2, 1), ("a", 2, 4), ("a", 1, 3), ("b", 2, 2), ("b", 1, 0)]
+    assert query.take_(2).to_list_() == [("a", 2, 1), ("a", 2, 4)]
+    assert Query(items).order_by_descending_(lambda x: x[0]).then_by_descending_(lambda x: x[1]).take_(2).to_list_() == \
+        [("b", 2, 2), ("b", 1, 0)]
+
+
+def test_query_ordered_take_is_stable_with_mixed_directions_and_many_ties():
+    items = [(x % 3, x % 2, x) for x in range(100)]
+    query = Query(items).order_by_(lambda x: x[0]).then_by_descending_(lambda x: x[1])
+
+    for count in [1, 5, 17, 40, 100]:
+        assert query.take_(count).to_list_() == query.to_list_()[:count]
+
+
+def test_query_then_by_requires_ordering():
+    with pytest.raises(ValueError, match="then_by_ must directly follow"):
+        Query([1]).where_(lambda x: x > 0).then_by_(lambda x: x)
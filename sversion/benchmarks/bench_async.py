@@ -0,0 +1,74 @@
+"""
+Compares version lookups on a simulated slow filesystem, where every os.stat takes the given latency:
+the blocking composite get_version, get_version_async, which offloads it to a thread, and probe_version_async,
+which probes all parent folders at once. Reports the lookup latency and the longest stall of the event loop.
+
+    python benchmarks/bench_async.py [latency in ms] [depth]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sversion import composite
+from sversion.async_based import get_version_async, probe_version_async
+from sversion.version_cache import version_cache
+
+
+def simulate_slow_filesystem(latency: float) -> None:
+    stat = os.stat
+
+    def slow_stat(*args, **kwargs):
+        time.sleep(latency)
+        return stat(*args, **kwargs)
+
+    os.stat = slow_stat
+
+
+async def measure(lookup) -> tuple[float, float]:
+    longest_stall = 0.0
+    running = True
+
+    async def heartbeat():
+        nonlocal longest_stall
+        while running:
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            longest_stall = max(longest_stall, time.perf_counter() - started - 0.001)
+
+    heartbeat_task = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.01)
+    version_cache.clear()
+    started = time.perf_counter()
+    await lookup()
+    elapsed = time.perf_counter() - started
+    running = False
+    await heartbeat_task
+    return elapsed, longest_stall
+
+
+async def main(latency: float, depth: int) -> None:
+    with tempfile.TemporaryDirectory() as root, ThreadPoolExecutor(max_workers=2 * (depth + 10)) as executor:
+        with open(os.path.join(root, "pyproject.toml"), "w") as project_file:
+            project_file.write('[project]\nversion = "1.0.0"\n')
+        path = os.path.join(root, *[f"level{level}" for level in range(depth)])
+        os.makedirs(path)
+        simulate_slow_filesystem(latency)
+
+        async def blocking():
+            composite.get_version(path)
+
+        cases = [
+            ("get_version", blocking),
+            ("get_version_async", lambda: get_version_async(path, executor=executor)),
+            ("probe_version_async", lambda: probe_version_async(path, executor=executor)),
+        ]
+        for name, lookup in cases:
+            elapsed, stall = await measure(lookup)
+            print(f"{name:<20} {elapsed * 1000:8.1f} ms latency {stall * 1000:8.1f} ms longest event loop stall")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.002, int(sys.argv[2]) if len(sys.argv) > 2 else 10))
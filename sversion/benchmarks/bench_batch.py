@@ -0,0 +1,62 @@
+"""
+Resolves the versions of packages of a generated monorepo with get_version per package and with get_versions at once.
+
+    python benchmarks/bench_batch.py [packages]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from sversion import version_file_based, pyproject_toml_based
+from sversion.batch import get_versions
+from sversion.error_handling import VersionNotFoundException
+from sversion.version_cache import version_cache
+
+
+def create_monorepo(root: str, packages: int) -> list[str]:
+    with open(os.path.join(root, "pyproject.toml"), "w") as project_file:
+        project_file.write('[tool.poetry]\nname = "monorepo"\nversion = "1.0.0"\n')
+    paths = []
+    for index in range(packages):
+        source = os.path.join(root, "packages", f"group{index % 10}", f"package{index}", "src", f"package{index}")
+        os.makedirs(source)
+        if index % 2:
+            with open(os.path.join(root, "packages", f"group{index % 10}", f"package{index}", "VERSION.txt"), "w") as file:
+                file.write(f"{index}.0.0")
+        paths.append(source)
+    return paths
+
+
+def get_version_per_package(paths: list[str]) -> dict[str, str]:
+    versions = {}
+    for path in paths:
+        try:
+            versions[path] = version_file_based.get_version(path)
+        except VersionNotFoundException:
+            versions[path] = pyproject_toml_based.get_version(path)
+    return versions
+
+
+def measure(function) -> tuple[float, object]:
+    started = time.perf_counter()
+    result = function()
+    return time.perf_counter() - started, result
+
+
+def main(packages: int) -> None:
+    with tempfile.TemporaryDirectory() as root:
+        paths = create_monorepo(root, packages)
+        version_cache.clear()
+        cold_seconds, expected = measure(lambda: get_version_per_package(paths))
+        warm_seconds, _ = measure(lambda: get_version_per_package(paths))
+        batch_seconds, versions = measure(lambda: get_versions(paths))
+        assert versions == expected
+
+    print(f"get_version per package, cold cache {cold_seconds * 1000:8.1f} ms")
+    print(f"get_version per package, warm cache {warm_seconds * 1000:8.1f} ms")
+    print(f"get_versions                        {batch_seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,42 @@
+"""
+Times get_version in a fresh interpreter, which is what CLI startup pays, against loading pyproject.toml fully
+with the toml package and with tomllib.
+
+    python benchmarks/bench_startup.py [runs]
+"""
+import os
+import subprocess
+import sys
+import time
+
+PROJECT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_FILE = os.path.join(PROJECT_DIRECTORY, "pyproject.toml")
+
+CASES = [
+    ("interpreter", "pass"),
+    ("toml.load", f"import toml; toml.load({PROJECT_FILE!r})['tool']['poetry']['version']"),
+    ("tomllib.load", f"import tomllib; tomllib.load(open({PROJECT_FILE!r}, 'rb'))['tool']['poetry']['version']"),
+    ("get_version", f"from sversion.pyproject_toml_based import get_version; get_version({PROJECT_DIRECTORY!r})"),
+]
+
+
+def measure(code: str, runs: int) -> float:
+    environment = dict(os.environ, PYTHONPATH=os.path.join(PROJECT_DIRECTORY, "src"))
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=environment)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(runs: int) -> None:
+    for name, code in CASES:
+        try:
+            print(f"{name:<16} {measure(code, runs) * 1000:8.1f} ms")
+        except subprocess.CalledProcessError:
+            print(f"{name:<16} {'n/a':>8}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,67 @@
+"""
+Compares sorting and comparing versions, which are parsed once, with parsing the strings for every comparison,
+and the composite get_version, which walks the folders once, with trying each retriever in turn.
+
+    python benchmarks/bench_versions.py [versions]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from functools import cmp_to_key
+from operator import attrgetter
+
+from sversion import composite, version_file_based, pyproject_toml_based
+from sversion.error_handling import VersionNotFoundException
+from sversion.parsed_version import parse_version
+from sversion.version_cache import version_cache
+
+
+def measure(function) -> float:
+    started = time.perf_counter()
+    function()
+    return time.perf_counter() - started
+
+
+def compare_strings(first: str, second: str) -> int:
+    first_version, second_version = parse_version(first), parse_version(second)
+    return (first_version > second_version) - (first_version < second_version)
+
+
+def get_version_in_turn(path: str) -> str:
+    for get_version in (version_file_based.get_version, pyproject_toml_based.get_version):
+        try:
+            return get_version(path)
+        except VersionNotFoundException:
+            continue
+    raise VersionNotFoundException("Version was not found.")
+
+
+def main(count: int) -> None:
+    generator = random.Random(42)
+    strings = [f"{generator.randrange(5)}.{generator.randrange(20)}.{generator.randrange(50)}"
+               f"{generator.choice(['', 'a1', 'rc2', '.post1', '.dev3'])}" for _ in range(count)]
+    parsed = list(map(parse_version, strings))
+    latest = max(parsed)
+
+    print(f"parse {count} versions               {measure(lambda: list(map(parse_version, strings))) * 1000:8.1f} ms")
+    print(f"sort strings, parse per comparison {measure(lambda: sorted(strings, key=cmp_to_key(compare_strings))) * 1000:8.1f} ms")
+    print(f"sort parsed versions               {measure(lambda: sorted(parsed)) * 1000:8.1f} ms")
+    print(f"sort parsed versions by key        {measure(lambda: sorted(parsed, key=attrgetter('key'))) * 1000:8.1f} ms")
+    print(f"compare strings with the latest    {measure(lambda: [compare_strings(s, str(latest)) for s in strings]) * 1000:8.1f} ms")
+    print(f"compare parsed with the latest     {measure(lambda: [version < latest for version in parsed]) * 1000:8.1f} ms")
+
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(root, "pyproject.toml"), "w") as project_file:
+            project_file.write('[project]\nversion = "1.0.0"\n')
+        path = os.path.join(root, *[f"level{level}" for level in range(10)])
+        os.makedirs(path)
+        for name, get_version in (("retrievers in turn", get_version_in_turn), ("composite", composite.get_version)):
+            version_cache.clear()
+            print(f"{name:<34} {measure(lambda: get_version(path)) * 1000:8.1f} ms cold, "
+                  f"{measure(lambda: get_version(path)) * 1000:8.1f} ms warm")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -1,8 +1,27 @@
 __author__ = "kostiantyn.chomakov@gmail.com"
 
-from . import version_file_based, error_handling, contracts
+from . import version_file_based, pyproject_toml_based, error_handling, contracts, version_cache
+
+__LAZY_MODULES = {'batch', 'composite', 'parsed_version', 'async_based'}
 
 __all__ = ['version_file_based',
            'pyproject_toml_based',
            'error_handling',
-           'contracts']
\ No newline at end of file
+           'contracts',
+           'version_cache',
+           'batch',
+           'composite',
+           'parsed_version',
+           'async_based']
+
+
+def __getattr__(name: str):
+    """
+    Imports the modules, which are not needed to read a version file, on first access,
+    so importing sversion does not import asyncio and importlib.metadata.
+    """
+    if name in __LAZY_MODULES:
+        import importlib
+
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,60 @@
+import asyncio
+import os
+from concurrent.futures import Executor
+
+from . import composite, version_file_based, pyproject_toml_based
+from .contracts import Version, VersionRetriever
+from .error_handling import VersionNotFoundException
+
+async def get_version_async(start_search_path: str,
+                            retriever: VersionRetriever = composite.get_version,
+                            executor: Executor | None = None) -> Version:
+    """
+    Runs the retriever in the executor, the default executor of the event loop when None,
+    so the filesystem probes of the walk do not block the event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(executor, retriever, start_search_path)
+
+async def probe_version_async(start_search_path: str,
+                              version_file_name: str = "VERSION.txt",
+                              project_file_name: str = "pyproject.toml",
+                              distribution_name: str | None = None,
+                              executor: Executor | None = None) -> Version:
+    """
+    Same as composite.get_version, but probes all parent folders at once in the executor instead of one after another,
+    so a slow filesystem costs about one probe instead of one probe per folder. The executor should have a worker
+    for each probe, i.e. two per folder, to probe them all at once.
+    """
+    error_message = composite.get_not_found_message(version_file_name, project_file_name)
+    loop = asyncio.get_running_loop()
+    sources = ((version_file_name, version_file_based.read_version),
+               (project_file_name, pyproject_toml_based.read_version))
+
+    try:
+        if await loop.run_in_executor(executor, os.path.isfile, start_search_path):
+            start_search_path = os.path.dirname(start_search_path)
+
+        directories = _get_directories(start_search_path)
+        file_paths = [os.path.join(directory, file_name) for directory in directories for file_name, _ in sources]
+        found = await asyncio.gather(*(loop.run_in_executor(executor, os.path.exists, path) for path in file_paths))
+
+        for (file_path, exists), (_, read_version) in zip(zip(file_paths, found), sources * len(directories)):
+            if exists:
+                version = await loop.run_in_executor(executor, read_version, file_path)
+                if version is not None:
+                    return version
+    except PermissionError:
+        raise VersionNotFoundException(error_message)
+
+    version = await loop.run_in_executor(executor, composite.read_installed_version, start_search_path, distribution_name)
+    if version is None:
+        raise VersionNotFoundException(error_message)
+    return version
+
+def _get_directories(start_search_path: str) -> list[str]:
+    directories = []
+    current_path = start_search_path
+    while current_path != os.path.dirname(current_path):
+        directories.append(current_path)
+        current_path = os.path.dirname(current_path)
+    return directories
@@ -0,0 +1,65 @@
+import os
+from collections.abc import Iterable
+
+from . import version_file_based, pyproject_toml_based
+from .contracts import Version
+from .version_cache import VersionReader
+
+def get_versions(start_search_paths: Iterable[str],
+                 version_file_name: str | None = "VERSION.txt",
+                 project_file_name: str | None = "pyproject.toml") -> dict[str, Version | None]:
+    """
+    Resolves the versions of many start paths in one pass and returns them by start path, None for the paths without one.
+    Each directory is listed once with os.scandir to find both the version file and the project file,
+    where the version file takes precedence, and the version found for a directory is shared by all start paths below it.
+    Pass None as a file name to skip that source.
+    """
+    readers = {file_name: reader
+               for file_name, reader in ((version_file_name, version_file_based.read_version),
+                                         (project_file_name, pyproject_toml_based.read_version))
+               if file_name is not None}
+    resolved_directories: dict[str, Version | None] = {}
+
+    versions = {}
+    for start_search_path in start_search_paths:
+        directory = os.path.dirname(start_search_path) if os.path.isfile(start_search_path) else start_search_path
+        versions[start_search_path] = _resolve(directory, readers, resolved_directories)
+    return versions
+
+def _resolve(directory: str,
+             readers: dict[str, VersionReader],
+             resolved_directories: dict[str, Version | None]) -> Version | None:
+    walked_directories = []
+    version = None
+
+    current_path = directory
+    while current_path != os.path.dirname(current_path):
+        if current_path in resolved_directories:
+            version = resolved_directories[current_path]
+            break
+        walked_directories.append(current_path)
+        try:
+            version = _read_directory_version(current_path, readers)
+        except PermissionError:
+            break
+        if version is not None:
+            break
+        current_path = os.path.dirname(current_path)
+
+    for walked_directory in walked_directories:
+        resolved_directories[walked_directory] = version
+    return version
+
+def _read_directory_version(directory: str, readers: dict[str, VersionReader]) -> Version | None:
+    try:
+        with os.scandir(directory) as entries:
+            file_names = {entry.name for entry in entries if entry.name in readers and entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    for file_name, read_version in readers.items():
+        if file_name in file_names:
+            version = read_version(os.path.join(directory, file_name))
+            if version is not None:
+                return version
+    return None
@@ -0,0 +1,68 @@
+import os
+import sys
+from functools import cache
+
+from . import version_file_based, pyproject_toml_based
+from .contracts import Version, VersionRetriever
+from .error_handling import VersionNotFoundException
+from .version_cache import version_cache
+
+def read_installed_version(start_search_path: str, distribution_name: str | None = None) -> Version | None:
+    """
+    Returns the version of the installed distribution, which provides the top-level package of the start path,
+    or of the distribution with the given name.
+    """
+    from importlib import metadata
+
+    distribution_names = [distribution_name] if distribution_name is not None \
+        else _get_distribution_names(start_search_path)
+    for name in distribution_names:
+        try:
+            return metadata.version(name)
+        except metadata.PackageNotFoundError:
+            continue
+    return None
+
+def get_not_found_message(version_file_name: str, project_file_name: str) -> str:
+    return (f"Neither {version_file_name} nor {project_file_name} was found in the module folder or one of "
+            f"the parent folders, and the module does not belong to an installed distribution.")
+
+def __get_version(start_search_path: str,
+                  version_file_name: str = "VERSION.txt",
+                  project_file_name: str = "pyproject.toml",
+                  distribution_name: str | None = None) -> Version:
+    """
+    Walks from the start path up to the root once and returns the version from the first folder,
+    which contains the version file or the project file with a version, where the version file takes precedence.
+    Falls back to the metadata of the installed distribution, when neither is found.
+    """
+    error_message = get_not_found_message(version_file_name, project_file_name)
+
+    sources = ((version_file_name, version_file_based.read_version),
+               (project_file_name, pyproject_toml_based.read_version))
+    try:
+        version = version_cache.find_first_version(start_search_path, sources)
+    except PermissionError:
+        raise VersionNotFoundException(error_message)
+
+    if version is None:
+        version = read_installed_version(start_search_path, distribution_name)
+    if version is None:
+        raise VersionNotFoundException(error_message)
+    return version
+get_version: VersionRetriever = __get_version
+
+def _get_distribution_names(start_search_path: str) -> list[str]:
+    start_search_path = os.path.abspath(start_search_path)
+    for import_path in sys.path:
+        import_path = os.path.abspath(import_path or os.curdir)
+        if start_search_path.startswith(import_path + os.sep):
+            top_level_name = os.path.relpath(start_search_path, import_path).split(os.sep)[0]
+            return _get_packages_distributions().get(top_level_name.removesuffix(".py"), [])
+    return []
+
+@cache
+def _get_packages_distributions() -> dict[str, list[str]]:
+    from importlib import metadata
+
+    return metadata.packages_distributions()
@@ -4,3 +4,11 @@ class VersionNotFoundException(Exception):
 
     def __str__(self):
         return self.message
+
+
+class InvalidVersionException(ValueError):
+    def __init__(self, message):
+        self.message = message
+
+    def __str__(self):
+        return self.message
@@ -0,0 +1,168 @@
+import math
+
+from .contracts import Version
+from .error_handling import InvalidVersionException
+
+PRE_RELEASE_LABELS = {"a": "a", "alpha": "a", "b": "b", "beta": "b", "c": "rc", "rc": "rc", "pre": "rc", "preview": "rc"}
+POST_RELEASE_LABELS = ("post", "rev", "r")
+DEVELOPMENT_RELEASE_LABELS = ("dev",)
+
+__PRE_RELEASE_RANKS = {"a": 0, "b": 1, "rc": 2}
+__VERSION_PATTERN = None
+
+
+class ParsedVersion:
+    """
+    PEP 440 version, which is parsed once and compared by a precomputed key,
+    so sorting and comparing many versions does not parse the strings again.
+    Parsed versions are immutable, hashable and equal, when their normalized forms are equal, e.g. 1.0 and 1.0.0.
+    """
+    __slots__ = ('epoch', 'release', 'pre', 'post', 'dev', 'local', 'key', '_hash')
+
+    def __init__(self,
+                 release: tuple[int, ...],
+                 epoch: int = 0,
+                 pre: tuple[str, int] | None = None,
+                 post: int | None = None,
+                 dev: int | None = None,
+                 local: tuple[str | int, ...] | None = None):
+        object.__setattr__(self, 'epoch', epoch)
+        object.__setattr__(self, 'release', release)
+        object.__setattr__(self, 'pre', pre)
+        object.__setattr__(self, 'post', post)
+        object.__setattr__(self, 'dev', dev)
+        object.__setattr__(self, 'local', local)
+        key = _comparison_key(epoch, release, pre, post, dev, local)
+        object.__setattr__(self, 'key', key)
+        object.__setattr__(self, '_hash', hash(key))
+
+    @property
+    def major(self) -> int:
+        return self.release[0]
+
+    @property
+    def minor(self) -> int:
+        return self.release[1] if len(self.release) > 1 else 0
+
+    @property
+    def micro(self) -> int:
+        return self.release[2] if len(self.release) > 2 else 0
+
+    @property
+    def is_prerelease(self) -> bool:
+        return self.pre is not None or self.dev is not None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable.")
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return self.key == other.key if isinstance(other, ParsedVersion) else NotImplemented
+
+    def __ne__(self, other: object) -> bool:
+        return self.key != other.key if isinstance(other, ParsedVersion) else NotImplemented
+
+    def __lt__(self, other: 'ParsedVersion') -> bool:
+        return self.key < other.key if isinstance(other, ParsedVersion) else NotImplemented
+
+    def __le__(self, other: 'ParsedVersion') -> bool:
+        return self.key <= other.key if isinstance(other, ParsedVersion) else NotImplemented
+
+    def __gt__(self, other: 'ParsedVersion') -> bool:
+        return self.key > other.key if isinstance(other, ParsedVersion) else NotImplemented
+
+    def __ge__(self, other: 'ParsedVersion') -> bool:
+        return self.key >= other.key if isinstance(other, ParsedVersion) else NotImplemented
+
+    def __str__(self) -> str:
+        version = ".".join(map(str, self.release))
+        if self.epoch:
+            version = f"{self.epoch}!{version}"
+        if self.pre is not None:
+            version += f"{self.pre[0]}{self.pre[1]}"
+        if self.post is not None:
+            version += f".post{self.post}"
+        if self.dev is not None:
+            version += f".dev{self.dev}"
+        if self.local is not None:
+            version += "+" + ".".join(map(str, self.local))
+        return version
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+    def __reduce__(self) -> tuple:
+        return parse_version, (str(self),)
+
+
+def parse_version(version: Version) -> ParsedVersion:
+    """
+    Parses a PEP 440 version, e.g. 1.2.3, v2.0.0-rc.1, 1.0.post2.dev3 or 1!2.0+local.7.
+    Raises InvalidVersionException, when the version is not valid.
+    """
+    match = _get_version_pattern().fullmatch(version.strip())
+    if match is None:
+        raise InvalidVersionException(f"{version} is not a valid version.")
+
+    pre_label = match.group("pre_label")
+    post_number = match.group("post_number") or match.group("implicit_post_number")
+    dev_label = match.group("dev_label")
+    local = match.group("local")
+    return ParsedVersion(
+        release=tuple(map(int, match.group("release").split("."))),
+        epoch=int(match.group("epoch") or 0),
+        pre=(PRE_RELEASE_LABELS[pre_label.lower()], int(match.group("pre_number") or 0)) if pre_label else None,
+        post=int(post_number or 0) if match.group("post_label") or post_number else None,
+        dev=int(match.group("dev_number") or 0) if dev_label else None,
+        local=tuple(int(part) if part.isdigit() else part.lower() for part in _split_local(local)) if local else None)
+
+
+def _split_local(local: str) -> list[str]:
+    return local.replace("-", ".").replace("_", ".").split(".")
+
+
+def _comparison_key(epoch: int,
+                    release: tuple[int, ...],
+                    pre: tuple[str, int] | None,
+                    post: int | None,
+                    dev: int | None,
+                    local: tuple[str | int, ...] | None) -> tuple:
+    """
+    Orders versions as PEP 440 does: trailing zeros of the release are ignored, development releases come
+    before pre-releases, which come before the release, which comes before post-releases and local versions.
+    """
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+    if pre is not None:
+        pre_key = (__PRE_RELEASE_RANKS[pre[0]], pre[1])
+    elif post is None and dev is not None:
+        pre_key = (-1, 0)
+    else:
+        pre_key = (3, 0)
+    post_key = -1 if post is None else post
+    dev_key = math.inf if dev is None else dev
+    local_key = () if local is None else tuple((1, part, "") if isinstance(part, int) else (0, 0, part) for part in local)
+    return epoch, release, pre_key, post_key, dev_key, local_key
+
+
+def _get_version_pattern():
+    """
+    Compiles the version pattern on first use, so importing sversion does not import re.
+    """
+    global __VERSION_PATTERN
+    if __VERSION_PATTERN is None:
+        import re
+
+        pre_labels = "|".join(sorted(PRE_RELEASE_LABELS, key=len, reverse=True))
+        __VERSION_PATTERN = re.compile(rf"""
+            v?
+            (?:(?P<epoch>[0-9]+)!)?
+            (?P<release>[0-9]+(?:\.[0-9]+)*)
+            (?:[-_.]?(?P<pre_label>{pre_labels})[-_.]?(?P<pre_number>[0-9]+)?)?
+            (?:-(?P<implicit_post_number>[0-9]+)|[-_.]?(?P<post_label>{"|".join(POST_RELEASE_LABELS)})[-_.]?(?P<post_number>[0-9]+)?)?
+            (?:[-_.]?(?P<dev_label>{"|".join(DEVELOPMENT_RELEASE_LABELS)})[-_.]?(?P<dev_number>[0-9]+)?)?
+            (?:\+(?P<local>[a-z0-9]+(?:[-_.][a-z0-9]+)*))?
+        """, re.VERBOSE | re.IGNORECASE)
+    return __VERSION_PATTERN
@@ -1,29 +1,80 @@
-import os
-import toml
-
 from .contracts import Version, VersionRetriever
 from .error_handling import VersionNotFoundException
+from .version_cache import version_cache
 
-def __get_version(start_search_path: str, project_file_name: str = "pyproject.toml") -> Version:
-    error_message = f"{project_file_name} was not found in the module folder or one of the parent folders."
+VERSION_TABLES = ("tool.poetry", "project")
+
+__TABLE_NAME_CHARACTERS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-. \t")
+__VERSION_DEFINING_KEYS = frozenset(("tool", "poetry", "project", "version"))
+
+def __is_end_of_line(text: str) -> bool:
+    text = text.strip()
+    return not text or text.startswith("#")
+
+def __scan_table_name(line: str) -> str | None:
+    end = line.find("]")
+    name = line[1:end]
+    if end < 0 or not __is_end_of_line(line[end + 1:]) or not __TABLE_NAME_CHARACTERS.issuperset(name):
+        return None
+    return "".join(name.split())
+
+def __scan_string(value: str) -> str | None:
+    value = value.strip()
+    quote = value[:1]
+    end = value.find(quote, 1) if quote in ('"', "'") else -1
+    if end < 0 or not __is_end_of_line(value[end + 1:]) or (quote == '"' and "\\" in value[1:end]):
+        return None
+    return value[1:end]
 
-    if os.path.isfile(start_search_path):
-        start_search_path = os.path.dirname(start_search_path)
+def __scan_version(project_data: str) -> Version | None:
+    """
+    Finds the version in the [tool.poetry] or [project] table line by line, without parsing the whole file
+    and without importing tomllib. Returns None, when the version is missing or the file defines it in a way,
+    which requires a full parse, e.g. in a dotted key, an inline table or next to a multi-line string.
+    """
+    if '"""' in project_data or "'''" in project_data:
+        return None
 
-    current_path = start_search_path
+    versions = {}
+    table = None
+    for line in project_data.splitlines():
+        line = line.strip()
+        if line.startswith("["):
+            table = __scan_table_name(line)
+            continue
+        key, separator, value = line.partition("=")
+        if not separator or line.startswith("#"):
+            continue
+        key = "".join(key.split())
+        if table in VERSION_TABLES and key == "version" and (version := __scan_string(value)) is not None:
+            versions[table] = version
+        elif table in (None, "tool", *VERSION_TABLES) and key.split(".")[0].strip("\"'") in __VERSION_DEFINING_KEYS:
+            return None
 
-    while current_path != os.path.dirname(current_path):
-        project_file_path = os.path.join(current_path, project_file_name)
-        try:
-            if os.path.exists(project_file_path):
-                with open(project_file_path, 'r') as project_file:
-                    project_data = toml.load(project_file)
-                    if "tool" in project_data and "poetry" in project_data["tool"]:
-                        return project_data["tool"]["poetry"]["version"]
+    return next((versions[table] for table in VERSION_TABLES if table in versions), None)
+
+def __parse_version(project_data: str) -> Version | None:
+    import tomllib
+
+    parsed_data = tomllib.loads(project_data)
+    poetry_version = parsed_data.get("tool", {}).get("poetry", {}).get("version")
+    return poetry_version if poetry_version is not None else parsed_data.get("project", {}).get("version")
+
+def read_version(project_file_path: str) -> Version | None:
+    with open(project_file_path, 'r') as project_file:
+        project_data = project_file.read()
+    version = __scan_version(project_data)
+    return version if version is not None else __parse_version(project_data)
+
+def __get_version(start_search_path: str, project_file_name: str = "pyproject.toml") -> Version:
+    error_message = f"{project_file_name} was not found in the module folder or one of the parent folders."
 
-            current_path = os.path.dirname(current_path)
-        except PermissionError:
-            raise VersionNotFoundException(error_message)
+    try:
+        version = version_cache.find_version(start_search_path, project_file_name, read_version)
+    except PermissionError:
+        raise VersionNotFoundException(error_message)
 
-    raise VersionNotFoundException(error_message)
-get_version: VersionRetriever = __get_version
\ No newline at end of file
+    if version is None:
+        raise VersionNotFoundException(error_message)
+    return version
+get_version: VersionRetriever = __get_version
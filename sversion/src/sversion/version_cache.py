@@ -0,0 +1,98 @@
+import os
+from collections.abc import Callable, Sequence
+
+from .contracts import Version
+
+type StatKey = tuple[int, ...]
+type VersionReader = Callable[[str], Version | None]
+
+
+class CacheEntry:
+    __slots__ = ('directory_key', 'file_path', 'file_key', 'version')
+
+    def __init__(self,
+                 directory_key: StatKey | None,
+                 file_path: str | None,
+                 file_key: StatKey | None,
+                 version: Version | None):
+        self.directory_key = directory_key
+        self.file_path = file_path
+        self.file_key = file_key
+        self.version = version
+
+
+class VersionCache:
+    """
+    Process-wide cache of version files found in directories and of the versions read from them.
+    Entries are keyed by directory and file name and validated by os.stat of the directory and of the file,
+    so adding, removing or changing a file invalidates them.
+    Directories without the file, and missing directories, are cached as well.
+    """
+    __slots__ = ('_entries',)
+
+    def __init__(self):
+        self._entries: dict[tuple[str, str, VersionReader], CacheEntry] = {}
+
+    def find_version(self, start_search_path: str, file_name: str, read_version: VersionReader) -> Version | None:
+        """
+        Walks from the start path up to the root and returns the version read by read_version from the first file
+        with the file name, which contains a version, or None if there is no such file.
+        """
+        return self.find_first_version(start_search_path, ((file_name, read_version),))
+
+    def find_first_version(self,
+                           start_search_path: str,
+                           sources: Sequence[tuple[str, VersionReader]]) -> Version | None:
+        """
+        Walks from the start path up to the root once and returns the first version found in any of the sources,
+        which are pairs of file name and reader. In each directory the sources are checked in the given order.
+        """
+        if os.path.isfile(start_search_path):
+            start_search_path = os.path.dirname(start_search_path)
+
+        current_path = start_search_path
+        while current_path != os.path.dirname(current_path):
+            directory_key = _stat_key(current_path)
+            for file_name, read_version in sources:
+                version = self.__get_directory_version(current_path, directory_key, file_name, read_version)
+                if version is not None:
+                    return version
+            current_path = os.path.dirname(current_path)
+
+        return None
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __get_directory_version(self,
+                                directory: str,
+                                directory_key: StatKey | None,
+                                file_name: str,
+                                read_version: VersionReader) -> Version | None:
+        key = (directory, file_name, read_version)
+        entry = self._entries.get(key)
+        if entry is not None and entry.directory_key == directory_key:
+            if entry.file_path is None or _stat_key(entry.file_path) == entry.file_key:
+                return entry.version
+
+        file_path = os.path.join(directory, file_name)
+        if directory_key is None or not os.path.exists(file_path):
+            self._entries[key] = CacheEntry(directory_key, None, None, None)
+            return None
+
+        file_key = _stat_key(file_path)
+        version = read_version(file_path)
+        if file_key is not None:
+            self._entries[key] = CacheEntry(directory_key, file_path, file_key, version)
+        return version
+
+
+def _stat_key(path: str) -> StatKey | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+version_cache = VersionCache()
@@ -1,8 +1,14 @@
 __author__ = "kostiantyn.chomakov@gmail.com"
 
-from . import test_version_file_based
+from . import test_version_file_based, test_version_cache, test_batch, test_composite, \
+    test_parsed_version, test_async_based
 
 __all__ = [
     'test_version_file_based',
-    'test_pyproject_toml_based'
+    'test_pyproject_toml_based',
+    'test_version_cache',
+    'test_batch',
+    'test_composite',
+    'test_parsed_version',
+    'test_async_based'
 ]
\ No newline at end of file
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from sversion import version_file_based, composite
+from sversion.async_based import get_version_async, probe_version_async
+from sversion.error_handling import VersionNotFoundException
+from sversion.version_cache import version_cache
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    version_cache.clear()
+    yield
+    version_cache.clear()
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "VERSION.txt").write_text("1.0.0")
+    nested = tmp_path / "package" / "module"
+    nested.mkdir(parents=True)
+    (tmp_path / "package" / "pyproject.toml").write_text('[project]\nversion = "2.0.0"\n')
+    return tmp_path
+
+@pytest.mark.asyncio
+async def test_get_version_async_runs_retriever(project):
+    assert await get_version_async(str(project / "package" / "module")) == "2.0.0"
+    assert await get_version_async(str(project / "package" / "module"), version_file_based.get_version) == "1.0.0"
+
+@pytest.mark.asyncio
+async def test_get_version_async_raises_retriever_errors(tmp_path):
+    with pytest.raises(VersionNotFoundException):
+        await get_version_async(str(tmp_path), lambda path: version_file_based.get_version(path, "MISSING_VERSION.txt"))
+
+@pytest.mark.asyncio
+async def test_probe_version_async_finds_nearest_version(project):
+    module = project / "package" / "module"
+    (module / "__init__.py").write_text("")
+
+    assert await probe_version_async(str(module / "__init__.py")) == "2.0.0"
+    (project / "package" / "pyproject.toml").write_text('[project]\ndynamic = ["version"]\n')
+    assert await probe_version_async(str(module)) == "1.0.0"
+    (project / "package" / "VERSION.txt").write_text("3.0.0")
+    assert await probe_version_async(str(module)) == "3.0.0"
+
+@pytest.mark.asyncio
+async def test_probe_version_async_falls_back_to_installed_distribution(tmp_path):
+    version = await probe_version_async(str(tmp_path), "MISSING_VERSION.txt", "MISSING_PROJECT.toml", "pytest")
+
+    assert version == pytest.__version__
+    with pytest.raises(VersionNotFoundException) as probe_error:
+        await probe_version_async(str(tmp_path), "MISSING_VERSION.txt", "MISSING_PROJECT.toml", "missing-distribution")
+    with pytest.raises(VersionNotFoundException) as composite_error:
+        composite.get_version(str(tmp_path), "MISSING_VERSION.txt", "MISSING_PROJECT.toml", "missing-distribution")
+    assert str(probe_error.value) == str(composite_error.value)
+
+@pytest.mark.asyncio
+async def test_probe_version_async_probes_folders_at_once(project, monkeypatch):
+    start_path = project.joinpath(*[f"level{level}" for level in range(10)])
+    start_path.mkdir(parents=True)
+    exists = os.path.exists
+
+    def slow_exists(path):
+        time.sleep(0.05)
+        return exists(path)
+
+    monkeypatch.setattr(os.path, "exists", slow_exists)
+    with ThreadPoolExecutor(max_workers=64) as executor:
+        started = time.perf_counter()
+        assert await probe_version_async(str(start_path), executor=executor) == "1.0.0"
+        elapsed = time.perf_counter() - started
+
+    assert elapsed < 22 * 0.05 / 2
+
+def test_importing_sversion_does_not_import_async_based():
+    code = "import sys, sversion; print('sversion.async_based' in sys.modules, 'asyncio' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+
+    assert output.split() == ["False", "False"]
@@ -0,0 +1,55 @@
+import os
+import pytest
+
+from sversion.batch import get_versions
+
+@pytest.fixture
+def monorepo(tmp_path):
+    (tmp_path / "pyproject.toml").write_text('[tool.poetry]\nversion = "1.0.0"\n')
+    for package, version_file in (("first", None), ("second", "VERSION.txt"), ("third", "pyproject.toml")):
+        source = tmp_path / "packages" / package / "src" / package
+        source.mkdir(parents=True)
+        (source / "__init__.py").write_text("")
+        if version_file == "VERSION.txt":
+            (tmp_path / "packages" / package / "VERSION.txt").write_text("2.0.0\n")
+        elif version_file == "pyproject.toml":
+            (tmp_path / "packages" / package / "pyproject.toml").write_text('[project]\nversion = "3.0.0"\n')
+    return tmp_path
+
+@pytest.fixture
+def listed_directories(monkeypatch):
+    listed = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        listed.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    return listed
+
+def test_get_versions_resolves_each_path(monorepo):
+    paths = [str(monorepo / "packages" / package / "src" / package) for package in ("first", "second", "third")]
+    paths.append(os.path.join(paths[1], "__init__.py"))
+
+    assert get_versions(paths) == {paths[0]: "1.0.0", paths[1]: "2.0.0", paths[2]: "3.0.0", paths[3]: "2.0.0"}
+
+def test_get_versions_lists_each_directory_once(monorepo, listed_directories):
+    packages = monorepo / "packages"
+    paths = [str(packages / "first" / "src" / "first"), str(packages / "first" / "src"), str(packages / "second")]
+
+    assert set(get_versions(paths).values()) == {"1.0.0", "2.0.0"}
+    assert len(listed_directories) == len(set(listed_directories))
+    assert str(monorepo) in listed_directories
+
+def test_version_file_takes_precedence(monorepo):
+    (monorepo / "VERSION.txt").write_text("4.0.0")
+
+    assert get_versions([str(monorepo)]) == {str(monorepo): "4.0.0"}
+    assert get_versions([str(monorepo)], version_file_name=None) == {str(monorepo): "1.0.0"}
+
+def test_get_versions_without_version(tmp_path):
+    missing_directory = str(tmp_path / "missing")
+
+    assert get_versions([missing_directory], project_file_name="MISSING_PROJECT.toml",
+                        version_file_name="MISSING_VERSION.txt") == {missing_directory: None}
@@ -0,0 +1,49 @@
+import pytest
+
+from sversion import composite
+from sversion.composite import get_version, read_installed_version
+from sversion.error_handling import VersionNotFoundException
+from sversion.version_cache import version_cache
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    version_cache.clear()
+    yield
+    version_cache.clear()
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "VERSION.txt").write_text("1.0.0")
+    nested = tmp_path / "package" / "module"
+    nested.mkdir(parents=True)
+    (tmp_path / "package" / "pyproject.toml").write_text('[project]\nversion = "2.0.0"\n')
+    return tmp_path
+
+def test_nearest_folder_wins(project):
+    assert get_version(str(project / "package" / "module")) == "2.0.0"
+    assert get_version(str(project)) == "1.0.0"
+
+def test_version_file_takes_precedence_in_the_same_folder(project):
+    (project / "package" / "VERSION.txt").write_text("3.0.0\n")
+
+    assert get_version(str(project / "package" / "module")) == "3.0.0"
+
+def test_project_file_without_version_is_skipped(project):
+    (project / "package" / "pyproject.toml").write_text('[project]\ndynamic = ["version"]\n')
+
+    assert get_version(str(project / "package" / "module")) == "1.0.0"
+
+def test_falls_back_to_installed_distribution(tmp_path):
+    version = get_version(str(tmp_path), version_file_name="MISSING_VERSION.txt",
+                          project_file_name="MISSING_PROJECT.toml", distribution_name="pytest")
+
+    assert version == pytest.__version__
+
+def test_installed_distribution_is_found_by_module_path():
+    assert composite._get_distribution_names(pytest.__file__) == ["pytest"]
+    assert read_installed_version(pytest.__file__) == pytest.__version__
+
+def test_not_found(tmp_path):
+    with pytest.raises(VersionNotFoundException):
+        get_version(str(tmp_path), version_file_name="MISSING_VERSION.txt",
+                    project_file_name="MISSING_PROJECT.toml", distribution_name="missing-distribution")
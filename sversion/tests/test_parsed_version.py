@@ -0,0 +1,41 @@
+import pickle
+import pytest
+
+from sversion.error_handling import InvalidVersionException
+from sversion.parsed_version import ParsedVersion, parse_version
+
+@pytest.mark.parametrize("version, normalized", [
+    ("1.2.3", "1.2.3"),
+    ("v2.0.0-RC.1", "2.0.0rc1"),
+    ("1.0alpha", "1.0a0"),
+    ("1.0-1", "1.0.post1"),
+    ("1.0.post2.dev3", "1.0.post2.dev3"),
+    ("1!2.0+Local-7", "1!2.0+local.7"),
+])
+def test_parse_version_normalizes(version, normalized):
+    assert str(parse_version(version)) == normalized
+
+def test_versions_are_ordered_as_pep_440():
+    ordered = ["1.0.dev1", "1.0a1.dev1", "1.0a1", "1.0b2", "1.0rc1", "1.0", "1.0+local", "1.0.post1.dev1",
+               "1.0.post1", "1.1", "1!0.1"]
+
+    assert [str(version) for version in sorted(map(parse_version, reversed(ordered)))] == ordered
+    assert max(map(parse_version, ordered)) == parse_version("1!0.1")
+
+def test_equal_versions_are_interchangeable():
+    assert parse_version("1.0") == parse_version("1.0.0")
+    assert len({parse_version("1.0"), parse_version("1.0.0"), parse_version("1.0.1")}) == 2
+    assert parse_version("1.0") != "1.0"
+
+def test_parsed_version_is_immutable_and_picklable():
+    version = parse_version("1.2.3rc1")
+
+    assert (version.major, version.minor, version.micro, version.is_prerelease) == (1, 2, 3, True)
+    with pytest.raises(AttributeError):
+        version.release = (2,)
+    assert pickle.loads(pickle.dumps(version)) == version
+    assert isinstance(version, ParsedVersion)
+
+def test_invalid_version():
+    with pytest.raises(InvalidVersionException):
+        parse_version("not a version")
@@ -3,6 +3,13 @@ import pytest
 from unittest.mock import patch, mock_open
 
 from sversion.pyproject_toml_based import get_version, VersionNotFoundException
+from sversion.version_cache import version_cache
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    version_cache.clear()
+    yield
+    version_cache.clear()
 
 @pytest.fixture
 def mock_os_path_exists():
@@ -53,4 +60,46 @@ def test_get_version_with_custom_project_file_found(mock_os_path_exists, mock_op
 def test_get_version_with_custom_project_file_not_found(mock_os_path_exists):
     mock_os_path_exists.return_value = False
     with pytest.raises(VersionNotFoundException):
-        get_version(os.path.abspath(os.path.dirname(__file__)), project_file_name="custom_project.toml")
\ No newline at end of file
+        get_version(os.path.abspath(os.path.dirname(__file__)), project_file_name="custom_project.toml")
+
+def test_get_version_found_in_project_table(mock_os_path_exists):
+    mock_os_path_exists.side_effect = lambda path: path.endswith('pyproject.toml')
+    content = """
+    [project]
+    name = "package"
+    version = '3.1.0'  # PEP 621
+
+    [tool.poetry.dependencies]
+    python = "^3.14"
+    """
+    with patch('builtins.open', mock_open(read_data=content)):
+        assert get_version(os.path.abspath(os.path.dirname(__file__))) == "3.1.0"
+
+def test_get_version_prefers_poetry_version(mock_os_path_exists):
+    mock_os_path_exists.side_effect = lambda path: path.endswith('pyproject.toml')
+    content = """
+    [project]
+    version = "3.1.0"
+
+    [tool.poetry]
+    version = "1.2.3"
+    """
+    with patch('builtins.open', mock_open(read_data=content)):
+        assert get_version(os.path.abspath(os.path.dirname(__file__))) == "1.2.3"
+
+@pytest.mark.parametrize("content", [
+    'tool.poetry.version = "4.0.0"',
+    '[tool]\npoetry = { version = "4.0.0" }',
+    '[project]\ndescription = """\n[tool.poetry]\nversion = "0.0.0"\n"""\nversion = "4.0.0"',
+    '[project]\nversion = "4.0.\\u0030"',
+])
+def test_get_version_falls_back_to_full_parse(mock_os_path_exists, content):
+    mock_os_path_exists.side_effect = lambda path: path.endswith('pyproject.toml')
+    with patch('builtins.open', mock_open(read_data=content)):
+        assert get_version(os.path.abspath(os.path.dirname(__file__))) == "4.0.0"
+
+def test_get_version_skips_project_file_without_version(mock_os_path_exists):
+    mock_os_path_exists.side_effect = lambda path: path.endswith('pyproject.toml')
+    with patch('builtins.open', mock_open(read_data='[project]\ndynamic = ["version"]\n')):
+        with pytest.raises(VersionNotFoundException):
+            get_version(os.path.abspath(os.path.dirname(__file__)))
@@ -0,0 +1,68 @@
+import os
+import pytest
+
+from sversion.version_cache import VersionCache
+
+@pytest.fixture
+def reads():
+    return []
+
+@pytest.fixture
+def read_version(reads):
+    def read(path):
+        reads.append(path)
+        with open(path) as version_file:
+            return version_file.read().strip() or None
+    return read
+
+def write(path, content, mtime_ns=None):
+    path.write_text(content)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+def test_version_is_read_once(tmp_path, reads, read_version):
+    write(tmp_path / "VERSION.txt", "1.0.0")
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    cache = VersionCache()
+
+    assert cache.find_version(str(nested), "VERSION.txt", read_version) == "1.0.0"
+    assert cache.find_version(str(nested / "module.py"), "VERSION.txt", read_version) == "1.0.0"
+    assert cache.find_version(str(tmp_path), "VERSION.txt", read_version) == "1.0.0"
+    assert reads == [str(tmp_path / "VERSION.txt")]
+
+def test_changed_file_is_read_again(tmp_path, reads, read_version):
+    version_file = tmp_path / "VERSION.txt"
+    write(version_file, "1.0.0", 1_000_000_000)
+    cache = VersionCache()
+
+    assert cache.find_version(str(tmp_path), "VERSION.txt", read_version) == "1.0.0"
+    write(version_file, "1.0.1", 2_000_000_000)
+    assert cache.find_version(str(tmp_path), "VERSION.txt", read_version) == "1.0.1"
+    assert len(reads) == 2
+
+def test_directories_without_file_are_revalidated(tmp_path, reads, read_version):
+    write(tmp_path / "VERSION.txt", "1.0.0")
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    cache = VersionCache()
+
+    assert cache.find_version(str(nested), "VERSION.txt", read_version) == "1.0.0"
+    write(nested / "VERSION.txt", "2.0.0")
+    assert cache.find_version(str(nested), "VERSION.txt", read_version) == "2.0.0"
+    os.remove(nested / "VERSION.txt")
+    assert cache.find_version(str(nested), "VERSION.txt", read_version) == "1.0.0"
+
+def test_files_without_version_and_missing_directories(tmp_path, reads, read_version):
+    write(tmp_path / "VERSION.txt", "1.0.0")
+    (tmp_path / "nested").mkdir()
+    write(tmp_path / "nested" / "VERSION.txt", "")
+    cache = VersionCache()
+
+    missing = tmp_path / "nested" / "missing" / "deeper"
+    assert cache.find_version(str(missing), "VERSION.txt", read_version) == "1.0.0"
+    assert cache.find_version(str(missing), "VERSION.txt", read_version) == "1.0.0"
+    assert len(reads) == 2
+
+def test_not_found(tmp_path, read_version):
+    assert VersionCache().find_version(str(tmp_path), "MISSING_VERSION_FILE.txt", read_version) is None
@@ -3,6 +3,13 @@ import pytest
 from unittest.mock import patch, mock_open
 
 from sversion.version_file_based import get_version, VersionNotFoundException
+from sversion.version_cache import version_cache
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    version_cache.clear()
+    yield
+    version_cache.clear()
 
 @pytest.fixture
 def mock_os_path_exists():